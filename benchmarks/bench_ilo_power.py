@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for ilo_power against the recorded-response Redfish simulator
+
+Runs the --status, --monitor and power operation code paths of ilo_power
+against 1k-10k simulated iLO hosts and reports throughput, per-host
+latency percentiles, requests per host and memory use. Results can be
+saved as JSON and compared against a previous run to catch regressions.
+
+Usage examples:
+  python benchmarks/bench_ilo_power.py --hosts 1000
+  python benchmarks/bench_ilo_power.py --hosts 10000 --scenario status --latency-ms 5 --workers 200
+  python benchmarks/bench_ilo_power.py --hosts 2000 --failure-rate 0.02 --unreachable-rate 0.01
+  python benchmarks/bench_ilo_power.py --hosts 1000 --json-out run.json --compare baseline.json
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import redfish_sim
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCENARIOS = ("status", "status-details", "monitor", "power-on", "power-off")
+
+def load_ilo_power(path=None):
+    """Import the ilo_power package, or a single-file ilo_power script given by path
+    (e.g. hpe/ilo_power_1.1.1.py, whose file name is not importable directly)"""
+    if not path:
+        sys.path.insert(0, str(REPO_ROOT))
+        import ilo_power
+        return ilo_power
+    spec = importlib.util.spec_from_file_location("ilo_power_bench", Path(path))
+    module = importlib.util.module_from_spec(spec)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        spec.loader.exec_module(module)
+    return module
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def timed(func):
+    """Wrap a per-host function so it returns (result, seconds)"""
+    def wrapper(system):
+        start = time.perf_counter()
+        try:
+            result = func(system)
+        except Exception as e:  # the CLI wraps these too; count them as failures
+            result = e
+        return result, time.perf_counter() - start
+    return wrapper
+
+def run_scenario(ilo, fleet, scenario, workers, output_dir):
+    """Run one scenario over the whole fleet, return (results, latencies)"""
+    systems = fleet.systems()
+    if scenario in ("status", "status-details"):
+        detailed = scenario == "status-details"
+        task = lambda s: ilo.get_system_status(s, detailed=detailed, print_output=False)
+    elif scenario == "monitor":
+        # Same per-host work as one monitor_power iteration
+        def task(system):
+            with ilo.RedfishSession(system) as client:
+                identifier, _ = ilo.get_system_identifier(client)
+                return (ilo.get_power_watts(client, system["ip"], identifier),
+                        ilo.get_cpu_utilization(client, system["ip"], identifier))
+    elif scenario == "power-on":
+        task = lambda s: ilo.power_on_system(s)
+    elif scenario == "power-off":
+        task = lambda s: ilo.power_off_system(s, force=True)
+    else:
+        raise ValueError(f"Unknown scenario {scenario}")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(timed(task), systems))
+
+    if scenario == "status":
+        # Include the post-processing the CLI does for --status --sort
+        results = [r for r, _ in outcomes if not isinstance(r, (bool, Exception))]
+        if hasattr(ilo, "StatusTable"):
+            results.sort(key=lambda x: ilo.sort_ip_address_key(x.ip))
+            results = ilo.StatusTable.from_records(results)
+        else:  # single-file scripts return status dicts
+            results.sort(key=lambda x: ilo.sort_ip_address_key(x.get("ip", "")))
+        ilo.save_status_to_csv(os.path.join(output_dir, "status.csv"), results)
+    return [r for r, _ in outcomes], [t for _, t in outcomes]
+
+def is_success(result):
+    if isinstance(result, Exception) or result is None or result is False:
+        return False
+    if isinstance(result, dict):
+        return not result.get("error")
+    if hasattr(result, "error"):  # HostStatus
+        return not result.error
+    if isinstance(result, tuple):
+        return any(v is not None for v in result)
+    return True
+
+def benchmark(args, scenario):
+    ilo = load_ilo_power(args.ilo_power)
+    mix = dict((k, float(v)) for k, v in (item.split("=") for item in args.mix.split(",")))
+    fleet = redfish_sim.SimulatedFleet.generate(
+        args.hosts, mix=mix, seed=args.seed,
+        unreachable_rate=args.unreachable_rate, bad_credentials_rate=args.bad_credentials_rate,
+        power_state="Off" if scenario == "power-on" else "On",
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, failure_rate=args.failure_rate,
+        max_sessions=args.max_sessions, connect_timeout_s=args.connect_timeout,
+    )
+    redfish_sim.install(ilo, fleet)
+    policy = None
+    if hasattr(ilo, "RetryPolicy"):  # older single-file scripts use fixed-delay retries
+        budget = args.retry_budget if args.retry_budget is not None else max(10, args.hosts // 10)
+        policy = ilo.set_retry_policy(ilo.RetryPolicy(max_retries=args.retries, base_delay=args.retry_delay,
+                                                      budget=budget))
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    with tempfile.TemporaryDirectory() as output_dir:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            results, latencies = run_scenario(ilo, fleet, scenario, args.workers, output_dir)
+            elapsed = time.perf_counter() - start
+    peak_traced = tracemalloc.get_traced_memory()[1] if args.tracemalloc else None
+    if args.tracemalloc:
+        tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    latencies.sort()
+    requests = fleet.request_counts()
+    return {
+        "scenario": scenario,
+        "hosts": args.hosts,
+        "workers": args.workers,
+        "elapsed_s": round(elapsed, 3),
+        "hosts_per_s": round(args.hosts / elapsed, 1),
+        "success": sum(1 for r in results if is_success(r)),
+        "latency_p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "latency_p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "latency_max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+        "requests_total": sum(requests),
+        "requests_per_host": round(sum(requests) / max(len(requests), 1), 2),
+        "logins": fleet.logins,
+        "refused_logins": fleet.refused_logins,
+        "injected_failures": fleet.injected_failures,
+        "retries": policy.retries_used if policy else None,
+        "retries_denied": policy.budget_denied if policy else None,
+        "max_rss_growth_mb": round((rss_after - rss_before) / 1024.0, 1),  # ru_maxrss is KiB on Linux
+        "peak_traced_mb": round(peak_traced / 1e6, 1) if peak_traced is not None else None,
+    }
+
+def print_report(rows, baseline=None):
+    columns = [("scenario", 15), ("hosts", 6), ("elapsed_s", 9), ("hosts_per_s", 11), ("success", 7),
+               ("latency_p50_ms", 14), ("latency_p99_ms", 14), ("requests_per_host", 17),
+               ("max_rss_growth_mb", 17)]
+    print(" ".join(f"{name:>{width}}" for name, width in columns))
+    for row in rows:
+        print(" ".join(f"{row[name]!s:>{width}}" for name, width in columns))
+        previous = (baseline or {}).get(row["scenario"])
+        if previous:
+            deltas = []
+            for key in ("hosts_per_s", "latency_p99_ms", "requests_per_host"):
+                if previous.get(key):
+                    deltas.append(f"{key} {100.0 * (row[key] - previous[key]) / previous[key]:+.1f}%")
+            print(f"{'':>15} vs baseline: {', '.join(deltas)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ilo_power against simulated iLO hosts")
+    parser.add_argument("--hosts", type=int, default=1000, help="Number of simulated hosts")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS,
+                        help="Scenario to run (repeatable, default: status, monitor, power-on)")
+    parser.add_argument("--workers", type=int, default=50, help="Parallel workers (matches ilo_power --workers)")
+    parser.add_argument("--mix", default="ilo4=0.2,ilo5=0.6,ilo6=0.2", help="iLO generation mix")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Mean simulated request latency")
+    parser.add_argument("--jitter-ms", type=float, default=1.0, help="Uniform latency jitter")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Per-request failure probability")
+    parser.add_argument("--unreachable-rate", type=float, default=0.0, help="Fraction of hosts that never answer")
+    parser.add_argument("--bad-credentials-rate", type=float, default=0.0, help="Fraction of hosts rejecting login")
+    parser.add_argument("--connect-timeout", type=float, default=0.5, help="Seconds an unreachable host takes to fail")
+    parser.add_argument("--max-sessions", type=int, default=10, help="Concurrent sessions allowed per iLO")
+    parser.add_argument("--retries", type=int, default=1, help="Retries per login/GET (ilo_power --retries)")
+    parser.add_argument("--retry-delay", type=float, default=0.5, help="Backoff base in seconds (ilo_power --retry-delay)")
+    parser.add_argument("--retry-budget", type=int, help="Retry budget per scenario (default: 10%% of hosts, at least 10)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--tracemalloc", action="store_true", help="Also report peak Python heap (slower)")
+    parser.add_argument("--ilo-power", help="Path to a single-file ilo_power script to benchmark instead of the package")
+    parser.add_argument("--json-out", help="Write results as JSON")
+    parser.add_argument("--compare", help="Baseline JSON from a previous run to compare against")
+    args = parser.parse_args()
+
+    scenarios = args.scenario or ["status", "monitor", "power-on"]
+    rows = [benchmark(args, scenario) for scenario in scenarios]
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = {row["scenario"]: row for row in json.load(f)}
+    print_report(rows, baseline)
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"Results saved to {args.json_out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    raise SystemExit(main())
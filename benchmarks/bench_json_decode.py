@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+JSON decoding benchmark for Redfish (iLO) and Cohesity API payloads
+
+Compares the original decoding path (bytes -> text -> json.loads) against
+decoding straight from bytes with the stdlib, orjson and ujson, using the
+recorded payloads in benchmarks/payloads/.
+
+Usage examples:
+  python benchmarks/bench_json_decode.py
+  python benchmarks/bench_json_decode.py --seconds 2 --payload ilo5
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+PAYLOAD_DIR = Path(__file__).resolve().parent / "payloads"
+
+def load_payloads(names=None):
+    """Load recorded payloads as raw bytes, keyed by '<source>:<path>'"""
+    payloads = {}
+    for bundle_path in sorted(PAYLOAD_DIR.glob("*.json")):
+        if names and bundle_path.stem not in names:
+            continue
+        with open(bundle_path, "r") as f:
+            bundle = json.load(f)
+        for path, document in bundle.items():
+            # Compact encoding matches what iLO and Cohesity put on the wire
+            payloads[f"{bundle_path.stem}:{path}"] = json.dumps(document, separators=(",", ":")).encode("utf-8")
+    return payloads
+
+def available_decoders():
+    """Return the decoders to benchmark as {name: callable(bytes)}"""
+    decoders = {
+        "text+json (old)": lambda body: json.loads(body.decode("utf-8", "ignore")),
+        "json bytes": json.loads,
+    }
+    try:
+        import orjson
+        decoders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+        decoders["ujson"] = ujson.loads
+    except ImportError:
+        pass
+    return decoders
+
+def bench(decode, bodies, seconds):
+    """Decode every body repeatedly for roughly `seconds`, return (docs/s, MB/s)"""
+    total_bytes = sum(len(b) for b in bodies)
+    rounds = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < seconds:
+        for body in bodies:
+            decode(body)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+    return rounds * len(bodies) / elapsed, rounds * total_bytes / elapsed / 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON decoders on recorded iLO/Cohesity payloads")
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time to spend per decoder and payload group")
+    parser.add_argument("--payload", action="append", help="Payload bundle to include (ilo4, ilo5, ilo6, cohesity); repeatable")
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.payload)
+    if not payloads:
+        print(f"No payloads found in {PAYLOAD_DIR}")
+        return 1
+
+    # Group the large documents separately - they dominate parse time in sweeps
+    groups = {
+        "all payloads": list(payloads.values()),
+        "BIOS attributes": [b for k, b in payloads.items() if k.endswith("/Bios")],
+        "processor members": [b for k, b in payloads.items() if "/Processors/" in k],
+    }
+    decoders = available_decoders()
+
+    print(f"{len(payloads)} payloads, {sum(len(b) for b in payloads.values()) / 1024:.1f} KiB total")
+    print(f"{'group':<20} {'decoder':<16} {'docs/s':>12} {'MB/s':>10} {'speedup':>8}")
+    for group_name, bodies in groups.items():
+        if not bodies:
+            continue
+        baseline = None
+        for decoder_name, decode in decoders.items():
+            docs_per_sec, mb_per_sec = bench(decode, bodies, args.seconds)
+            baseline = baseline or docs_per_sec
+            print(f"{group_name:<20} {decoder_name:<16} {docs_per_sec:>12,.0f} {mb_per_sec:>10.1f} {docs_per_sec / baseline:>7.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
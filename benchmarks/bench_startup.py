@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Cold-start check for the ilo_power CLI
+
+Runs `ilo_power --help` in fresh interpreters and reports wall time over the
+bare interpreter start-up, plus the heaviest imports from `python -X importtime`.
+Fails (exit code 1) if the start-up budget is exceeded or if a module that
+should be imported lazily (pandas, numpy by default) is loaded at start-up.
+
+Usage examples:
+  python benchmarks/bench_startup.py
+  python benchmarks/bench_startup.py --runs 10 --max-ms 250
+  python benchmarks/bench_startup.py --forbid pandas,numpy,redfish
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+def wall_time(command, runs):
+    """Run `command` `runs` times, return sorted wall times in milliseconds"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)
+
+def import_times(command):
+    """Run `command` under -X importtime, return {module: cumulative microseconds} for top-level imports"""
+    proc = subprocess.run([command[0], "-X", "importtime"] + command[1:],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        # Nested imports are indented under the module that triggered them
+        if name.startswith("  "):
+            continue
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+def all_imported(command):
+    """Return every module name (top-level package) imported by `command`"""
+    proc = subprocess.run([command[0], "-X", "importtime"] + command[1:],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    return {line.split("|", 2)[2].strip().split(".")[0]
+            for line in proc.stderr.splitlines() if line.startswith("import time:") and line.count("|") == 2}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure ilo_power start-up time and check lazy imports")
+    parser.add_argument("--script", default=str(REPO_ROOT / "ilo_power_1.1.1.py"), help="Script to measure")
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts to time")
+    parser.add_argument("--max-ms", type=float, default=300.0,
+                        help="Budget for start-up time over the bare interpreter (median)")
+    parser.add_argument("--forbid", default="pandas,numpy",
+                        help="Comma separated modules that must not be imported at start-up")
+    parser.add_argument("--top", type=int, default=10, help="Number of heaviest imports to list")
+    args = parser.parse_args()
+
+    command = [sys.executable, args.script, "--help"]
+    bare = wall_time([sys.executable, "-c", "pass"], args.runs)
+    times = wall_time(command, args.runs)
+    overhead = statistics.median(times) - statistics.median(bare)
+
+    print(f"Interpreter start-up:  median {statistics.median(bare):7.1f} ms")
+    print(f"{Path(args.script).name} --help: median {statistics.median(times):7.1f} ms, "
+          f"best {times[0]:.1f} ms, worst {times[-1]:.1f} ms")
+    print(f"Script overhead:       median {overhead:7.1f} ms (budget {args.max_ms:.0f} ms)")
+
+    modules = import_times(command)
+    print(f"\nHeaviest top-level imports (python -X importtime):")
+    for name, micros in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {name:<30} {micros / 1000:8.1f} ms")
+
+    failures = []
+    if overhead > args.max_ms:
+        failures.append(f"start-up overhead {overhead:.1f} ms exceeds budget of {args.max_ms:.0f} ms")
+    imported = all_imported(command)
+    for name in filter(None, (m.strip() for m in args.forbid.split(","))):
+        if name in imported:
+            failures.append(f"{name} is imported at start-up (should be loaded lazily)")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("\nOK")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+TLS handshake and connection reuse benchmark for ilo_power
+
+Starts local HTTPS Redfish servers (one port per simulated iLO, answering
+from the recorded payloads in benchmarks/payloads/) and runs status sweeps
+with ilo_power's real redfish/requests transport, once with a new
+connection per session (as before) and once with the shared pooled adapter
+from ilo_power.transport. The servers count TCP connections, full and
+resumed TLS handshakes; --handshake-delay-ms adds a delay to every full
+handshake to model the slow TLS stack of older iLOs.
+
+Needs the openssl command line tool to create a throwaway certificate.
+
+Usage examples:
+  python benchmarks/bench_tls_reuse.py
+  python benchmarks/bench_tls_reuse.py --hosts 50 --sweeps 5 --handshake-delay-ms 150
+  python benchmarks/bench_tls_reuse.py --keepalive-timeout 1 --pause 2 --tls-version 1.3
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import redfish_sim
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SESSIONS_PATH = "/redfish/v1/sessionservice/sessions"
+
+class Counters:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.full_handshakes = 0
+        self.resumed_handshakes = 0
+        self.requests = 0
+
+    def add(self, **kwargs):
+        with self.lock:
+            for name, value in kwargs.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self):
+        with self.lock:
+            return {name: getattr(self, name)
+                    for name in ("connections", "full_handshakes", "resumed_handshakes", "requests")}
+
+class RedfishHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        server = self.server
+        self.timeout = server.keepalive_timeout  # idle keep-alive connections are closed after this
+        self.request.do_handshake()
+        resumed = self.request.session_reused
+        server.counters.add(connections=1, full_handshakes=0 if resumed else 1, resumed_handshakes=1 if resumed else 0)
+        if not resumed and server.handshake_delay:
+            time.sleep(server.handshake_delay)
+        super().setup()
+
+    def _send(self, status, body=b"", headers=None):
+        self.server.counters.add(requests=1)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+    def do_GET(self):
+        body = self.server.host.personality.render(self.path, self.server.host)
+        self._send(200 if body is not None else 404, body or b'{"error":{}}')
+
+    def do_POST(self):
+        self._read_body()
+        if redfish_sim._normalize(self.path) == SESSIONS_PATH:
+            self._send(201, b'{"@odata.id":"/redfish/v1/SessionService/Sessions/1/"}',
+                       {"X-Auth-Token": "token", "Location": "/redfish/v1/SessionService/Sessions/1/"})
+        else:
+            self._send(200, b'{"error":{"code":"iLO.2.14.Success"}}')
+
+    def do_DELETE(self):
+        self._send(200, b'{}')
+
+    def log_message(self, format, *args):
+        pass
+
+class TlsRedfishServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host, context, counters, handshake_delay, keepalive_timeout):
+        super().__init__(("127.0.0.1", 0), RedfishHandler)
+        self.host = host
+        self.context = context
+        self.counters = counters
+        self.handshake_delay = handshake_delay
+        self.keepalive_timeout = keepalive_timeout
+
+    def get_request(self):
+        sock, address = super().get_request()
+        # Handshake in the handler thread so slow handshakes do not serialize accept()
+        return self.context.wrap_socket(sock, server_side=True, do_handshake_on_connect=False), address
+
+def make_certificate(directory):
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-keyout", key, "-out", cert,
+                    "-days", "1", "-subj", "/CN=ilo-sim"], check=True, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL)
+    return cert, key
+
+def start_servers(count, cert, key, tls_version, handshake_delay, keepalive_timeout, counters):
+    maximum = ssl.TLSVersion.TLSv1_2 if tls_version == "1.2" else ssl.TLSVersion.TLSv1_3
+    personality = redfish_sim.Personality("ilo5")
+    rng = random.Random(0)
+    servers = []
+    for index in range(count):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)  # one context (ticket keys) per iLO
+        context.load_cert_chain(cert, key)
+        context.maximum_version = maximum
+        host = redfish_sim.SimulatedHost(f"127.0.0.{index + 1}", personality, rng)
+        server = TlsRedfishServer(host, context, counters, handshake_delay, keepalive_timeout)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+def run(ilo, systems, sweeps, workers, pause, reuse, counters):
+    """Run `sweeps` status sweeps `pause` seconds apart, return per-sweep rows"""
+    ilo.transport.configure(enabled=reuse)
+    rows = []
+    for sweep in range(1, sweeps + 1):
+        if sweep > 1:
+            time.sleep(pause)
+        before = counters.snapshot()
+        start = time.perf_counter()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda s: ilo.get_system_status(s, print_output=False), systems))
+        elapsed = time.perf_counter() - start
+        after = counters.snapshot()
+        row = {name: after[name] - before[name] for name in after}
+        row.update(sweep=sweep, elapsed_s=elapsed, ok=sum(1 for r in results if r.ok))
+        rows.append(row)
+    ilo.transport.configure(enabled=True)
+    return rows
+
+def print_rows(title, rows):
+    print(f"\n{title}")
+    print(f"  {'sweep':>5} {'elapsed s':>9} {'ok':>5} {'requests':>8} {'conns':>6} {'full TLS':>8} {'resumed':>7} {'req/conn':>8}")
+    for row in rows:
+        per_conn = row["requests"] / row["connections"] if row["connections"] else float("inf")
+        print(f"  {row['sweep']:>5} {row['elapsed_s']:>9.3f} {row['ok']:>5} {row['requests']:>8} {row['connections']:>6} "
+              f"{row['full_handshakes']:>8} {row['resumed_handshakes']:>7} {per_conn:>8.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure TLS handshake savings of ilo_power's pooled transport")
+    parser.add_argument("--hosts", type=int, default=20, help="Number of local HTTPS iLO servers")
+    parser.add_argument("--sweeps", type=int, default=3, help="Status sweeps per mode (like monitoring iterations)")
+    parser.add_argument("--workers", type=int, default=10, help="Parallel workers")
+    parser.add_argument("--handshake-delay-ms", type=float, default=0.0,
+                        help="Extra server time per full TLS handshake (models iLO 4)")
+    parser.add_argument("--keepalive-timeout", type=float, default=30.0,
+                        help="Seconds the servers keep an idle connection open")
+    parser.add_argument("--pause", type=float, default=0.0,
+                        help="Seconds between sweeps (longer than --keepalive-timeout = reconnect with TLS resumption)")
+    parser.add_argument("--tls-version", choices=["1.2", "1.3"], default="1.2", help="Highest TLS version offered")
+    args = parser.parse_args()
+
+    if not shutil.which("openssl"):
+        print("The openssl command is needed to create a test certificate.")
+        return 1
+    sys.path.insert(0, str(REPO_ROOT))
+    import ilo_power
+    import ilo_power.transport
+
+    counters = Counters()
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        servers = start_servers(args.hosts, cert, key, args.tls_version, args.handshake_delay_ms / 1000.0,
+                                args.keepalive_timeout, counters)
+        systems = [{"ip": f"127.0.0.1:{s.server_address[1]}", "username": "Administrator", "password": "password"}
+                   for s in servers]
+        try:
+            baseline = run(ilo_power, systems, args.sweeps, args.workers, args.pause, False, counters)
+            pooled = run(ilo_power, systems, args.sweeps, args.workers, args.pause, True, counters)
+        finally:
+            for server in servers:
+                server.shutdown()
+                server.server_close()
+
+    print(f"{args.hosts} hosts, {args.sweeps} sweeps, {args.workers} workers, TLS {args.tls_version}, "
+          f"+{args.handshake_delay_ms:g} ms per full handshake")
+    print_rows("New connection per session (no pooling):", baseline)
+    print_rows("Shared pooled adapter (keep-alive + TLS resumption):", pooled)
+    total = lambda rows, name: sum(row[name] for row in rows)
+    saved = total(baseline, "full_handshakes") - total(pooled, "full_handshakes")
+    print(f"\nFull handshakes: {total(baseline, 'full_handshakes')} -> {total(pooled, 'full_handshakes')} "
+          f"({saved} saved), elapsed {total(baseline, 'elapsed_s'):.2f}s -> {total(pooled, 'elapsed_s'):.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    raise SystemExit(main())
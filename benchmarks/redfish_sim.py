@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Recorded-response Redfish simulator for ilo_power
+
+Stands in for the `redfish` library with an in-process fleet of simulated
+iLO 4/5/6 hosts built from the recorded payloads in benchmarks/payloads/.
+Each simulated host has its own serial number, power draw and CPU load,
+and the fleet supports configurable latency, failure injection and
+per-host session limits.
+
+Usage example:
+  import redfish_sim
+  fleet = redfish_sim.SimulatedFleet.generate(1000, latency_ms=20, failure_rate=0.01)
+  redfish_sim.install(ilo_power_module, fleet)
+"""
+
+import json
+import random
+import threading
+import time
+import types
+from pathlib import Path
+
+PAYLOAD_DIR = Path(__file__).resolve().parent / "payloads"
+PERSONALITIES = ("ilo4", "ilo5", "ilo6")
+SESSIONS_PATH = "/redfish/v1/SessionService/Sessions"
+
+# Exceptions mirroring redfish.rest.v1 so ilo_power's except clauses behave the same
+class ServerDownOrUnreachableError(Exception):
+    pass
+
+class InvalidCredentialsError(Exception):
+    pass
+
+class SessionCreationError(Exception):
+    pass
+
+def _normalize(path):
+    """Normalize a Redfish path the way iLO does (case and trailing slash insensitive)"""
+    path = path.split("?")[0].split("#")[0]
+    return path.rstrip("/").lower() or "/"
+
+class Personality:
+    """Pre-serialized response templates for one iLO generation"""
+
+    def __init__(self, name):
+        self.name = name
+        with open(PAYLOAD_DIR / f"{name}.json", "r") as f:
+            bundle = json.load(f)
+        self.templates = {}
+        for path, document in bundle.items():
+            self.templates[_normalize(path)] = self._template(document)
+
+    @staticmethod
+    def _template(document):
+        """Serialize a document once, with per-host fields replaced by placeholders"""
+        document = json.loads(json.dumps(document))  # private copy
+        if "SerialNumber" in document:
+            document["SerialNumber"] = "@@SERIAL@@"
+            document["HostName"] = "@@HOSTNAME@@"
+            document["PowerState"] = "@@POWERSTATE@@"
+        for control in document.get("PowerControl", []):
+            control["PowerConsumedWatts"] = "@@WATTS@@"
+        if "PowerConsumedWatts" in document:
+            document["PowerConsumedWatts"] = "@@WATTS@@"
+        for key in ("Hpe", "Hp"):
+            usage = document.get("Oem", {}).get(key, {}).get("SystemUsage")
+            if usage:
+                usage["CPUUtil"] = "@@CPU@@"
+        body = json.dumps(document, separators=(",", ":")).encode("utf-8")
+        # Numeric placeholders must not stay quoted
+        for marker in (b"WATTS", b"CPU"):
+            body = body.replace(b'"@@' + marker + b'@@"', b"@@" + marker + b"@@")
+        return body
+
+    def render(self, path, host):
+        template = self.templates.get(_normalize(path))
+        if template is None:
+            return None
+        if b"@@" not in template:
+            return template
+        return (template
+                .replace(b"@@SERIAL@@", host.serial)
+                .replace(b"@@HOSTNAME@@", host.hostname)
+                .replace(b"@@POWERSTATE@@", host.power_state.encode())
+                .replace(b"@@WATTS@@", str(host.watts if host.power_state == "On" else 0).encode())
+                .replace(b"@@CPU@@", str(host.cpu_load).encode()))
+
+class SimulatedHost:
+    """State and counters for a single simulated iLO"""
+
+    def __init__(self, ip, personality, rng, unreachable=False, bad_credentials=False, power_state="On"):
+        self.ip = ip
+        self.personality = personality
+        self.serial = f"SIM{rng.randrange(16 ** 7):07X}".encode()
+        self.hostname = f"node-{ip.replace('.', '-')}".encode()
+        self.watts = rng.randint(180, 720)
+        self.cpu_load = rng.randint(1, 95)
+        self.power_state = power_state
+        self.unreachable = unreachable
+        self.bad_credentials = bad_credentials
+        self.active_sessions = 0
+        self.peak_sessions = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+class SimulatedResponse:
+    """Minimal stand-in for redfish.rest.v1.RestResponse"""
+
+    def __init__(self, status, body=b""):
+        self.status = status
+        self.read = body
+
+    @property
+    def text(self):
+        return self.read.decode("utf-8", "ignore")
+
+    @property
+    def dict(self):
+        return json.loads(self.read) if self.read else {}
+
+class SimulatedFleet:
+    """A fleet of simulated iLO hosts with shared latency and failure settings
+
+    Args:
+        hosts (list): SimulatedHost instances
+        latency_ms (float): Mean added latency per request in milliseconds
+        jitter_ms (float): Uniform +/- jitter applied to each request latency
+        failure_rate (float): Probability that any single request fails (503 or connection drop)
+        max_sessions (int): Concurrent sessions each iLO accepts before refusing logins
+        connect_timeout_s (float): Time an unreachable host takes to fail (capped by the client timeout)
+        seed (int): Random seed for reproducible failure injection
+    """
+
+    def __init__(self, hosts, latency_ms=0.0, jitter_ms=0.0, failure_rate=0.0, max_sessions=10,
+                 connect_timeout_s=0.5, seed=0):
+        self.hosts = {h.ip: h for h in hosts}
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.max_sessions = max_sessions
+        self.connect_timeout_s = connect_timeout_s
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.logins = 0
+        self.refused_logins = 0
+        self.injected_failures = 0
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def generate(cls, count, mix=None, unreachable_rate=0.0, bad_credentials_rate=0.0, power_state="On",
+                 seed=0, **kwargs):
+        """Build a fleet of `count` hosts on 10.x.y.z addresses
+
+        Args:
+            count (int): Number of hosts
+            mix (dict): Personality weights, e.g. {'ilo4': 0.2, 'ilo5': 0.6, 'ilo6': 0.2}
+            unreachable_rate (float): Fraction of hosts that never answer
+            bad_credentials_rate (float): Fraction of hosts that reject the login
+            power_state (str): Initial power state for every host
+        """
+        rng = random.Random(seed)
+        mix = mix or {"ilo4": 0.2, "ilo5": 0.6, "ilo6": 0.2}
+        personalities = {name: Personality(name) for name in mix}
+        names, weights = list(mix), list(mix.values())
+        hosts = []
+        for i in range(count):
+            ip = f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}"
+            hosts.append(SimulatedHost(
+                ip, personalities[rng.choices(names, weights)[0]], rng,
+                unreachable=rng.random() < unreachable_rate,
+                bad_credentials=rng.random() < bad_credentials_rate,
+                power_state=power_state,
+            ))
+        return cls(hosts, seed=seed, **kwargs)
+
+    def systems(self, username="Administrator", password="password"):
+        """Inventory records in the shape read_ilo_systems_from_csv returns"""
+        return [{"ip": ip, "username": username, "password": password} for ip in self.hosts]
+
+    def request_counts(self):
+        return [h.requests for h in self.hosts.values()]
+
+    def _random(self):
+        with self._rng_lock:
+            return self._rng.random()
+
+    def _delay(self, timeout=None):
+        if self.latency_ms <= 0 and self.jitter_ms <= 0:
+            return
+        delay = self.latency_ms + (self._random() * 2 - 1) * self.jitter_ms
+        delay = max(delay, 0) / 1000.0
+        if timeout is not None and delay > timeout:
+            time.sleep(timeout)
+            raise ServerDownOrUnreachableError("Read timed out")
+        time.sleep(delay)
+
+    def _inject_failure(self):
+        if self.failure_rate <= 0 or self._random() >= self.failure_rate:
+            return None
+        with self._stats_lock:
+            self.injected_failures += 1
+        if self._random() < 0.5:
+            raise ServerDownOrUnreachableError("Connection reset by peer")
+        return SimulatedResponse(503, b'{"error":{"code":"iLO.0.10.ServiceTemporarilyUnavailable"}}')
+
+    def client(self, base_url=None, username=None, password=None, default_prefix="/redfish/v1/",
+               timeout=None, **kwargs):
+        """Factory matching redfish.redfish_client()"""
+        ip = base_url.split("//")[-1].rstrip("/")
+        host = self.hosts.get(ip)
+        if host is None or host.unreachable:
+            time.sleep(min(self.connect_timeout_s, timeout or self.connect_timeout_s))
+            raise ServerDownOrUnreachableError(f"Server not reachable, return code: None")
+        client = SimulatedClient(self, host, base_url, username, password, timeout)
+        if kwargs.get("check_connectivity", True):
+            client.get(default_prefix)  # redfish_client fetches the service root on creation
+        return client
+
+class SimulatedClient:
+    """Stand-in for redfish.rest.v1.HttpClient bound to one simulated host"""
+
+    def __init__(self, fleet, host, base_url, username, password, timeout):
+        self._fleet = fleet
+        self._host = host
+        self._base_url = base_url
+        self._username = username
+        self._password = password
+        self._timeout = timeout
+        self._logged_in = False
+
+    def get_base_url(self):
+        return self._base_url
+
+    def _request(self, path, timeout=None):
+        fleet, host = self._fleet, self._host
+        with host.lock:
+            host.requests += 1
+        fleet._delay(timeout if timeout is not None else self._timeout)
+        return fleet._inject_failure()
+
+    def login(self, auth="session", **kwargs):
+        fleet, host = self._fleet, self._host
+        failure = self._request(SESSIONS_PATH)
+        if failure is not None:
+            raise SessionCreationError(f"HTTP {failure.status}")
+        if host.bad_credentials or self._username is None:
+            raise InvalidCredentialsError("Invalid login credentials")
+        if auth == "session":
+            with host.lock:
+                if host.active_sessions >= fleet.max_sessions:
+                    with fleet._stats_lock:
+                        fleet.refused_logins += 1
+                    raise SessionCreationError("Maximum number of sessions reached")
+                host.active_sessions += 1
+                host.peak_sessions = max(host.peak_sessions, host.active_sessions)
+        with fleet._stats_lock:
+            fleet.logins += 1
+        self._logged_in = auth
+
+    def logout(self):
+        if self._logged_in == "session":
+            with self._host.lock:
+                self._host.active_sessions -= 1
+            self._request(SESSIONS_PATH)
+        self._logged_in = False
+
+    def get(self, path, args=None, headers=None, timeout=None, **kwargs):
+        failure = self._request(path, timeout)
+        if failure is not None:
+            return failure
+        body = self._host.personality.render(path, self._host)
+        if body is None:
+            return SimulatedResponse(404, b'{"error":{"code":"Base.1.4.ResourceMissingAtURI"}}')
+        return SimulatedResponse(200, body)
+
+    def post(self, path, body=None, headers=None, timeout=None, **kwargs):
+        failure = self._request(path, timeout)
+        if failure is not None:
+            return failure
+        if _normalize(path).endswith("computersystem.reset"):
+            reset_type = (body or {}).get("ResetType")
+            if reset_type == "On":
+                self._host.power_state = "On"
+            elif reset_type in ("ForceOff", "GracefulShutdown"):
+                self._host.power_state = "Off"
+            else:
+                return SimulatedResponse(400, b'{"error":{"code":"Base.1.4.ActionParameterNotSupported"}}')
+        return SimulatedResponse(200, b'{"error":{"code":"iLO.2.14.Success"}}')
+
+    def patch(self, path, body=None, headers=None, timeout=None, **kwargs):
+        failure = self._request(path, timeout)
+        if failure is not None:
+            return failure
+        return SimulatedResponse(200, b'{"error":{"code":"iLO.2.14.SystemResetRequired"}}')
+
+def redfish_module(fleet):
+    """Build a module object that quacks like the `redfish` package, backed by `fleet`"""
+    v1 = types.SimpleNamespace(
+        ServerDownOrUnreachableError=ServerDownOrUnreachableError,
+        InvalidCredentialsError=InvalidCredentialsError,
+        SessionCreationError=SessionCreationError,
+    )
+    module = types.ModuleType("redfish")
+    module.__version__ = "simulated"
+    module.redfish_client = fleet.client
+    module.rest = types.SimpleNamespace(v1=v1)
+    return module
+
+def install(ilo_power, fleet):
+    """Point the ilo_power package (or an older single-file ilo_power script module) at the simulated fleet"""
+    target = getattr(ilo_power, "deps", ilo_power)  # the package loads redfish through ilo_power.deps
+    target.redfish = redfish_module(fleet)
+    target.REDFISH_AVAILABLE = True
+    return fleet
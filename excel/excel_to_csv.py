@@ -1,108 +1,82 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+
 import pandas as pd
-import re
 
-def create_csv_from_excel(excel_file, output_dir):
+# The cluster tabs are parsed by ilo_power.workbook (shared with ilo_power -f master_ip_list.xlsx)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ilo_power.workbook import load_cluster_tabs, write_if_changed
+
+def create_csv_from_excel(excel_file, output_dir, workers=None, cache_dir=None):
     """
     Create CSV files from each tab in the Excel file that matches the pattern 'Cluster-\\d+-IP-Registry'
-    
+
+    Runs incrementally: tabs whose content hash matches the cache manifest are taken from the cached frames
+    instead of being parsed again, the others are parsed once each, in parallel worker processes. Files are
+    only written when their content changes, so their modification times only move for real changes.
+
     Args:
         excel_file (str): Path to the Excel file
         output_dir (str): Directory to save the CSV files
+        workers (int): Number of worker processes (default: one per CPU, 1 = parse in this process)
+        cache_dir (str): Directory of the manifest and cached frames (default: <output_dir>/.cache)
     """
     # Create output directory if it doesn't exist
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         print(f"Created directory: {output_dir}")
-    
-    # Read the Excel file
-    xl = pd.ExcelFile(excel_file)
-    
-    # Get all sheet names
-    sheet_names = xl.sheet_names
-    
-    # Pattern for matching cluster tabs
-    pattern = re.compile(r'Cluster-(\d+)-IP-Registry')
-    
-    # Process each sheet
+    tabs = load_cluster_tabs(excel_file, cache_dir or os.path.join(output_dir, ".cache"), workers)
+    if tabs:
+        changed = sum(1 for tab in tabs if not tab.cached)
+        print(f"{changed} of {len(tabs)} cluster tabs changed since the last run")
+
+    # Write the cluster files
     processed_count = 0
     all_nodes_data = []  # List to store all dataframes for combining later
-    for sheet_name in sheet_names:
-        match = pattern.match(sheet_name)
-        if match:
-            try:
-                cluster_num = match.group(1)
-                output_file = f"cluster-{cluster_num.zfill(2)}.csv"  # Zero-pad the number
-                output_path = os.path.join(output_dir, output_file)
-                
-                # Read the sheet without headers first to find the data structure
-                df_raw = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
-                
-                # Find the header row (contains 'Device', 'Rack', etc.)
-                header_row = None
-                for i, row in df_raw.iterrows():
-                    if pd.notna(row[1]) and str(row[1]).strip() == 'Device':
-                        header_row = i
-                        break
-                
-                if header_row is None:
-                    print(f"Warning: Could not find header row in {sheet_name}")
-                    continue
-                
-                # Read the data starting from the row after headers, using columns 1-7 or 1-8 depending on availability
-                data_start_row = header_row + 1
-                # Check how many columns are available in this sheet
-                max_cols = len(df_raw.columns)
-                end_col = min(9, max_cols)  # Use columns 1 to 8 if available, otherwise up to max
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, skiprows=data_start_row, usecols=range(1, end_col), header=None)
-                
-                # Set proper column names
-                column_names = ['Device', 'Rack', 'Physical Hostname', 'ILo Hostname', 
-                               'Mgmt / ILO', 'Host IP', 'VIP', 'Serial Number']
-                df.columns = column_names[:len(df.columns)]
-                
-                # Filter out rows with empty or incomplete data
-                # Keep only rows where Device column contains "Cohesity Cluster" (the actual device entries)
-                df_filtered = df[df['Device'].astype(str).str.contains('Cohesity Cluster', na=False)]
-                
-                # Add username and password columns with default values
-                df_filtered = df_filtered.copy()  # Create a copy to avoid SettingWithCopyWarning
-                df_filtered['username'] = 'remote'
-                df_filtered['password'] = 'hpeonly1'
-                
-                # Add cluster name column for the combined CSV (only include clusters 1-13)
-                if int(cluster_num) <= 13:
-                    df_for_all = df_filtered.copy()
-                    df_for_all['Cluster'] = f"Cluster-{cluster_num}"
-                    all_nodes_data.append(df_for_all)
-                
-                # Save as CSV
-                df_filtered.to_csv(output_path, index=False)
+    for tab in tabs:
+        if tab.message:
+            print(tab.message)
+        if tab.nodes is None:
+            continue
+        try:
+            output_path = os.path.join(output_dir, f"cluster-{tab.number.zfill(2)}.csv")  # Zero-pad the number
+
+            # Add cluster name column for the combined CSV (only include clusters 1-13)
+            if tab.in_all_nodes:
+                df_for_all = tab.nodes.copy()
+                df_for_all['Cluster'] = tab.name
+                all_nodes_data.append(df_for_all)
+
+            # Save as CSV (only if it changed)
+            if write_if_changed(output_path, tab.nodes.to_csv(index=False).encode()):
                 print(f"Created {output_path}")
-                processed_count += 1
-            
-            except Exception as e:
-                print(f"Error processing {sheet_name}: {str(e)}")
-                continue
-    
-    # Create the combined all-nodes.csv file
+            else:
+                print(f"Unchanged {output_path}")
+            processed_count += 1
+
+        except Exception as e:
+            print(f"Error processing {tab.sheet}: {str(e)}")
+            continue
+
+    # Create the combined all-nodes.csv file from the cluster frames (only if it changed)
     if all_nodes_data:
         combined_df = pd.concat(all_nodes_data, ignore_index=True)
         all_nodes_path = os.path.join(output_dir, "all-nodes.csv")
-        combined_df.to_csv(all_nodes_path, index=False)
-        print(f"Created {all_nodes_path} with {len(combined_df)} total nodes")
-    
+        if write_if_changed(all_nodes_path, combined_df.to_csv(index=False).encode()):
+            print(f"Created {all_nodes_path} with {len(combined_df)} total nodes")
+        else:
+            print(f"Unchanged {all_nodes_path} ({len(combined_df)} total nodes)")
     return processed_count
 
 if __name__ == "__main__":
     excel_file = "master_ip_list.xlsx"
     output_dir = "data"
-    
+
     if not os.path.exists(excel_file):
         print(f"Error: Excel file '{excel_file}' not found.")
         exit(1)
-    
+
     processed = create_csv_from_excel(excel_file, output_dir)
-    print(f"Processed {processed} tabs and created {processed} CSV files in the '{output_dir}' directory.") 
\ No newline at end of file
+    print(f"Processed {processed} tabs and created {processed} CSV files in the '{output_dir}' directory.")
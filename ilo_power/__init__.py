@@ -0,0 +1,39 @@
+"""
+HPE iLO power management over the Redfish API
+
+Library behind the ilo-power command (and the ilo_power_1.1.1.py script).
+Use Fleet to run status, power and policy operations over many iLO systems
+in parallel and get typed results back, or the collectors directly with a
+RedfishSession for single-host work.
+
+Usage example:
+  from ilo_power import Fleet
+  fleet = Fleet.from_csv("servers.csv", workers=50)
+  for host in fleet.status(detailed=True):
+      print(host.ip, host.power_state, host.watts)
+"""
+
+__version__ = "1.2.0"
+
+import logging
+
+# The collectors report progress and errors through the "ilo_power" logger instead of printing:
+# silent unless the application configures logging (the ilo-power command prints it to stdout)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+from .analytics import analyze_history, load_history
+from .client import AuthenticationError, ConnectionError, RedfishSession
+from .deadline import Deadline, DeadlineExceeded
+from .collectors import (
+    get_cpu_utilization, get_power_policy, get_power_status, get_power_watts, get_system_identifier,
+    get_system_metrics_detailed, get_system_status, power_off_system, power_on_system, set_power_policy,
+)
+from .decoding import set_json_decoder
+from .fleet import ActionResult, Fleet, PowerPolicy, PowerReading
+from .instrumentation import enable_instrumentation
+from .inventory import (
+    read_ilo_systems, read_ilo_systems_from_csv, read_ilo_systems_manually, sort_cluster_then_ip_key, sort_ip_address_key,
+)
+from .output import save_full_monitor_data_to_csv, save_power_data_to_csv, save_status_to_csv
+from .retry import RetryPolicy, get_retry_policy, set_retry_policy
+from .status import HostStatus, StatusTable
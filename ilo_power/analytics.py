@@ -0,0 +1,258 @@
+"""
+Power-budget analytics over monitoring history (ilo-power --analyze)
+
+Loads the per-host history written by --monitor (*_hosts.csv) or
+--monitor-full, or the fleet totals of an older --monitor CSV, as one long
+frame (timestamp, ip, cluster, watts, cpu_load) and computes per host, per
+cluster and for the fleet:
+- energy in kWh by trapezoidal integration (gaps longer than max_gap are not bridged)
+- peak and percentile demand; cluster and fleet demand is the coincident sum per sample
+- the highest rolling average over a time window (sustained demand)
+- idle hosts: low CPU while drawing high power for most samples
+- PSU headroom against a given power supply capacity
+
+All calculations are vectorized over the whole history (NumPy/pandas group-bys),
+so weeks of 1-minute samples for a large fleet stay fast. Parquet input needs pyarrow.
+"""
+
+from pathlib import Path
+
+from .deps import load_numpy, load_pandas
+from .inventory import cluster_part
+
+FLEET = "(fleet)"  # ip used for the fleet totals of an aggregate --monitor CSV
+PERCENTILES = (50, 95, 99)
+
+def load_history(path, systems=None):
+    """Load monitoring history as a long frame sorted by ip, then timestamp.
+
+    Args:
+        path (str): --monitor per-host CSV (*_hosts.csv), --monitor-full CSV, aggregate --monitor CSV,
+            or any of these saved as Parquet
+        systems (list): Optional inventory (system dicts) to fill in clusters by IP
+
+    Returns:
+        pandas.DataFrame: Columns timestamp (datetime64), ip (category), cluster (category),
+            watts and cpu_load (float64, NaN = unknown)
+    """
+    pd = load_pandas()
+    path = Path(path)
+    if path.suffix == '.parquet':
+        raw = pd.read_parquet(path)
+        columns = list(raw.columns)
+    else:
+        columns = list(pd.read_csv(path, nrows=0).columns)
+        wanted = ['timestamp', 'ip', 'cluster', 'watts', 'power_watts', 'cpu_load', 'total_power_watts', 'avg_cpu_load']
+        # Only the needed columns, typed up front; 'Unknown' readings become NaN
+        raw = pd.read_csv(path, usecols=[c for c in columns if c in wanted], na_values=['Unknown'],
+                          dtype={'ip': 'category', 'cluster': 'category'})
+
+    def numeric(name):
+        return pd.to_numeric(raw[name], errors='coerce') if name in columns else float('nan')
+
+    timestamps = pd.to_datetime(raw['timestamp'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+    if 'ip' in columns:
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'ip': raw['ip'],
+            'cluster': raw['cluster'] if 'cluster' in columns else "",
+            'watts': numeric('watts' if 'watts' in columns else 'power_watts'),
+            'cpu_load': numeric('cpu_load'),
+        })
+    elif 'total_power_watts' in columns:
+        # Fleet totals only: analysed as one host
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'ip': FLEET,
+            'cluster': "",
+            'watts': numeric('total_power_watts'),
+            'cpu_load': numeric('avg_cpu_load'),
+        })
+    else:
+        raise ValueError(f"{path} is not a monitoring history (no 'ip' or 'total_power_watts' column)")
+    if timestamps.isna().any():  # other timestamp formats
+        df['timestamp'] = pd.to_datetime(raw['timestamp'])
+
+    df['ip'] = df['ip'].astype(str).astype('category')
+    if systems:
+        clusters = {s['ip']: s.get('cluster') or s.get('device') or "" for s in systems}
+        df['cluster'] = df['ip'].map(clusters).astype(object).fillna(df['cluster'])
+    # Cluster part of cluster/device names, mapped once per distinct name
+    df['cluster'] = df['cluster'].astype('category')
+    names = {name: cluster_part(str(name)) or "" for name in df['cluster'].cat.categories}
+    df['cluster'] = df['cluster'].map(names).astype(object).fillna("").astype('category')
+    return df.sort_values(['ip', 'timestamp'], kind='stable').reset_index(drop=True)
+
+def sample_interval(df):
+    """Median time between consecutive samples of a host, as a pandas Timedelta"""
+    pd = load_pandas()
+    np = load_numpy()
+    codes = df['ip'].cat.codes.to_numpy()
+    seconds = df['timestamp'].to_numpy().astype('datetime64[ns]').astype(np.int64) / 1e9
+    same = codes[1:] == codes[:-1]
+    deltas = np.diff(seconds)[same]
+    deltas = deltas[deltas > 0]
+    return pd.Timedelta(seconds=float(np.median(deltas)) if len(deltas) else 0)
+
+def energy_kwh(df, max_gap=None):
+    """Energy per host in kWh by trapezoidal integration of watts over time.
+
+    Args:
+        df (DataFrame): History from load_history
+        max_gap (Timedelta): Longest interval between two samples that is integrated
+            (default: 3x the median sample interval); longer gaps count as no data
+
+    Returns:
+        tuple: (kwh, covered_hours) - float arrays indexed by ip category code
+    """
+    np = load_numpy()
+    if max_gap is None:
+        max_gap = sample_interval(df) * 3
+    codes = df['ip'].cat.codes.to_numpy()
+    hours = df['timestamp'].to_numpy().astype('datetime64[ns]').astype(np.int64) / 3.6e12
+    watts = df['watts'].to_numpy(dtype=np.float64)
+    dt = np.diff(hours)
+    valid = ((codes[1:] == codes[:-1]) & ~np.isnan(watts[1:]) & ~np.isnan(watts[:-1])
+             & (dt > 0) & (dt <= max_gap.total_seconds() / 3600.0))
+    segment_kwh = (watts[1:] + watts[:-1]) / 2.0 * dt / 1000.0
+    n = len(df['ip'].cat.categories)
+    kwh = np.bincount(codes[1:][valid], weights=segment_kwh[valid], minlength=n)
+    covered = np.bincount(codes[1:][valid], weights=dt[valid], minlength=n)
+    return kwh, covered
+
+def demand(series_by_group):
+    """Peak, mean and percentile demand of a grouped watts series"""
+    pd = load_pandas()
+    stats = series_by_group.agg(['max', 'mean', 'count'])
+    quantiles = series_by_group.quantile([p / 100.0 for p in PERCENTILES]).unstack()
+    quantiles.columns = [f"p{p}_watts" for p in PERCENTILES]
+    stats.columns = ['peak_watts', 'mean_watts', 'samples']
+    return pd.concat([stats, quantiles], axis=1)
+
+def max_rolling_mean(frame, group, window):
+    """Highest rolling mean of watts over `window` (e.g. '1h') per group of a frame indexed by timestamp"""
+    rolled = frame.groupby(group, observed=True)['watts'].rolling(window, min_periods=1).mean()
+    return rolled.groupby(level=0, observed=True).max()
+
+def coincident(df, by=None):
+    """Sum of host watts per sample (per `by` group, e.g. 'cluster'), as a frame with a watts column"""
+    keys = [by, 'timestamp'] if by else ['timestamp']
+    return df.groupby(keys, observed=True)['watts'].sum(min_count=1).reset_index().dropna(subset=['watts'])
+
+def analyze_history(df, window='1h', idle_cpu=5.0, idle_watts=None, idle_fraction=0.8, psu_capacity=None,
+                    max_gap=None):
+    """Per-host, per-cluster and fleet power analytics of a monitoring history.
+
+    Args:
+        df (DataFrame): History from load_history
+        window (str): Rolling average window (pandas offset, e.g. '1h', '30min')
+        idle_cpu (float): CPU load (%) below which a sample counts as idle
+        idle_watts (float): Power above which an idle sample counts as wasteful (default: fleet median watts)
+        idle_fraction (float): Share of samples that must be idle-but-powered to flag a host
+        psu_capacity (float): Usable power supply capacity per host in watts, for headroom (None = skip)
+        max_gap (Timedelta): See energy_kwh
+
+    Returns:
+        dict: 'hosts' and 'clusters' DataFrames and a 'fleet' dict
+    """
+    pd = load_pandas()
+    np = load_numpy()
+    if idle_watts is None:
+        idle_watts = float(df['watts'].median()) if df['watts'].notna().any() else 0.0
+
+    # Per host
+    by_host = df.groupby('ip', observed=True)
+    hosts = demand(by_host['watts'])
+    kwh, covered = energy_kwh(df, max_gap)
+    categories = df['ip'].cat.categories
+    hosts['kwh'] = pd.Series(kwh, index=categories).reindex(hosts.index)
+    hosts['hours'] = pd.Series(covered, index=categories).reindex(hosts.index)
+    hosts[f'max_avg_{window}_watts'] = max_rolling_mean(df.set_index('timestamp'), 'ip', window)
+    hosts['mean_cpu'] = by_host['cpu_load'].mean()
+    idle = (df['cpu_load'] < idle_cpu) & (df['watts'] > idle_watts)
+    hosts['idle_share'] = idle.groupby(df['ip'], observed=True).mean()
+    hosts['idle'] = hosts['idle_share'] >= idle_fraction
+    hosts['cluster'] = by_host['cluster'].first()
+    if psu_capacity:
+        hosts['headroom_watts'] = psu_capacity - hosts['peak_watts']
+        hosts['psu_load_pct'] = hosts['peak_watts'] / psu_capacity * 100.0
+
+    # Per cluster: energy adds up, demand is the coincident sum of the cluster's hosts
+    cluster_samples = coincident(df, 'cluster')
+    clusters = demand(cluster_samples.groupby('cluster', observed=True)['watts'])
+    clusters[f'max_avg_{window}_watts'] = max_rolling_mean(cluster_samples.set_index('timestamp'), 'cluster', window)
+    grouped = hosts.groupby('cluster', observed=True)
+    clusters['hosts'] = grouped.size()
+    clusters['kwh'] = grouped['kwh'].sum()
+    clusters['idle_hosts'] = grouped['idle'].sum()
+    if psu_capacity:
+        clusters['headroom_watts'] = clusters['hosts'] * psu_capacity - clusters['peak_watts']
+
+    # Fleet
+    fleet_series = coincident(df).set_index('timestamp')['watts']
+    fleet_samples = fleet_series.to_numpy()
+    fleet = {
+        'hosts': len(hosts),
+        'samples': len(df),
+        'start': df['timestamp'].min(),
+        'end': df['timestamp'].max(),
+        'interval': sample_interval(df),
+        'kwh': float(np.nansum(kwh)),
+        'peak_watts': float(fleet_samples.max()) if len(fleet_samples) else None,
+        f'max_avg_{window}_watts': float(fleet_series.rolling(window, min_periods=1).mean().max()) if len(fleet_samples) else None,
+        'idle_hosts': int(hosts['idle'].sum()),
+        'idle_watts_threshold': idle_watts,
+    }
+    for p in PERCENTILES:
+        fleet[f'p{p}_watts'] = float(np.percentile(fleet_samples, p)) if len(fleet_samples) else None
+    return {'hosts': hosts.reset_index(), 'clusters': clusters.reset_index(), 'fleet': fleet}
+
+def print_analysis(analysis, top=20, window='1h'):
+    """Print the fleet summary, the clusters and the top hosts by energy"""
+    fleet, hosts, clusters = analysis['fleet'], analysis['hosts'], analysis['clusters']
+    rolling = f'max_avg_{window}_watts'
+    print(f"\nHistory: {fleet['start']} - {fleet['end']}, {fleet['hosts']} hosts, {fleet['samples']} samples "
+          f"(every {fleet['interval']})")
+    if fleet['peak_watts'] is not None:
+        print(f"Fleet energy: {fleet['kwh']:.1f} kWh | peak {fleet['peak_watts']:.0f}W | "
+              + " | ".join(f"p{p} {fleet[f'p{p}_watts']:.0f}W" for p in PERCENTILES)
+              + f" | highest {window} average {fleet[rolling]:.0f}W")
+    print(f"Idle hosts (CPU low while drawing > {fleet['idle_watts_threshold']:.0f}W): {fleet['idle_hosts']}")
+
+    if len(clusters) > 1 or (len(clusters) == 1 and clusters['cluster'].iloc[0]):
+        print(f"\n{'Cluster':<30} {'Hosts':>5} {'kWh':>10} {'Peak W':>9} {'p95 W':>9} {'Max ' + window + ' W':>12} {'Idle':>5}"
+              + (f" {'Headroom W':>11}" if 'headroom_watts' in clusters else ""))
+        for row in clusters.sort_values('kwh', ascending=False).itertuples(index=False):
+            row = row._asdict()
+            line = (f"{(row['cluster'] or '(none)')[:30]:<30} {row['hosts']:>5} {row['kwh']:>10.1f} {row['peak_watts']:>9.0f} "
+                    f"{row['p95_watts']:>9.0f} {row[rolling]:>12.0f} {int(row['idle_hosts']):>5}")
+            if 'headroom_watts' in row:
+                line += f" {row['headroom_watts']:>11.0f}"
+            print(line)
+
+    shown = hosts.sort_values('kwh', ascending=False).head(top)
+    print(f"\nTop {len(shown)} hosts by energy:")
+    print(f"{'IP':<16} {'kWh':>9} {'Peak W':>8} {'p95 W':>8} {'Mean W':>8} {'Mean CPU':>8} {'Idle %':>7}"
+          + (f" {'PSU %':>6}" if 'psu_load_pct' in hosts else ""))
+    for row in shown.itertuples(index=False):
+        row = row._asdict()
+        cpu = f"{row['mean_cpu']:.1f}%" if row['mean_cpu'] == row['mean_cpu'] else "n/a"
+        line = (f"{row['ip']:<16} {row['kwh']:>9.2f} {row['peak_watts']:>8.0f} {row['p95_watts']:>8.0f} "
+                f"{row['mean_watts']:>8.0f} {cpu:>8} {row['idle_share'] * 100:>6.0f}%")
+        if 'psu_load_pct' in row:
+            line += f" {row['psu_load_pct']:>5.0f}%"
+        print(line)
+
+    idle_hosts = hosts[hosts['idle']]
+    if len(idle_hosts):
+        print(f"\nIdle hosts ({len(idle_hosts)}): " + ", ".join(str(ip) for ip in idle_hosts['ip'][:50])
+              + (" ..." if len(idle_hosts) > 50 else ""))
+
+def save_analysis(analysis, csv_path):
+    """Write the per-host analysis to csv_path and the per-cluster analysis next to it (*_clusters.csv)"""
+    path = Path(csv_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    analysis['hosts'].to_csv(path, index=False, float_format='%.3f')
+    cluster_path = path.with_name(f"{path.stem}_clusters{path.suffix or '.csv'}")
+    analysis['clusters'].to_csv(cluster_path, index=False, float_format='%.3f')
+    return str(path), str(cluster_path)
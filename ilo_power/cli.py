@@ -0,0 +1,755 @@
+"""
+Command line interface (ilo-power)
+"""
+
+import argparse
+import datetime
+import getpass
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from . import __version__, decoding, deps, instrumentation
+from .client import REDFISH_SYSTEM_PATH, AuthenticationError, ConnectionError, RedfishSession, shared_adapter
+from .collectors import (
+    get_cpu_utilization, get_power_policy, get_power_watts, get_system_identifier, get_system_status, host_budget,
+    power_off_system, power_on_system, set_power_policy,
+)
+from .decoding import safe_get_json, set_json_decoder
+from .deps import load_numpy, load_redfish, package_version, print_exc
+from .instrumentation import enable_instrumentation
+from .inventory import is_workbook, read_ilo_systems, sort_order
+from .monitor import monitor_full, monitor_power
+from .output import save_power_data_to_csv, save_status_to_csv
+from .retry import RetryPolicy, get_retry_policy, set_retry_policy
+from .status import HostStatus, StatusTable
+
+# Parsed cluster tabs of a master IP list workbook given to -f/--all-nodes (see ilo_power.workbook)
+INVENTORY_CACHE_DIR = "output/.inventory_cache"
+
+class ConsoleHandler(logging.Handler):
+    """Print the messages of the ilo_power loggers as plain lines on stdout (debug messages prefixed with DEBUG)"""
+
+    def emit(self, record):
+        try:
+            message = self.format(record)
+            print(f"DEBUG {message}" if record.levelno == logging.DEBUG else message)
+        except Exception:
+            self.handleError(record)
+
+def enable_console_output():
+    """Print the progress and error messages of the collectors, which report through logging, on the console"""
+    logger = logging.getLogger('ilo_power')
+    if not any(isinstance(handler, ConsoleHandler) for handler in logger.handlers):
+        logger.addHandler(ConsoleHandler())
+    logger.setLevel(logging.DEBUG)  # Debug messages are only logged with -d/--debug
+    logger.propagate = False
+
+def main():
+    """Main function"""
+    enable_console_output()
+    try:
+        # Direct test if requested
+        if len(sys.argv) > 1 and sys.argv[1] == "--test-redfish":
+            if len(sys.argv) >= 5:
+                test_redfish_direct(sys.argv[2], sys.argv[3], sys.argv[4])
+            else:
+                print(f"Usage: python {os.path.basename(sys.argv[0])} --test-redfish <ip> <username> <password>")
+            return
+
+        # Check package versions and availability
+        version_info = []
+        version_info.append(f"HPE iLO Power Management Script v{__version__} (redfish based with NumPy)")
+        
+        # Check NumPy and Pandas (reported from package metadata - both are imported only when needed)
+        numpy_version = package_version('numpy')
+        if numpy_version:
+            version_info.append(f"NumPy: {numpy_version}")
+        else:
+            version_info.append(f"NumPy: not available")
+            print("Warning: NumPy module not found or version detection failed.")
+            print("For best performance, please install it using: pip install numpy")
+        
+        pandas_version = package_version('pandas')
+        if pandas_version:
+            version_info.append(f"Pandas: {pandas_version}")
+        else:
+            version_info.append(f"Pandas: not available")
+            print("Warning: Pandas module not found or version detection failed.")
+            print("Please install it using: pip install pandas")
+        
+        # Check Redfish (imported only when a client is created)
+        if deps.REDFISH_AVAILABLE:
+            version_info.append(f"Redfish: {package_version('redfish')}")
+            version_info.append(f"JSON decoder: {decoding.JSON_DECODER}")
+        else:
+            version_info.append(f"Redfish: not available")
+            print("Error: redfish module not found.")
+            print("Please install it using: pip install redfish")
+            return
+        
+        # Print version information
+        print("Starting " + version_info[0])
+        print("Libraries: " + ", ".join(version_info[1:]))
+
+        # Set up argument parser
+        parser = argparse.ArgumentParser(
+            description='Manage power states of HPE iLO systems using the Redfish API',
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter
+        )
+        
+        # Input source arguments
+        input_group = parser.add_mutually_exclusive_group()  # Required except for --analyze (checked below)
+        input_group.add_argument('-f', '--file', help='CSV file with iLO systems (uses "Mgmt / ILO" column for IP, plus username and password columns), or the master IP list .xlsx (the all-nodes clusters)')
+        input_group.add_argument('--all-nodes', help='CSV file or master IP list .xlsx with iLO systems - shows cluster names and sorts by cluster then IP (auto-enables --sort)')
+        input_group.add_argument('-i', '--ip', help='IP address of a single iLO system')
+        
+        # Authentication for single system
+        parser.add_argument('-u', '--username', default='Administrator', help='Username for iLO')
+        parser.add_argument('-p', '--password', help='Password for iLO')
+        
+        # General options
+        parser.add_argument('-w', '--workers', type=int, default=50, help='Number of parallel workers')
+        parser.add_argument('-y', '--yes', action='store_true', help='Skip confirmation prompts')
+        parser.add_argument('-d', '--debug', action='store_true', help='Show debug information')
+        parser.add_argument('--details', action='store_true', help='Show detailed status info')
+        parser.add_argument('--sort', action='store_true', help='Sort status output by hostname/identifier')
+        parser.add_argument('--top', type=int, metavar='N', help='With --status: show only the N systems with the highest --by value (implies --sort)')
+        parser.add_argument('--by', choices=['watts', 'cpu'], default='watts', help='Value ranked by --top (cpu also collects CPU utilization)')
+        parser.add_argument('--by-cluster', action='store_true', help='With --status: also print a per-cluster summary (hosts, total/average/peak watts, average CPU) (implies --sort)')
+        parser.add_argument('--status-format', choices=['csv', 'parquet'], default='csv', help='File format of the status file saved by --status --sort with a CSV input (parquet needs pyarrow)')
+        parser.add_argument('--fast', action='store_true', help='Fast mode: skip CPU utilization and reduce timeouts for quicker results')
+        parser.add_argument('--ultra-fast', action='store_true', help='Ultra-fast mode: very aggressive timeouts and skip error retries')
+        parser.add_argument('--host-budget', type=float, metavar='SECONDS', help='With --status: time allowed per system for connect, login and all requests; fields not collected in time are reported as missing (default: 60, 20 with --fast, 8 with --ultra-fast; 0 = no limit)')
+        parser.add_argument('--skip-ip-range', help='Skip IP addresses in specified range (e.g., "10.208.26.8-19" to skip .8 through .19)')
+        parser.add_argument('--wait', type=int, default=120, help='Wait time in seconds between power operations (default: 120 seconds)')
+        parser.add_argument('--json-decoder', choices=['auto', 'orjson', 'ujson', 'json'], default='auto', help='JSON decoder for Redfish responses (auto picks the fastest installed)')
+        parser.add_argument('--timing', action='store_true', help='Record per-request timings and print a summary by endpoint, iLO generation and host at the end of the run')
+        parser.add_argument('--trace', metavar='FILE', help='Record per-request timings and write them to FILE (.json = Chrome trace, .jsonl = one record per line)')
+        parser.add_argument('--no-connection-reuse', action='store_true', help='Open a new HTTPS connection (full TLS handshake) for every iLO session instead of pooling connections and resuming TLS sessions')
+        parser.add_argument('--retries', type=int, default=1, help='Retries per login or GET on transient errors (POST/PATCH are never retried)')
+        parser.add_argument('--retry-delay', type=float, default=0.5, help='Backoff base in seconds; retry n waits a random 0..delay*2^n (capped at 8s)')
+        parser.add_argument('--retry-budget', type=int, help='Total retries allowed per sweep across all systems (default: 10%% of systems, at least 10)')
+        
+        # Monitoring options
+        parser.add_argument('--interval', type=int, default=15, help='Monitoring interval (minutes)')
+        parser.add_argument('--output-csv', help='CSV file for output data')
+        
+        # Analysis options (--analyze)
+        parser.add_argument('--window', default='1h', help='With --analyze: rolling average window (e.g. 15min, 1h, 1D)')
+        parser.add_argument('--idle-cpu', type=float, default=5.0, help='With --analyze: CPU load (%%) below which a sample counts as idle')
+        parser.add_argument('--idle-watts', type=float, help='With --analyze: power above which an idle sample counts as wasted (default: fleet median)')
+        parser.add_argument('--psu-capacity', type=float, help='With --analyze: usable PSU capacity per host in watts, for headroom estimates')
+        
+        # Actions
+        action_group = parser.add_mutually_exclusive_group(required=True)
+        action_group.add_argument('-s', '--status', action='store_true', help='Check system status')
+        action_group.add_argument('-watts', '--power-watts', action='store_true', help='Get power consumption')
+        # New monitor options
+        action_group.add_argument('-m', '--monitor', action='store_true', help='Monitor power and CPU over time')
+        action_group.add_argument('-m-full', '--monitor-full', action='store_true', 
+                                  help='Monitor power, CPU and all system metrics over time (comprehensive)')
+        # Keep old monitor option for backward compatibility
+        action_group.add_argument('-monitor', '--monitor-power', action='store_true', 
+                                  help='Monitor power over time (same as --monitor for backward compatibility)')
+        action_group.add_argument('--analyze', metavar='HISTORY', help='Analyze a monitoring history (--monitor *_hosts.csv, --monitor-full CSV or Parquet): energy, peak/percentile demand, rolling averages, idle hosts, PSU headroom per host and cluster (-f/--all-nodes adds clusters by IP)')
+        action_group.add_argument('-cpu', '--get-cpu', action='store_true', help='Get CPU utilization')
+        action_group.add_argument('-pp', '--get-power-policy', action='store_true', help='Get power policy')
+        action_group.add_argument('-spp', '--set-power-policy', metavar='POLICY', help='Set power policy')
+        action_group.add_argument('-on', '--power-on', action='store_true', help='Power on systems')
+        action_group.add_argument('-off', '--power-off', action='store_true', help='Graceful shutdown')
+        action_group.add_argument('-force-off', '--force-power-off', action='store_true', help='Force power off')
+        
+        args = parser.parse_args()
+        if not (args.file or args.all_nodes or args.ip or args.analyze):
+            parser.error("one of the arguments -f/--file --all-nodes -i/--ip is required")
+        set_json_decoder(args.json_decoder)
+        if args.timing or args.trace:
+            enable_instrumentation()
+        
+        if args.analyze:
+            analyze_history_file(args)
+            return
+        
+        # Load systems
+        if args.file or args.all_nodes:
+            file_path = Path(args.file if args.file else args.all_nodes)
+            if not file_path.exists():
+                print(f"Error: File '{file_path}' not found")
+                return
+                
+            print(f"Reading systems from {'workbook' if is_workbook(file_path) else 'CSV file'}: {file_path}")
+            ilo_systems = read_ilo_systems(file_path, args.debug, cache_dir=INVENTORY_CACHE_DIR)
+            
+            if not ilo_systems:
+                print("No valid iLO systems found. Exiting.")
+                return
+                
+            print(f"Loaded {len(ilo_systems)} systems.")
+            
+            # Filter out specified IP range if requested
+            if args.skip_ip_range:
+                try:
+                    # Parse range like "10.208.26.8-19"
+                    if '-' in args.skip_ip_range:
+                        base_ip = args.skip_ip_range.split('-')[0]
+                        end_num = int(args.skip_ip_range.split('-')[1])
+                        # Extract the base and start number
+                        base_parts = base_ip.split('.')
+                        start_num = int(base_parts[-1])
+                        ip_prefix = '.'.join(base_parts[:-1])
+                        
+                        original_count = len(ilo_systems)
+                        ilo_systems = [s for s in ilo_systems if not any(
+                            s['ip'] == f'{ip_prefix}.{i}' for i in range(start_num, end_num + 1)
+                        )]
+                        filtered_count = original_count - len(ilo_systems)
+                        if filtered_count > 0:
+                            print(f"Skipped {filtered_count} systems in IP range {args.skip_ip_range}")
+                    else:
+                        print(f"Invalid IP range format: {args.skip_ip_range}. Use format like '10.208.26.8-19'")
+                except Exception as e:
+                    print(f"Error parsing IP range {args.skip_ip_range}: {e}")
+            
+            # Auto-enable sorting for --all-nodes
+            if args.all_nodes:
+                args.sort = True
+                print("Auto-enabled sorting by cluster name and IP address for --all-nodes mode.")
+            
+            # Set default output CSV if needed
+            if not args.output_csv and (args.monitor or args.monitor_power or args.monitor_full or args.get_cpu or args.power_watts):
+                # Get just the filename without directory and extension
+                base_name = file_path.stem
+                # Ensure output directory exists
+                Path('output').mkdir(exist_ok=True)
+                
+                if args.monitor or args.monitor_power:
+                    args.output_csv = f"output/{base_name}_power_cpu_history.csv"
+                elif args.monitor_full:
+                    args.output_csv = f"output/{base_name}_full_metrics.csv"
+                elif args.get_cpu:
+                    args.output_csv = f"output/{base_name}_cpu_data.csv"
+                elif args.power_watts:
+                    args.output_csv = f"output/{base_name}_power_data.csv"
+        else:
+            # Single system mode
+            if not args.password:
+                password = getpass.getpass(f"Enter password for {args.username}@{args.ip}: ")
+            else:
+                password = args.password
+                
+            ilo_systems = [{'ip': args.ip, 'username': args.username, 'password': password}]
+            print(f"Using single system: {args.ip}")
+            
+            # Set default output CSV for single system
+            if not args.output_csv and (args.monitor or args.monitor_power or args.monitor_full or args.get_cpu or args.power_watts):
+                ip_safe = args.ip.replace('.', '_')
+                # Ensure output directory exists
+                Path('output').mkdir(exist_ok=True)
+                
+                if args.monitor or args.monitor_power:
+                    args.output_csv = f"output/{ip_safe}_power_cpu_history.csv"
+                elif args.monitor_full:
+                    args.output_csv = f"output/{ip_safe}_full_metrics.csv"
+                elif args.get_cpu:
+                    args.output_csv = f"output/{ip_safe}_cpu_data.csv"
+                elif args.power_watts:
+                    args.output_csv = f"output/{ip_safe}_power_data.csv"
+
+        if args.no_connection_reuse:
+            from .transport import configure as configure_transport  # Imports requests, so only when asked
+            configure_transport(enabled=False)
+
+        # Jittered exponential backoff with a retry budget shared by all workers
+        retry_budget = args.retry_budget if args.retry_budget is not None else max(10, len(ilo_systems) // 10)
+        set_retry_policy(RetryPolicy(max_retries=max(0, args.retries), base_delay=args.retry_delay, budget=retry_budget))
+        if args.debug:
+            print(f"Retry policy: {get_retry_policy().describe()}")
+
+        # Execute requested action
+        if args.status:
+            print("Checking system status...")
+            
+            # Add progress reporting for large operations
+            if len(ilo_systems) > 50:
+                print(f"Processing {len(ilo_systems)} systems with {args.workers} workers...")
+                budget = host_budget(args.fast, args.ultra_fast) if args.host_budget is None else args.host_budget
+                budget_str = f"{budget:g}s per system" if budget else "no time limit per system"
+                if args.ultra_fast:
+                    print(f"Ultra-fast mode: 3s timeouts, no retries, {budget_str}")
+                elif args.fast:
+                    print(f"Fast mode: 5s power timeout, no CPU utilization, {budget_str}")
+            
+            # Ranked and per-cluster views need the collected results
+            if args.top or args.by_cluster:
+                args.sort = True
+            
+            if args.sort:
+                # When sorting, collect results first
+                success_count = 0
+                total_count = len(ilo_systems)
+                all_results = []
+                # CPU load is only collected with --details, so ranking by CPU needs it too
+                collect_details = args.details or (args.top and args.by == 'cpu')
+                
+                # Use ThreadPoolExecutor but don't print results yet
+                with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                    # Map get_system_status with print_output=False, with extra error protection
+                    def safe_get_status(system):
+                        try:
+                            return get_system_status(system, detailed=collect_details, debug=args.debug, print_output=False, fast_mode=args.fast, ultra_fast=args.ultra_fast, budget=args.host_budget)
+                        except Exception as e:
+                            # Create a minimal error result if something unexpected happens
+                            ip = system.get('ip', 'Unknown')
+                            if args.debug:
+                                print(f"DEBUG: Unexpected error in thread for {ip}: {e}")
+                                print_exc()
+                            # Include cluster/device info for proper sorting
+                            return HostStatus(ip, cluster=system.get("cluster"), device=system.get("device"),
+                                              error=f"Thread error: {e}")
+                    
+                    results = list(executor.map(safe_get_status, ilo_systems))
+                    
+                    # Include ALL results for sorting (even errors/timeouts), count successes
+                    for system, r in zip(ilo_systems, results):
+                        if not isinstance(r, HostStatus):
+                            # This shouldn't happen with print_output=False, but handle edge case
+                            # Create a minimal result for sorting
+                            r = HostStatus(system['ip'], cluster=system.get("cluster"), device=system.get("device"),
+                                           error="Connection failed")
+                        elif r.ok:
+                            success_count += 1
+                        all_results.append(r)
+                
+                # Sort results with the keys precomputed at inventory load - cluster then IP for --all-nodes, otherwise just IP
+                sorted_results = [all_results[i] for i in sort_order(ilo_systems, by_cluster=bool(args.all_nodes))]
+                status_table = StatusTable.from_records(sorted_results)
+                
+                # Save results to CSV if using input file
+                if args.file or args.all_nodes:
+                    # Create output filename based on input filename with current date
+                    input_file = Path(args.file if args.file else args.all_nodes)
+                    base_name = input_file.stem
+                    current_date = datetime.datetime.now().strftime("%Y%m%d")
+                    # Ensure output directory exists
+                    Path('output').mkdir(exist_ok=True)
+                    output_csv = f"output/{base_name}_status_{current_date}.{args.status_format}"
+                    
+                    # Save status to CSV (or Parquet) straight from the column table
+                    saved_path = save_status_to_csv(output_csv, status_table)
+                    if saved_path:
+                        print(f"Status information saved to {saved_path}")
+                
+                # Print sorted results (including errors/timeouts) - or only the top N
+                if args.top:
+                    top_rows = status_table.top_indices(args.top, 'cpu_load' if args.by == 'cpu' else 'watts')
+                    print(f"Top {len(top_rows)} of {len(status_table)} systems by {'CPU utilization' if args.by == 'cpu' else 'power consumption'}:")
+                    sorted_results = [sorted_results[i] for i in top_rows]
+                for result in sorted_results:
+                    ip = result.ip
+                    id_str = f"{result.model} (S/N: {result.identifier})" if result.identifier != 'Unknown' and result.identifier else result.model
+                    
+                    # Handle error cases
+                    if result.error:
+                        error_short = result.error.split(":")[0] if ":" in result.error else result.error
+                        if not args.details:
+                            # Show error in basic format
+                            cluster_device_info = result.cluster or result.device or ""
+                            if args.all_nodes and cluster_device_info:
+                                print(f"{ip} | {cluster_device_info} | ERROR: {error_short}")
+                            else:
+                                print(f"{ip} | ERROR: {error_short}")
+                            continue
+                    
+                    if args.details:
+                        # For --all-nodes, show cluster prominently
+                        cluster_device_info = result.cluster or result.device or ""
+                        if args.all_nodes and cluster_device_info:
+                            print(f"Detailed status for {ip} [{id_str}] - {cluster_device_info}:")
+                        else:
+                            print(f"Detailed status for {ip} [{id_str}]:")
+                        
+                        # Print cluster/device if available
+                        if cluster_device_info:
+                            print(f"  Cluster/Device: {cluster_device_info}")
+                        print(f"  Health: {result.health}")
+                        print(f"  Power State: {result.power_state}")
+                        print(f"  iLO Version: {result.ilo_version}")
+                        print(f"  BIOS Version: {result.bios_version}")
+                        watts_str = f"{result.watts}W" if result.watts is not None else "Unknown"
+                        print(f"  Power Consumption: {watts_str}")
+                        cpu_str = f"{result.cpu_load:.1f}%" if result.cpu_load is not None else "Unknown"
+                        print(f"  CPU Utilization: {cpu_str}")
+                        mem_str = f"{result.memory_gib} GiB" if result.memory_gib is not None else "Unknown"
+                        print(f"  Memory: {mem_str}")
+                        print(f"  Processors: {result.processor_summary}")
+                        if result.missing:
+                            print(f"  Missing (host budget exhausted): {result.missing}")
+                    else:
+                        # Basic status line
+                        watts_str = f"{result.watts}W" if result.watts is not None else "Unknown"
+                        if args.top and args.by == 'cpu':
+                            watts_str += f" | CPU: {result.cpu_load:.1f}%"
+                        missing_str = f" | Missing: {result.missing}" if result.missing else ""
+                        
+                        # For --all-nodes, show cluster/device prominently
+                        cluster_device_info = result.cluster or result.device or ""
+                        if args.all_nodes and cluster_device_info:
+                            # Format: IP | Cluster/Device | Model | S/N | Power | Watts | Health | iLO FW
+                            print(f"{ip} | {cluster_device_info} | {result.model} | {result.identifier} | Pwr: {result.power_state} | Use: {watts_str} | Health: {result.health} | iLO: {result.ilo_version}{missing_str}")
+                        else:
+                            # Original format for regular --file mode
+                            cluster_str = f"{cluster_device_info} | " if cluster_device_info else ""
+                            print(f"{ip} | {cluster_str}{result.model} | {result.identifier} | Pwr: {result.power_state} | Use: {watts_str} | Health: {result.health} | iLO: {result.ilo_version}{missing_str}")
+                
+                if args.by_cluster:
+                    print(f"\n{'Cluster':<40} {'Hosts':>6} {'OK':>6} {'Total W':>10} {'Avg W':>8} {'Peak W':>8} {'Avg CPU':>8}")
+                    fmt = lambda value, spec: format(value, spec) if value is not None else "-"
+                    for row in status_table.cluster_summary():
+                        print(f"{row['cluster'][:40]:<40} {row['hosts']:>6} {row['ok']:>6} {fmt(row['total_watts'], '.0f'):>10} "
+                              f"{fmt(row['avg_watts'], '.1f'):>8} {fmt(row['max_watts'], '.0f'):>8} {fmt(row['avg_cpu'], '.1f'):>8}")
+                
+            else:
+                # Original behavior - print as we go
+                success_count = 0
+                total_count = len(ilo_systems)
+                with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                    # Map get_system_status to each system, passing necessary args
+                    results = list(executor.map(
+                        lambda s: get_system_status(s, detailed=args.details, debug=args.debug, fast_mode=args.fast, ultra_fast=args.ultra_fast, budget=args.host_budget),
+                        ilo_systems
+                    ))
+                    # Count successful results (get_system_status returns True on success)
+                    success_count = sum(1 for r in results if r is True)
+            
+            print(f"Status check complete. Successfully retrieved status for {success_count}/{total_count} systems.")
+
+        elif args.power_watts:
+            print("Getting power consumption...")
+            results = []
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                def get_power(system):
+                    ip = system['ip']
+                    # Use a try-except block within the thread function for robustness
+                    try:
+                        with RedfishSession(system) as client:
+                            if client:
+                                identifier, _ = get_system_identifier(client, debug=args.debug)
+                                # Pass debug flag down
+                                watts = get_power_watts(client, ip, identifier, debug=args.debug)
+                                if watts is not None:
+                                    print(f"{ip}: {watts}W")
+                                    return watts
+                        return None # Return None if client failed or watts not found
+                    except (ConnectionError, AuthenticationError) as sess_err:
+                         # Errors already printed by RedfishSession context manager
+                         if args.debug: print(f"DEBUG [{ip}] Session error in get_power thread: {sess_err}")
+                         return None
+                    except Exception as e:
+                         print(f"Error getting power in thread for {ip}: {e}")
+                         if args.debug: print_exc()
+                         return None
+
+                results = list(executor.map(get_power, ilo_systems))
+
+            # Calculate total power using NumPy
+            np = load_numpy()
+            valid_results = np.array([w for w in results if w is not None], dtype=np.float64)
+            if len(valid_results) > 0:
+                total_watts = np.sum(valid_results)
+                avg_watts = np.mean(valid_results)
+                print(f"Total power consumption: {total_watts:.2f}W")
+                print(f"Average per server: {avg_watts:.2f}W")
+                print(f"Readings from {len(valid_results)} out of {len(ilo_systems)} servers")
+
+                # Save to CSV if requested
+                if args.output_csv:
+                    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    # Note: save_power_data_to_csv expects avg_cpu_load, pass None here
+                    saved_path = save_power_data_to_csv(
+                        args.output_csv, timestamp, total_watts, avg_watts,
+                        None, len(valid_results), len(ilo_systems)
+                    )
+                    if saved_path: print(f"Data saved to {saved_path}")
+            else:
+                print("No valid power readings obtained.")
+
+        elif args.monitor or args.monitor_power:
+            # Check if output CSV is provided
+            if not args.output_csv:
+                 print("Error: --output-csv is required for monitoring modes.")
+                 return
+            # Use standard monitoring function (includes CPU)
+            monitor_power(
+                ilo_systems=ilo_systems,
+                interval_minutes=args.interval,
+                output_csv=args.output_csv,
+                workers=args.workers,
+                debug=args.debug
+            )
+
+        elif args.monitor_full:
+             # Check if output CSV is provided
+            if not args.output_csv:
+                 print("Error: --output-csv is required for monitoring modes.")
+                 return
+            # Use comprehensive monitoring function
+            monitor_full(
+                ilo_systems=ilo_systems,
+                interval_minutes=args.interval,
+                output_csv=args.output_csv,
+                workers=args.workers,
+                debug=args.debug
+            )
+
+        elif args.get_cpu:
+            print("Getting CPU utilization...")
+            results = []
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                def get_cpu(system):
+                    ip = system['ip']
+                    try:
+                        with RedfishSession(system) as client:
+                            if client:
+                                identifier, _ = get_system_identifier(client, debug=args.debug)
+                                # Pass debug flag down
+                                cpu = get_cpu_utilization(client, ip, identifier, debug=args.debug)
+                                if cpu is not None:
+                                    print(f"{ip}: {cpu:.1f}%") # Format output
+                                    return cpu
+                        return None
+                    except (ConnectionError, AuthenticationError) as sess_err:
+                         if args.debug: print(f"DEBUG [{ip}] Session error in get_cpu thread: {sess_err}")
+                         return None
+                    except Exception as e:
+                         print(f"Error getting CPU in thread for {ip}: {e}")
+                         if args.debug: print_exc()
+                         return None
+
+                results = list(executor.map(get_cpu, ilo_systems))
+
+            # Calculate average CPU using NumPy
+            np = load_numpy()
+            valid_results = np.array([c for c in results if c is not None], dtype=np.float64)
+            if len(valid_results) > 0:
+                avg_cpu = np.mean(valid_results)
+                std_cpu = np.std(valid_results)  # Also calculate standard deviation with NumPy
+                min_cpu = np.min(valid_results)  # Min CPU value
+                max_cpu = np.max(valid_results)  # Max CPU value
+                
+                print(f"Average CPU utilization: {avg_cpu:.2f}%")
+                print(f"CPU utilization std dev: {std_cpu:.2f}%")
+                print(f"Min/Max CPU utilization: {min_cpu:.2f}% / {max_cpu:.2f}%")
+                print(f"Readings from {len(valid_results)} out of {len(ilo_systems)} servers")
+            else:
+                print("No valid CPU readings obtained.")
+
+        elif args.get_power_policy:
+            print("Getting power policy settings...")
+            # Use ThreadPoolExecutor for potentially faster checks
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                 # Map get_power_policy, passing the debug flag
+                 list(executor.map(lambda s: get_power_policy(s, debug=args.debug), ilo_systems))
+            print("Power policy check complete.")
+
+
+        elif args.set_power_policy:
+            # Confirm operation
+            if not args.yes:
+                confirm = input(f"Set power policy to '{args.set_power_policy}' for {len(ilo_systems)} system(s)? (y/n): ")
+                if confirm.lower() != 'y':
+                    print("Operation cancelled.")
+                    return
+
+            print(f"Setting power policy to '{args.set_power_policy}'...")
+            success_count = 0
+            # Use ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                 results = list(executor.map(
+                     lambda s: set_power_policy(s, args.set_power_policy, debug=args.debug), # Pass debug
+                     ilo_systems
+                 ))
+                 success_count = sum(1 for r in results if r is True)
+
+            print(f"Power policy update completed. Success: {success_count}/{len(ilo_systems)}")
+
+        elif args.power_on:
+            # Confirm operation
+            if not args.yes:
+                confirm = input(f"Power ON {len(ilo_systems)} system(s)? (y/n): ")
+                if confirm.lower() != 'y':
+                    print("Operation cancelled.")
+                    return
+
+            print("Powering on systems...")
+            success_count = 0
+            
+            # Use sequential processing with wait times for multiple systems
+            if len(ilo_systems) > 1 and args.wait > 0:
+                print(f"Processing {len(ilo_systems)} systems sequentially with {args.wait} second delays...")
+                for i, system in enumerate(ilo_systems, 1):
+                    ip = system.get('ip', 'Unknown')
+                    print(f"[{i}/{len(ilo_systems)}] Processing {ip}...")
+                    
+                    result = power_on_system(system, debug=args.debug)
+                    if result:
+                        success_count += 1
+                    
+                    # Wait between systems (except for the last one)
+                    if i < len(ilo_systems):
+                        print(f"Waiting {args.wait} seconds before next system...")
+                        time.sleep(args.wait)
+            else:
+                # Use ThreadPoolExecutor for single system or when wait is 0
+                with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                     results = list(executor.map(
+                         lambda s: power_on_system(s, debug=args.debug), # Pass debug
+                         ilo_systems
+                     ))
+                     success_count = sum(1 for r in results if r is True)
+
+            print(f"Power on completed. Success: {success_count}/{len(ilo_systems)}")
+
+        elif args.power_off or args.force_power_off:
+            force_mode = args.force_power_off
+            action = "Force power OFF" if force_mode else "Graceful shutdown"
+
+            # Confirm operation
+            if not args.yes:
+                confirm = input(f"{action} {len(ilo_systems)} system(s)? (y/n): ")
+                if confirm.lower() != 'y':
+                    print("Operation cancelled.")
+                    return
+
+            print(f"Performing {action.lower()}...")
+            success_count = 0
+            
+            # Use sequential processing with wait times for multiple systems
+            if len(ilo_systems) > 1 and args.wait > 0:
+                print(f"Processing {len(ilo_systems)} systems sequentially with {args.wait} second delays...")
+                for i, system in enumerate(ilo_systems, 1):
+                    ip = system.get('ip', 'Unknown')
+                    print(f"[{i}/{len(ilo_systems)}] Processing {ip}...")
+                    
+                    result = power_off_system(system, force=force_mode, debug=args.debug)
+                    if result:
+                        success_count += 1
+                    
+                    # Wait between systems (except for the last one)
+                    if i < len(ilo_systems):
+                        print(f"Waiting {args.wait} seconds before next system...")
+                        time.sleep(args.wait)
+            else:
+                # Use ThreadPoolExecutor for single system or when wait is 0
+                with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                     results = list(executor.map(
+                         lambda s: power_off_system(s, force=force_mode, debug=args.debug), # Pass debug
+                         ilo_systems
+                     ))
+                     success_count = sum(1 for r in results if r is True)
+
+            print(f"{action} completed. Success: {success_count}/{len(ilo_systems)}")
+
+    except KeyboardInterrupt:
+        print("Operation cancelled by user.")
+    except Exception as e:
+        print(f"Error: {e}")
+        print_exc()
+    finally:
+        policy = get_retry_policy()
+        if policy.budget_denied:
+            print(f"Retry budget exhausted: {policy.budget_denied} failed requests were not retried "
+                  f"({policy.describe()}). Raise it with --retry-budget.")
+        recorder = instrumentation.get_recorder()
+        if recorder is not None:
+            recorder.print_summary()
+            adapter = shared_adapter()
+            if adapter is not None:
+                stats = adapter.stats()
+                print(f"\n  TLS handshakes: {stats['handshakes']} ({stats['resumed']} resumed), "
+                      f"resumable TLS sessions for {stats['sessions']} iLOs")
+            if args.trace:
+                print(f"Request trace saved to {recorder.export(args.trace)}")
+
+def analyze_history_file(args):
+    """Run --analyze: load the monitoring history, print the analysis and optionally save it"""
+    from . import analytics  # pandas/NumPy heavy, only needed here
+    
+    if not Path(args.analyze).exists():
+        print(f"Error: File '{args.analyze}' not found")
+        return
+    systems = None
+    if args.file or args.all_nodes:
+        systems = read_ilo_systems(args.file or args.all_nodes, args.debug, cache_dir=INVENTORY_CACHE_DIR)
+    
+    print(f"Loading monitoring history: {args.analyze}")
+    start = time.perf_counter()
+    history = analytics.load_history(args.analyze, systems)
+    if history.empty:
+        print("No samples found in the history file.")
+        return
+    analysis = analytics.analyze_history(history, window=args.window, idle_cpu=args.idle_cpu,
+                                         idle_watts=args.idle_watts, psu_capacity=args.psu_capacity)
+    if args.debug:
+        print(f"DEBUG: Loaded and analyzed {len(history)} samples in {time.perf_counter() - start:.2f}s")
+    analytics.print_analysis(analysis, top=args.top or 20, window=args.window)
+    
+    if args.output_csv:
+        host_path, cluster_path = analytics.save_analysis(analysis, args.output_csv)
+        print(f"\nPer-host analysis saved to {host_path}, per-cluster analysis to {cluster_path}")
+
+# Simple test function to directly test the redfish client
+def test_redfish_direct(ip, username, password):
+    """Simple test of redfish connectivity"""
+    print(f"Testing direct redfish connection to {ip}")
+    debug = True # Enable debug for this test function
+    redfish = load_redfish()
+
+    try:
+        print("Creating redfish client...")
+        client = redfish.redfish_client(
+            base_url=f"https://{ip}",
+            username=username,
+            password=password,
+            default_prefix='/redfish/v1'
+        )
+
+        # Disable SSL warnings
+        if hasattr(client, 'session'):
+            client.session.verify = False
+
+        print("Logging in...")
+        # Using the RedfishSession context manager is preferred even for tests
+        system_info = {'ip': ip, 'username': username, 'password': password}
+        with RedfishSession(system_info) as test_client: # Use context manager
+            if not test_client:
+                 print("Login failed via RedfishSession.")
+                 return # Exit if session failed
+
+            print("Login successful!")
+
+            print("Getting system information...")
+            response = test_client.get(REDFISH_SYSTEM_PATH)
+            print(f"Response status: {response.status}")
+            data = safe_get_json(response, ip, debug, context="Test System Info") # Use safe helper
+
+            if data:
+                print(f"System Model: {data.get('Model', 'Unknown')}")
+                print(f"Serial Number: {data.get('SerialNumber', 'Unknown')}")
+                print(f"Power State: {data.get('PowerState', 'Unknown')}")
+            else:
+                print("Could not retrieve or parse system data.")
+
+            # No explicit logout needed with context manager
+            print("Session automatically logged out.")
+        
+        print("Test completed successfully")
+
+    except (ConnectionError, AuthenticationError) as sess_err:
+         print(f"Test failed during session setup: {sess_err}")
+    except Exception as e:
+        print(f"Test failed with unexpected error: {e}")
+        print_exc()
@@ -0,0 +1,296 @@
+"""
+Redfish sessions for HPE iLO: connection/login and GETs with policy-driven retries and optional instrumentation
+"""
+
+import logging
+import time
+
+from .deadline import DeadlineExceeded
+from .decoding import json_loads, response_body
+from .deps import load_redfish
+from .instrumentation import get_recorder
+from .retry import get_retry_policy
+
+logger = logging.getLogger(__name__)
+
+# Redfish API Path Constants
+REDFISH_SYSTEM_PATH = "/redfish/v1/Systems/1"
+REDFISH_CHASSIS_PATH = "/redfish/v1/Chassis/1"
+REDFISH_MANAGER_PATH = "/redfish/v1/Managers/1"
+REDFISH_POWER_PATH = f"{REDFISH_CHASSIS_PATH}/Power"
+REDFISH_POWER_SUBSYSTEM_METRICS_PATH = f"{REDFISH_CHASSIS_PATH}/PowerSubsystem/PowerMetrics"
+REDFISH_BIOS_PATH = f"{REDFISH_SYSTEM_PATH}/Bios"
+REDFISH_BIOS_SETTINGS_PATH = f"{REDFISH_BIOS_PATH}/Settings"
+REDFISH_SYSTEM_METRICS_PATH = f"{REDFISH_SYSTEM_PATH}/Metrics"
+REDFISH_PROCESSOR_SUMMARY_METRICS_PATH = f"{REDFISH_SYSTEM_PATH}/ProcessorSummary/ProcessorMetrics"
+REDFISH_PROCESSOR_COLLECTION_PATH = f"{REDFISH_SYSTEM_PATH}/Processors"
+REDFISH_HPE_PROCESSOR_COLLECTION_PATH = f"{REDFISH_SYSTEM_PATH}/Oem/Hpe/Processors"
+REDFISH_RESET_ACTION_PATH = f"{REDFISH_SYSTEM_PATH}/Actions/ComputerSystem.Reset"
+REDFISH_HPE_POWER_MANAGEMENT_PATH = f"{REDFISH_SYSTEM_PATH}/Oem/Hpe/PowerManagement" # Used experimentally in set_power_policy
+
+# Simple connection exception classes
+class ConnectionError(Exception):
+    pass
+
+class AuthenticationError(Exception):
+    pass
+
+def shared_adapter():
+    """The process-wide pooled HTTPS adapter (ilo_power.transport), None if connection reuse is disabled"""
+    from .transport import get_adapter
+    return get_adapter()
+
+def unreachable_errors():
+    """Exception classes raised when an iLO cannot be reached (redfish's and ours)"""
+    return (load_redfish().rest.v1.ServerDownOrUnreachableError, ConnectionError)
+
+class SessionClient:
+    """Wraps a redfish client to retry idempotent GETs under a RetryPolicy, bound GETs by a host Deadline
+    and/or time every get/post/patch into the active recorder. POST and PATCH are never retried.
+
+    With a deadline every GET gets the remaining budget as its timeout (at most its own or
+    default_timeout), and raises DeadlineExceeded once the budget is spent."""
+
+    def __init__(self, client, ip, recorder=None, policy=None, max_retries=0, base_delay=None, debug=False,
+                 deadline=None, default_timeout=None):
+        self._client = client
+        self._ip = ip
+        self._recorder = recorder
+        self._policy = policy
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._debug = debug
+        self._deadline = deadline
+        self._default_timeout = default_timeout
+
+    def _timed(self, method, func, path, *args, retries=0, **kwargs):
+        if self._recorder is None:
+            return func(path, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            resp = func(path, *args, **kwargs)
+        except Exception as e:
+            self._recorder.record(self._ip, method, path, None, 0, start, time.perf_counter() - start,
+                                  retries=retries, error=type(e).__name__)
+            raise
+        duration = time.perf_counter() - start
+        body = response_body(resp) if resp is not None else None
+        status = getattr(resp, 'status', None)
+        self._recorder.record(self._ip, method, path, status, len(body) if body else 0, start, duration,
+                              retries=retries)
+        if status == 200 and path.rstrip('/') == REDFISH_MANAGER_PATH and self._ip not in self._recorder.host_tags:
+            manager = json_loads(body) if body else {}
+            self._recorder.tag_host(self._ip, manager.get('Model') or manager.get('FirmwareVersion', 'Unknown').split(' v')[0])
+        return resp
+
+    def _retry_delay(self, attempt):
+        """Backoff before retry `attempt`, None if the policy, its budget or the host deadline rule it out"""
+        delay = self._policy.backoff(attempt, self._base_delay)
+        if self._deadline is not None and not self._deadline.allows(delay):
+            return None
+        return delay if self._policy.acquire(attempt, self._max_retries) else None
+
+    def get(self, path, *args, **kwargs):
+        attempt = 0
+        while True:
+            if self._deadline is not None:
+                kwargs['timeout'] = self._deadline.timeout(kwargs.get('timeout') or self._default_timeout)
+            try:
+                resp = self._timed('GET', self._client.get, path, *args, retries=attempt, **kwargs)
+            except Exception as e:
+                if self._deadline is not None and self._deadline.expired:
+                    raise DeadlineExceeded(f"GET {path}: host budget of {self._deadline.budget:g}s exhausted") from e
+                delay = self._retry_delay(attempt) if self._policy is not None and self._policy.is_retryable(e) else None
+                if delay is None:
+                    raise
+                reason = type(e).__name__
+            else:
+                status = getattr(resp, 'status', None)
+                delay = self._retry_delay(attempt) \
+                    if self._policy is not None and self._policy.is_retryable_status(status) else None
+                if delay is None:
+                    return resp
+                reason = f"HTTP {status}"
+            if self._debug:
+                logger.debug(f"[{self._ip}] GET {path} failed ({reason}), retry {attempt + 1} in {delay:.2f}s")
+            time.sleep(delay)
+            attempt += 1
+
+    def post(self, path, *args, **kwargs):
+        return self._timed('POST', self._client.post, path, *args, **kwargs)
+
+    def patch(self, path, *args, **kwargs):
+        return self._timed('PATCH', self._client.patch, path, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+# Improved Redfish client class with retry logic
+class RedfishSession:
+    """Context manager for Redfish client sessions with improved error handling and retry logic.
+
+    Connect, login and GETs are retried under a RetryPolicy (the module-wide one from
+    ilo_power.retry unless `retry_policy` is given): only transient errors, with jittered
+    exponential backoff, and only while the policy's retry budget lasts.
+
+    With a `deadline` the connect and login timeouts and the timeout of every GET are capped at the
+    remaining host budget, and no retry is started that would not fit into it.
+
+    Args:
+        system_info (dict): 'ip', 'username' and 'password' of the iLO
+        max_retries (int): Retries per connect/login or GET, overriding the policy
+        retry_delay (float): Backoff scale in seconds, overriding the policy
+        ultra_fast (bool): Short timeouts and no retries
+        retry_policy (RetryPolicy): Policy to use instead of the module-wide one
+        deadline (Deadline): Time budget of the host visit
+    """
+    
+    def __init__(self, system_info, max_retries=None, retry_delay=None, ultra_fast=False, retry_policy=None,
+                 deadline=None):
+        self.ip = system_info['ip']
+        self.username = system_info['username']
+        self.password = system_info['password']
+        self.client = None
+        self.debug = False  # Add a debug flag
+        self.policy = retry_policy or get_retry_policy()
+        self.max_retries = 0 if ultra_fast else (self.policy.max_retries if max_retries is None else max_retries)
+        self.retry_delay = retry_delay  # None = the policy's base delay
+        self.ultra_fast = ultra_fast
+        self.deadline = deadline
+
+    @property
+    def timeout(self):
+        """Default request timeout in seconds (connect, login and GETs without their own timeout)"""
+        return 3 if self.ultra_fast else 10
+
+    def __enter__(self):
+        redfish = load_redfish()
+        retries = 0
+        
+        while True:
+            try:
+                # Create redfish client with timeout for ultra-fast mode, within the host budget
+                timeout = self.timeout if self.deadline is None else self.deadline.timeout(self.timeout)
+                start = time.perf_counter()
+                try:
+                    self.client = redfish.redfish_client(
+                        base_url=f"https://{self.ip}",
+                        username=self.username,
+                        password=self.password,
+                        default_prefix='/redfish/v1',
+                        timeout=timeout,
+                        max_retry=0,  # Retries are ours (RetryPolicy), not redfish's fixed 10 x 1s
+                        https_adapter=shared_adapter()  # Pooled keep-alive + TLS session resumption
+                    )
+                finally:
+                    # Client creation fetches the service root
+                    self._record('CONNECT', '/redfish/v1', start, retries, self.client is None)
+
+                # Disable SSL verification
+                if hasattr(self.client, 'session'):
+                    self.client.session.verify = False
+
+                # Try login with session auth first, then basic if needed
+                try:
+                    start = time.perf_counter()
+                    self._login("session")
+                    self._record('LOGIN', 'session', start, retries)
+                    if self.debug and retries > 0:
+                        logger.debug(f"[{self.ip}] Connected successfully after {retries} retries")
+                    return self._wrap(self.client)
+                except DeadlineExceeded:
+                    raise  # No budget left to log in - reported as a connection failure below
+                except Exception as e:
+                    self._record('LOGIN', 'session', start, retries, type(e).__name__)
+                    if self.debug: 
+                        logger.debug(f"[{self.ip}] Session auth failed: {e}, trying basic auth...")
+                    try:
+                        start = time.perf_counter()
+                        self._login("basic")
+                        self._record('LOGIN', 'basic', start, retries)
+                        if self.debug and retries > 0:
+                            logger.debug(f"[{self.ip}] Connected with basic auth after {retries} retries")
+                        return self._wrap(self.client)
+                    except DeadlineExceeded:
+                        raise
+                    except Exception as basic_e:
+                        self._record('LOGIN', 'basic', start, retries, type(basic_e).__name__)
+                        if self.client:
+                            try: self.client.logout()
+                            except: pass
+                        self.client = None
+                        if self.policy.is_retryable(basic_e):
+                            raise  # Transient (iLO busy/unreachable) - retried below
+                        logger.error(f"Login failed for {self.ip} with both session and basic auth.")
+                        if self.debug:
+                            logger.error(f"  Session Error: {e}")
+                            logger.error(f"  Basic Error: {basic_e}")
+                        raise AuthenticationError(f"Login failed for {self.ip}") from basic_e
+                    
+            except AuthenticationError:
+                # Don't retry auth errors - they're unlikely to succeed on retry
+                raise
+                
+            except Exception as e:
+                self.client = None
+                if self.deadline is not None and self.deadline.expired:
+                    logger.error(f"Connection Error connecting to {self.ip}: {e} "
+                          f"(host budget of {self.deadline.budget:g}s exhausted after {retries} retries)")
+                    raise ConnectionError(f"Connection failed for {self.ip} within the host budget") from e
+                transient = self.policy.is_retryable(e)
+                if not transient or not self.policy.acquire(retries, self.max_retries):
+                    if not transient:
+                        logger.error(f"Generic Error connecting to {self.ip}: {e} (after {retries} retries)")
+                        raise ConnectionError(f"Unhandled exception during connection to {self.ip}") from e
+                    budget_note = " - retry budget exhausted" if self.policy.budget_exhausted else ""
+                    logger.error(f"Connection Error connecting to {self.ip}: {e} (after {retries} retries{budget_note})")
+                    raise ConnectionError(f"Connection failed for {self.ip}") from e
+                delay = self.policy.backoff(retries, self.retry_delay)
+                if self.deadline is not None and not self.deadline.allows(delay):
+                    logger.error(f"Connection Error connecting to {self.ip}: {e} "
+                          f"(no host budget left for retry {retries + 1})")
+                    raise ConnectionError(f"Connection failed for {self.ip} within the host budget") from e
+                if self.debug:
+                    logger.debug(f"[{self.ip}] Connection attempt {retries+1} failed: {e}, retrying in {delay:.2f}s...")
+                time.sleep(delay)
+                retries += 1
+
+    def _login(self, auth):
+        """Log in, with the login request's timeout capped at the host budget left after connecting.
+
+        Raises:
+            DeadlineExceeded: No budget left to log in
+        """
+        if self.deadline is not None:
+            # redfish's login has no timeout argument - it uses the client's timeout set at creation
+            self.client._timeout = self.deadline.timeout(self.timeout)
+        self.client.login(auth=auth)
+
+    def _record(self, method, endpoint, start, retries, error=None):
+        """Record a connect/login step when instrumentation is enabled"""
+        recorder = get_recorder()
+        if recorder is not None:
+            if error is True:
+                error = 'ConnectFailed'
+            recorder.record(self.ip, method, endpoint, None, 0, start, time.perf_counter() - start,
+                             retries=retries, error=error or None)
+
+    def _wrap(self, client):
+        """Wrap the client for GET retries, the host deadline and/or per-request timing (the bare client if
+        none applies)"""
+        recorder = get_recorder()
+        if recorder is None and self.max_retries <= 0 and self.deadline is None:
+            return client
+        return SessionClient(client, self.ip, recorder, self.policy if self.max_retries > 0 else None,
+                             self.max_retries, self.retry_delay, self.debug, self.deadline, self.timeout)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.client:
+            try:
+                start = time.perf_counter()
+                self.client.logout()
+                self._record('LOGOUT', 'session', start, 0)
+            except Exception as e:
+                if self.debug:
+                    logger.debug(f"[{self.ip}] Error during logout: {e}")
+        self.client = None
@@ -0,0 +1,934 @@
+"""
+Per-host Redfish collectors: identity, power, CPU, status, power actions and policies
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import (
+    REDFISH_BIOS_PATH, REDFISH_BIOS_SETTINGS_PATH, REDFISH_HPE_PROCESSOR_COLLECTION_PATH, REDFISH_MANAGER_PATH,
+    REDFISH_POWER_PATH, REDFISH_POWER_SUBSYSTEM_METRICS_PATH, REDFISH_PROCESSOR_COLLECTION_PATH,
+    REDFISH_PROCESSOR_SUMMARY_METRICS_PATH, REDFISH_RESET_ACTION_PATH, REDFISH_SYSTEM_METRICS_PATH,
+    REDFISH_SYSTEM_PATH, AuthenticationError, ConnectionError, RedfishSession, unreachable_errors,
+)
+from .deadline import Deadline, DeadlineExceeded
+from .decoding import safe_get_json
+from .deps import print_exc
+from .status import HostStatus
+
+logger = logging.getLogger(__name__)
+
+# Member GETs in flight per host when walking a collection (Processors, Memory, PowerSupplies, ...).
+# iLOs serve only a few requests at once, so keep this small; it also matches the per-iLO pool size.
+MEMBER_FETCH_CONCURRENCY = 3
+
+# Time budget per host in get_system_status (seconds): every request of a host visit gets the remaining budget
+# as its timeout, so one slow iLO cannot hold a worker longer than this
+HOST_BUDGET = 60.0
+FAST_HOST_BUDGET = 20.0
+ULTRA_FAST_HOST_BUDGET = 8.0
+
+def host_budget(fast_mode=False, ultra_fast=False):
+    """Default host budget in seconds for the given mode"""
+    if ultra_fast:
+        return ULTRA_FAST_HOST_BUDGET
+    return FAST_HOST_BUDGET if fast_mode else HOST_BUDGET
+
+def get_collection_members(client, collection, ip, debug=False, timeout=10, max_in_flight=None, context="Member"):
+    """Fetch every member of a Redfish collection, with up to max_in_flight GETs in flight on the same session.
+
+    The concurrent GETs share the logged-in client (one session token) but not a connection: each request
+    takes its own connection from the client's pool.
+
+    Args:
+        client: Logged-in redfish client (as returned by RedfishSession)
+        collection (str or dict): Collection path, or the already fetched collection document
+        ip (str): iLO address, for debug output
+        debug (bool): Print debug information
+        timeout (int): Timeout per GET in seconds
+        max_in_flight (int): Concurrent member GETs (default MEMBER_FETCH_CONCURRENCY, 1 = sequential)
+        context (str): Label for debug output
+
+    Returns:
+        list: (member_path, member document or None if it could not be fetched) per member, in collection order
+    """
+    if isinstance(collection, str):
+        collection = safe_get_json(client.get(collection, timeout=timeout), ip, debug, context=f"{context} Collection")
+    members = (collection or {}).get("Members")
+    if not isinstance(members, list):
+        return []
+    paths = [member["@odata.id"] for member in members if isinstance(member, dict) and "@odata.id" in member]
+
+    def fetch(path):
+        try:
+            return path, safe_get_json(client.get(path, timeout=timeout), ip, debug, context=f"{context} {path}")
+        except unreachable_errors() as ce:
+            if debug: logger.debug(f"[{ip}] Connection error getting {path}: {ce}")
+        except Exception as e:
+            if debug: logger.debug(f"[{ip}] Error fetching {path}: {e}")
+        return path, None
+
+    max_in_flight = MEMBER_FETCH_CONCURRENCY if max_in_flight is None else max_in_flight
+    if len(paths) <= 1 or max_in_flight <= 1:
+        return [fetch(path) for path in paths]
+    # Sharing the client between threads is safe for GETs with redfish 3.x (pinned in setup.py): each
+    # RestClient.get builds its headers in a new dict from the session key set at login and keeps its retry
+    # state in locals, and requests' Session only reads its shared headers/auth per request (its cookie jar
+    # is locked). The connections come from the urllib3 pool, which hands one to each thread. Login,
+    # logout and other calls that change the client's auth state must not run while members are fetched.
+    with ThreadPoolExecutor(max_workers=min(max_in_flight, len(paths))) as executor:
+        return list(executor.map(fetch, paths))
+
+def get_system_identifier(client, debug=False):
+    """Get server identifier (serial number or asset tag) and model"""
+    identifier, model = "Unknown", "Unknown"
+    ip = client.get_base_url().split('//')[-1] # Get IP from client base URL for debug
+    try:
+        resp = client.get(REDFISH_SYSTEM_PATH)
+        data = safe_get_json(resp, ip, debug)
+
+        if data:
+            asset_tag = data.get("AssetTag", "")
+            serial_number = data.get("SerialNumber", "")
+            model = data.get("Model", "Unknown")
+            # Prioritize Asset Tag if available, otherwise use Serial Number
+            identifier = asset_tag if asset_tag and asset_tag.strip() else serial_number
+        # Debug message handled within _safe_get_json if parsing fails
+        
+    except Exception as e:
+        if debug: logger.debug(f"[{ip}] Error in get_system_identifier GET request: {e}")
+        # Identifier and model remain "Unknown"
+        
+    return identifier, model
+
+
+def get_power_watts(client, ip, identifier, debug=False, timeout=10):
+    """Get power consumption in watts with multiple attempts and improved error handling"""
+    watts = None
+    endpoints_tried = []
+    
+    try:
+        # Method 1: Standard Chassis power endpoint
+        endpoints_tried.append(REDFISH_POWER_PATH)
+        try:
+            resp = client.get(endpoints_tried[-1], timeout=timeout)
+            data = safe_get_json(resp, ip, debug, context="Method 1")
+            
+            if data:
+                if debug: logger.debug(f"[{ip}] Power Response 1 (JSON): {data}")
+                if "PowerControl" in data and isinstance(data["PowerControl"], list) and len(data["PowerControl"]) > 0:
+                    for pc in data["PowerControl"]:
+                        if "PowerConsumedWatts" in pc:
+                            watts = pc.get("PowerConsumedWatts")
+                            if watts is not None:
+                                if debug: logger.debug(f"[{ip}] Power found via PowerControl: {watts}W")
+                                return watts # Return first valid reading
+        except unreachable_errors() as ce:
+            if debug: logger.debug(f"[{ip}] Connection error in Method 1: {ce}")
+        except Exception as e:
+            if debug: logger.debug(f"[{ip}] Error in Method 1: {e}")
+        # Error logging handled by _safe_get_json
+
+        # Method 2: Alternative endpoint (iLO 5/6 common)
+        if watts is None:
+            endpoints_tried.append(REDFISH_POWER_SUBSYSTEM_METRICS_PATH)
+            try:
+                resp_alt = client.get(endpoints_tried[-1], timeout=timeout)
+                data_alt = safe_get_json(resp_alt, ip, debug, context="Method 2")
+                
+                if data_alt:
+                    if debug: logger.debug(f"[{ip}] Power Response 2 (JSON): {data_alt}")
+                    if "PowerMetrics" in data_alt and isinstance(data_alt["PowerMetrics"], dict) and "PowerConsumedWatts" in data_alt["PowerMetrics"]:
+                         watts = data_alt["PowerMetrics"].get("PowerConsumedWatts") # Check nested structure
+                    elif "PowerConsumedWatts" in data_alt: # Check direct key
+                        watts = data_alt.get("PowerConsumedWatts")
+                    elif "PowerWatts" in data_alt: # Check alternative key
+                         watts = data_alt.get("PowerWatts")
+
+                    if watts is not None:
+                        if debug: logger.debug(f"[{ip}] Power found via PowerSubsystem/PowerMetrics: {watts}W")
+                        return watts
+            except unreachable_errors() as ce:
+                if debug: logger.debug(f"[{ip}] Connection error in Method 2: {ce}")
+            except Exception as e:
+                if debug: logger.debug(f"[{ip}] Error in Method 2: {e}")
+            # Error logging handled by _safe_get_json
+
+        # Method 3: Check System OEM data (less common for power, but worth a try)
+        if watts is None:
+             endpoints_tried.append(f"{REDFISH_SYSTEM_PATH} (OEM Check)")
+             try:
+                 resp_sys = client.get(REDFISH_SYSTEM_PATH, timeout=timeout)
+                 sys_data = safe_get_json(resp_sys, ip, debug, context="Method 3 OEM")
+                 
+                 if sys_data and "Oem" in sys_data:
+                     oem_data = sys_data.get("Oem", {})
+                     hpe_data = oem_data.get("Hpe", oem_data.get("Hp", {}))
+                     if "PowerConsumedWatts" in hpe_data:
+                         watts = hpe_data.get("PowerConsumedWatts")
+                         if watts is not None:
+                             if debug: logger.debug(f"[{ip}] Power found via System OEM: {watts}W")
+                             return watts
+             except unreachable_errors() as ce:
+                 if debug: logger.debug(f"[{ip}] Connection error in Method 3: {ce}")
+             except Exception as e:
+                 if debug: logger.debug(f"[{ip}] Error in Method 3: {e}")
+             # Error logging handled by _safe_get_json
+
+        # If still not found after all methods
+        if watts is None:
+            if debug: logger.debug(f"[{ip}] Power not found. Endpoints tried: {endpoints_tried}")
+            return None
+        else:
+             # Should have returned earlier if found, but handle case just in case
+             if debug: logger.debug(f"[{ip}] Power found (at end): {watts}W")
+             return watts
+
+    except Exception as e:
+        logger.error(f"Error getting power for {ip} ({identifier}): {e}")
+        if debug:
+            logger.debug(f"[{ip}] Endpoints tried before error: {endpoints_tried}")
+            print_exc()
+        return None
+
+def get_cpu_utilization(client, ip, identifier, debug=False, timeout=10):
+    """Get CPU utilization using various methods common in HPE iLO with improved error handling"""
+    cpu_load = None
+    methods_tried = []
+
+    # Method 1: System OEM data (Often present in iLO 5/6)
+    try:
+        methods_tried.append("System OEM Hpe/Hp")
+        try:
+            resp = client.get(REDFISH_SYSTEM_PATH, timeout=timeout)
+            data = safe_get_json(resp, ip, debug, context="Method 1 OEM")
+            
+            if data and "Oem" in data:
+                oem_data = data.get("Oem", {})
+                hpe_data = oem_data.get("Hpe", oem_data.get("Hp", {}))
+                if debug: logger.debug(f"[{ip}] System OEM Data: {hpe_data}")
+
+                # First check common ProcessorUtilization key
+                if hpe_data and "ProcessorUtilization" in hpe_data:
+                    cpu_load = hpe_data.get("ProcessorUtilization")
+                    if cpu_load is not None:
+                        if debug: logger.debug(f"[{ip}] CPU via System OEM (ProcessorUtilization): {cpu_load}%")
+                        return cpu_load
+
+                # Check SystemUsage -> CPUUtil key
+                elif hpe_data and "SystemUsage" in hpe_data and isinstance(hpe_data["SystemUsage"], dict):
+                     system_usage = hpe_data["SystemUsage"]
+                     if "CPUUtil" in system_usage:
+                          cpu_load = system_usage.get("CPUUtil")
+                          if cpu_load is not None:
+                               if debug: logger.debug(f"[{ip}] CPU via System OEM (SystemUsage.CPUUtil): {cpu_load}%")
+                               return cpu_load
+
+                # Fallback debug check for other potential keys
+                elif debug:
+                    potential_keys = [k for k in hpe_data if 'util' in k.lower() or 'load' in k.lower()]
+                    if potential_keys:
+                         logger.debug(f"[{ip}] System OEM primary CPU keys not found, but found potential keys: {potential_keys}")
+        except unreachable_errors() as ce:
+            if debug: logger.debug(f"[{ip}] Connection error in Method 1: {ce}")
+        except Exception as e:
+            if debug: logger.debug(f"[{ip}] Error in Method 1: {e}")
+
+    except Exception as e:
+        if debug: logger.debug(f"[{ip}] CPU Method 1 Error: {e}")
+
+    # Method 2: System Metrics endpoint (Common in newer Redfish implementations)
+    if cpu_load is None:
+        try:
+            methods_tried.append("System Metrics")
+            try:
+                metrics_resp = client.get(REDFISH_SYSTEM_METRICS_PATH, timeout=timeout)
+                metrics_data = safe_get_json(metrics_resp, ip, debug, context="Method 2 Metrics")
+                if metrics_data:
+                    if "ProcessorSummary" in metrics_data and isinstance(metrics_data["ProcessorSummary"], dict) and "CPUUtilization" in metrics_data["ProcessorSummary"]:
+                        cpu_load = metrics_data["ProcessorSummary"].get("CPUUtilization") # Nested path
+                    elif "CPUUtilization" in metrics_data: # Direct path
+                        cpu_load = metrics_data.get("CPUUtilization")
+
+                    if cpu_load is not None:
+                        if debug: logger.debug(f"[{ip}] CPU via System Metrics: {cpu_load}%")
+                        return cpu_load
+            except unreachable_errors() as ce:
+                if debug: logger.debug(f"[{ip}] Connection error in Method 2: {ce}")
+            except Exception as e:
+                if debug: logger.debug(f"[{ip}] Error in Method 2: {e}")
+        except Exception as e:
+            if debug: logger.debug(f"[{ip}] CPU Method 2 Error: {e}")
+
+    # Method 3: Processor Summary Metrics (Also common in newer implementations)
+    if cpu_load is None:
+        try:
+            methods_tried.append("Processor Summary Metrics")
+            try:
+                proc_resp = client.get(REDFISH_PROCESSOR_SUMMARY_METRICS_PATH, timeout=timeout)
+                proc_data = safe_get_json(proc_resp, ip, debug, context="Method 3 Proc Summary")
+                if proc_data:
+                    # Common keys: TotalCorePercent, AverageFrequencyMHz, CPUUtilizationPercent
+                    if "TotalCorePercent" in proc_data:
+                        cpu_load = proc_data.get("TotalCorePercent")
+                    elif "CPUUtilizationPercent" in proc_data:
+                        cpu_load = proc_data.get("CPUUtilizationPercent")
+
+                    if cpu_load is not None:
+                        if debug: logger.debug(f"[{ip}] CPU via Processor Summary: {cpu_load}%")
+                        return cpu_load
+            except unreachable_errors() as ce:
+                if debug: logger.debug(f"[{ip}] Connection error in Method 3: {ce}")
+            except Exception as e:
+                if debug: logger.debug(f"[{ip}] Error in Method 3: {e}")
+        except Exception as e:
+            if debug: logger.debug(f"[{ip}] CPU Method 3 Error: {e}")
+
+    # Method 4: Iterate through Individual Processors (More complex, checks OEM data per CPU)
+    if cpu_load is None:
+        try:
+            methods_tried.append("Individual Processors OEM")
+            try:
+                proc_coll_resp = client.get(REDFISH_PROCESSOR_COLLECTION_PATH, timeout=timeout)
+                proc_collection = safe_get_json(proc_coll_resp, ip, debug, context="Method 4 Proc Collection")
+                
+                if proc_collection and "Members" in proc_collection and isinstance(proc_collection["Members"], list):
+                     cpu_loads = []
+                     # Processor details are fetched a few at a time (see get_collection_members)
+                     for proc_url, proc_detail in get_collection_members(client, proc_collection, ip, debug, timeout,
+                                                                         context="Method 4 Detail"):
+                         if proc_detail and "Oem" in proc_detail:
+                             oem_proc = proc_detail.get("Oem", {})
+                             hpe_proc = oem_proc.get("Hpe", oem_proc.get("Hp", {}))
+                             # Add specific debug print for the processor OEM dict
+                             if debug: logger.debug(f"[{ip}] Processor {proc_url} OEM Data: {hpe_proc}")
+                             util = None
+                             if "CurrentUtilization" in hpe_proc:
+                                 util = hpe_proc["CurrentUtilization"]
+                             elif "ProcessorUtilization" in hpe_proc:
+                                 util = hpe_proc["ProcessorUtilization"]
+                             elif "UtilizationPercent" in hpe_proc:
+                                 util = hpe_proc["UtilizationPercent"]
+
+                             if util is not None and isinstance(util, (int, float)):
+                                  cpu_loads.append(util)
+                                  if debug: logger.debug(f"[{ip}] Found CPU load {util}% for {proc_url} via OEM")
+                             # Add check for other potential keys if debug
+                             elif debug:
+                                 potential_keys = [k for k in hpe_proc if 'util' in k.lower() or 'load' in k.lower()]
+                                 if potential_keys:
+                                     logger.debug(f"[{ip}] Processor {proc_url} OEM util not found, but found potential keys: {potential_keys}")
+
+                     # Calculate average CPU load if we collected any
+                     if cpu_loads:
+                         # Use numpy for better numerical precision
+                         cpu_load = sum(cpu_loads) / len(cpu_loads)
+                         if debug: logger.debug(f"[{ip}] CPU via Individual Processors OEM avg: {cpu_load}%")
+                         return cpu_load
+            except unreachable_errors() as ce:
+                if debug: logger.debug(f"[{ip}] Connection error in Method 4: {ce}")
+            except Exception as e:
+                if debug: logger.debug(f"[{ip}] Error in Method 4: {e}")
+        except Exception as e:
+             if debug: logger.debug(f"[{ip}] CPU Method 4 Error: {e}")
+
+    # Method 5: HPE Specific Processor Collection (Alternative OEM path)
+    if cpu_load is None:
+         try:
+            methods_tried.append("HPE Processor Collection")
+            try:
+                proc_resp = client.get(REDFISH_HPE_PROCESSOR_COLLECTION_PATH, timeout=timeout) # Note specific Hpe path
+                proc_data = safe_get_json(proc_resp, ip, debug, context="Method 5 HPE Proc Collection")
+
+                if proc_data and "Members" in proc_data and isinstance(proc_data["Members"], list) and len(proc_data["Members"]) > 0:
+                     # Often contains 'AverageProcessorUtilization' directly
+                     if "AverageProcessorUtilization" in proc_data:
+                         cpu_load = proc_data.get("AverageProcessorUtilization")
+                         if cpu_load is not None:
+                             if debug: logger.debug(f"[{ip}] CPU via HPE Processor Collection (Avg): {cpu_load}%")
+                             return cpu_load
+                     # Fallback: average individual members if avg not present
+                     else:
+                         cpu_loads = []
+                         for member in proc_data["Members"]:
+                              # Keys might be ProcessorUtilization, Utilization, etc.
+                              util = None
+                              if "ProcessorUtilization" in member: util = member["ProcessorUtilization"]
+                              elif "Utilization" in member: util = member["Utilization"]
+
+                              if util is not None and isinstance(util, (int, float)):
+                                   cpu_loads.append(util)
+                         if cpu_loads:
+                              # Use numpy for better numerical precision
+                              cpu_load = sum(cpu_loads) / len(cpu_loads)
+                              if debug: logger.debug(f"[{ip}] CPU via HPE Processor Collection (Member Avg): {cpu_load}%")
+                              return cpu_load
+                # _safe_get_json handles non-200 responses including 404
+                elif debug and proc_resp and proc_resp.status == 404:
+                     logger.debug(f"[{ip}] HPE Processor Collection path not found (404).")
+            except unreachable_errors() as ce:
+                if debug: logger.debug(f"[{ip}] Connection error in Method 5: {ce}")
+            except Exception as e:
+                if debug: logger.debug(f"[{ip}] Error in Method 5: {e}")
+         except Exception as e:
+            if debug: logger.debug(f"[{ip}] CPU Method 5 Error: {e}")
+
+    # If CPU load still not found
+    if cpu_load is None:
+        if debug:
+            logger.warning(f"[{ip}] CPU utilization not found after trying: {', '.join(methods_tried)}")
+        return None
+    else:
+        # Should have returned earlier, but handle just in case
+        if debug: logger.debug(f"[{ip}] Final CPU load found: {cpu_load}%")
+        return cpu_load
+
+def get_power_status(client, ip, debug=False):
+    """Get server power status"""
+    power_state = "Unknown"
+    try:
+        resp = client.get(REDFISH_SYSTEM_PATH)
+        data = safe_get_json(resp, ip, debug)
+        if data:
+            power_state = data.get("PowerState", "Unknown")
+        # Error reporting handled by _safe_get_json
+        
+    except Exception as e:
+        if debug: logger.debug(f"[{ip}] Error in get_power_status GET request: {e}")
+        # power_state remains "Unknown"
+        
+    # Map potential JSON parsing issues reported by _safe_get_json to status strings
+    if data is None and resp and resp.status != 200:
+        return f"Unknown (Status {resp.status})"
+    elif data is None and resp and not resp.text:
+         return "Unknown (Empty Response)"
+    elif data is None: # Catch JSONDecodeError or other _safe_get_json failures
+         return "Unknown (JSON Error)"
+         
+    return power_state
+
+
+def get_system_status(system, detailed=False, debug=False, print_output=True, fast_mode=False, ultra_fast=False,
+                      budget=None):
+    """Get system status using Redfish API, enhanced logic
+
+    The whole visit (connect, login, every GET and retry) runs within a time budget. Each request gets
+    the remaining budget as its timeout; when it runs out, the fields collected so far are returned and
+    the ones that were not are listed in HostStatus.missing.
+
+    Modes (request timeouts are further capped by the remaining budget):
+        default: 10s per request, CPU load with detailed, HOST_BUDGET per host
+        fast_mode: 5s per power GET, no CPU load, FAST_HOST_BUDGET per host
+        ultra_fast: 3s per request, 2s per power GET, no retries, ULTRA_FAST_HOST_BUDGET per host
+
+    Args:
+        budget (float): Seconds per host, overriding the mode's default (0 = no budget)
+
+    Returns:
+        bool or HostStatus: True/False when print_output is set, otherwise the HostStatus record
+    """
+    ip = system["ip"]
+    # Cluster/device information from the inventory is carried along for sorting and output
+    result = HostStatus(ip, cluster=system.get("cluster"), device=system.get("device"))
+    budget = host_budget(fast_mode, ultra_fast) if budget is None else budget
+    deadline = Deadline(budget) if budget else None
+    missing = []
+
+    def out_of_budget(field, collected=False):
+        """True (and `field` noted as missing) if the budget ran out before `field` was collected"""
+        if deadline is None or collected or not deadline.expired:
+            return False
+        missing.append(field)
+        result.missing = ",".join(missing)
+        return True
+    
+    session_manager = RedfishSession(system, ultra_fast=ultra_fast, deadline=deadline)
+    session_manager.debug = debug
+
+    with session_manager as client:
+        if not client:
+            result.error = f"Failed to connect to {ip}"
+            logger.error(result.error)
+            return False if print_output else result # Indicate failure
+
+        try:
+            # Get basic system info
+            resp = client.get(REDFISH_SYSTEM_PATH)
+            if debug: logger.debug(f"[{ip}] Initial System GET status: {getattr(resp, 'status', 'N/A')}")
+            data = safe_get_json(resp, ip, debug, context="Initial System Info")
+
+            # --- Handle failure to get initial system info ---
+            if data is None:
+                 error_context = f"(Status: {resp.status})" if resp else "(No Response)"
+                 result.error = f"Initial system info request failed {error_context}"
+                 logger.error(f"{ip}: {result.error}")
+                 if debug and resp: logger.debug(f"[{ip}] System Response Text: {getattr(resp, 'text', 'N/A')}")
+                 # Attempt to get iLO version even if system info is bad
+                 try:
+                     manager_resp = client.get(REDFISH_MANAGER_PATH)
+                     manager_data = safe_get_json(manager_resp, ip, debug, context="Fallback Manager Info")
+                     result.ilo_version = manager_data.get("FirmwareVersion", "Unknown") if manager_data else "Unknown (Error/Empty)"
+                 except Exception: pass
+                 if print_output:
+                     print(f"{ip} | Model: Unknown | S/N: Unknown | Pwr: Unknown | Use: Unknown | Health: Unknown | iLO: {result.ilo_version} | Error: {result.error}")
+                 return False if print_output else result
+
+
+            # --- Process Initial System Info (if successful) ---
+            if debug: logger.debug(f"[{ip}] System Data (JSON Parsed Successfully)") # Simplified debug message
+
+            result.power_state = data.get("PowerState", "Unknown")
+            result.model = data.get("Model", "Unknown")
+            result.bios_version = data.get("BiosVersion", "Unknown")
+
+            # Get identifier (AssetTag or SerialNumber)
+            asset_tag = data.get("AssetTag", "")
+            serial_number = data.get("SerialNumber", "")
+            result.identifier = asset_tag if asset_tag and asset_tag.strip() else serial_number
+
+            # Get HostName if available - used for sorting
+            result.hostname = data.get("HostName", "")
+
+            # Get health status
+            status_info = data.get("Status", {})
+            if isinstance(status_info, dict):
+                 result.health = status_info.get("HealthRollup", status_info.get("Health", "Unknown")) # Prefer HealthRollup
+
+            # Get Memory Summary
+            if "MemorySummary" in data and isinstance(data["MemorySummary"], dict):
+                mem = data["MemorySummary"]
+                result.memory_gib = mem.get('TotalSystemMemoryGiB')
+                mem_status = mem.get("Status", {})
+                if isinstance(mem_status, dict) and "Health" in mem_status and result.health != "Unknown":
+                    result.health += f" (Mem: {mem_status['Health']})"
+
+            # Get Processor Summary
+            if "ProcessorSummary" in data and isinstance(data["ProcessorSummary"], dict):
+                proc = data["ProcessorSummary"]
+                proc_count = proc.get('Count')
+                proc_model = proc.get('Model', '')
+                if proc_count is not None:
+                     result.processor_summary = f"{proc_count}x {proc_model}" if proc_model else str(proc_count)
+                proc_status = proc.get("Status", {})
+                if isinstance(proc_status, dict) and "Health" in proc_status and result.health != "Unknown":
+                     result.health += f" (CPU: {proc_status['Health']})"
+
+
+            # --- Get Additional Info (each step only while the host budget lasts) ---
+            # Get iLO version (from Manager endpoint)
+            if not out_of_budget("ilo_version"):
+                try:
+                    manager_resp = client.get(REDFISH_MANAGER_PATH)
+                    manager_data = safe_get_json(manager_resp, ip, debug, context="Manager Info")
+                    if manager_data:
+                        result.ilo_version = manager_data.get("FirmwareVersion", "Unknown")
+                    else:
+                         status = getattr(manager_resp, 'status', 'N/A')
+                         result.ilo_version = f"Unknown (Status {status})" if status != 200 else "Unknown (Empty/Error)"
+                except DeadlineExceeded:
+                     out_of_budget("ilo_version")
+                except Exception as e_mgr:
+                     if debug: logger.debug(f"[{ip}] Error getting manager info: {e_mgr}")
+                     result.ilo_version = "Error"
+
+            # Get Power Consumption (use shorter timeout in fast/ultra-fast mode)
+            if ultra_fast:
+                power_timeout = 2
+            elif fast_mode:
+                power_timeout = 5
+            else:
+                power_timeout = 10
+            if not out_of_budget("watts"):
+                result.watts = get_power_watts(client, ip, result.identifier, debug=debug, timeout=power_timeout)
+                out_of_budget("watts", collected=result.watts is not None)
+
+            # Get CPU Utilization (skip in fast mode unless detailed)
+            if not fast_mode:
+                needs_cpu = detailed or result.power_state == "Unknown"
+                if needs_cpu and not out_of_budget("cpu_load"):
+                    result.cpu_load = get_cpu_utilization(client, ip, result.identifier, debug=debug, timeout=10)
+                    out_of_budget("cpu_load", collected=result.cpu_load is not None)
+
+            # --- Output Formatting ---
+            id_str = f"{result.model} (S/N: {result.identifier})" if result.identifier != 'Unknown' and result.identifier else result.model
+            
+            if print_output:
+                if detailed:
+                    print(f"Detailed status for {ip} [{id_str}]:")
+                    # Print cluster if available
+                    if result.cluster is not None:
+                        print(f"  Cluster: {result.cluster}")
+                    print(f"  Health: {result.health}")
+                    print(f"  Power State: {result.power_state}")
+                    print(f"  iLO Version: {result.ilo_version}")
+                    print(f"  BIOS Version: {result.bios_version}")
+                    watts_str = f"{result.watts}W" if result.watts is not None else "Unknown"
+                    print(f"  Power Consumption: {watts_str}")
+                    cpu_str = f"{result.cpu_load:.1f}%" if result.cpu_load is not None else "Unknown"
+                    print(f"  CPU Utilization: {cpu_str}")
+                    mem_str = f"{result.memory_gib} GiB" if result.memory_gib is not None else "Unknown"
+                    print(f"  Memory: {mem_str}")
+                    print(f"  Processors: {result.processor_summary}")
+                    if result.missing:
+                        print(f"  Missing (host budget of {budget:g}s exhausted): {result.missing}")
+                else:
+                    # Basic status line
+                    watts_str = f"{result.watts}W" if result.watts is not None else "Unknown"
+                    # Basic format: IP | [Cluster] | Model | S/N | Power | Watts | Health | iLO FW [| Missing]
+                    cluster_str = f"{result.cluster} | " if result.cluster is not None else ""
+                    missing_str = f" | Missing: {result.missing}" if result.missing else ""
+                    print(f"{ip} | {cluster_str}{result.model} | {result.identifier} | Pwr: {result.power_state} | Use: {watts_str} | Health: {result.health} | iLO: {result.ilo_version}{missing_str}")
+
+            return True if print_output else result # Indicate success or return data
+
+        except DeadlineExceeded as de: # Budget ran out before the system info arrived - nothing to return
+            result.error = f"Timed out for {ip}: {de}"
+            if print_output:
+                print(result.error)
+            return False if print_output else result
+        except ConnectionError as ce: # Catch connection errors from session enter
+            result.error = f"Connection Error for {ip}: {ce}"
+            if print_output:
+                print(result.error)
+            return False if print_output else result
+        except AuthenticationError as ae: # Catch auth errors from session enter
+             result.error = f"Authentication Error for {ip}: {ae}"
+             if print_output:
+                 print(result.error)
+             return False if print_output else result
+        except Exception as e: # Catch other errors during status processing
+            result.error = f"Unexpected error processing status for {ip}: {e}"
+            if print_output:
+                print(result.error)
+            if debug: print_exc() # Print stack trace in debug mode
+            # Print basic info available before the error
+            if print_output:
+                print(f"{ip} | Model: {result.model} | S/N: {result.identifier} | Pwr: {result.power_state} | Use: {result.watts}W | Health: {result.health} | iLO: {result.ilo_version} | Error: Short Error Info")
+            return False if print_output else result # Indicate failure
+
+
+def power_on_system(system, debug=False):
+    """Power on a server"""
+    ip = system["ip"]
+    session_manager = RedfishSession(system)
+    session_manager.debug = debug
+
+    with session_manager as client:
+        if not client:
+            logger.error(f"Cannot connect to {ip}")
+            return False
+
+        # Check current state
+        current_state = get_power_status(client, ip, debug) # Pass params
+        if current_state == "On":
+            logger.info(f"System at {ip} is already powered on.")
+            return True
+        elif current_state.startswith("Unknown"): # Check if unknown due to error
+             logger.warning(f"Warning: Could not determine current power state for {ip} ({current_state}). Attempting power on.")
+
+
+        # Power on the server
+        logger.info(f"Powering on system at {ip}...")
+        try:
+            resp = client.post(REDFISH_RESET_ACTION_PATH, body={"ResetType": "On"})
+
+            if resp.status in [200, 202, 204]:
+                logger.info(f"Successfully initiated power on for {ip}")
+                return True
+            else:
+                # Try to get response text for debugging
+                response_text = getattr(resp, 'text', 'No response text available.')
+                logger.error(f"Failed to power on {ip}. Status: {resp.status}, Response: {response_text}")
+                return False
+        except Exception as e:
+            logger.error(f"Error during power on for {ip}: {e}")
+            if debug: print_exc()
+            return False
+
+def power_off_system(system, force=False, debug=False):
+    """Power off a server"""
+    ip = system["ip"]
+    session_manager = RedfishSession(system)
+    session_manager.debug = debug
+
+    with session_manager as client:
+        if not client:
+            logger.error(f"Cannot connect to {ip}")
+            return False
+
+        # Check current state
+        current_state = get_power_status(client, ip, debug) # Pass params
+        if current_state == "Off":
+            logger.info(f"System at {ip} is already powered off.")
+            return True
+        elif current_state.startswith("Unknown"): # Check if unknown due to error
+             logger.warning(f"Warning: Could not determine current power state for {ip} ({current_state}). Attempting power off.")
+
+
+        # Power off the server
+        reset_type = "ForceOff" if force else "GracefulShutdown"
+        shutdown_desc = "forced" if force else "graceful"
+
+        logger.info(f"Performing {shutdown_desc} shutdown for {ip}...")
+        try:
+            resp = client.post(REDFISH_RESET_ACTION_PATH, body={"ResetType": reset_type})
+
+            if resp.status in [200, 202, 204]:
+                logger.info(f"Successfully initiated {shutdown_desc} shutdown for {ip}")
+                return True
+            else:
+                 # Try to get response text for debugging
+                 response_text = getattr(resp, 'text', 'No response text available.')
+                 logger.error(f"Failed to shutdown {ip}. Status: {resp.status}, Response: {response_text}")
+                 return False
+        except Exception as e:
+            logger.error(f"Error during shutdown for {ip}: {e}")
+            if debug: print_exc()
+            return False
+
+def get_power_policy(system, debug=False):
+    """Get the current power policy settings"""
+    ip = system["ip"]
+    result = {
+        'ip': ip, 'identifier': "Unknown", 'current_policy': None,
+        'available_policies': [], 'source': None, 'raw_bios': None, 'raw_power': None
+    }
+    session_manager = RedfishSession(system)
+    session_manager.debug = debug
+
+    with session_manager as client:
+        if not client:
+            logger.error(f"Cannot connect to {ip}")
+            return result # Return default result
+
+        # NOTE: Using global _safe_get_json now, internal helper removed
+
+        # Get system identifier
+        result['identifier'], _ = get_system_identifier(client, debug)
+
+        # Try BIOS settings first
+        try:
+            resp = client.get(REDFISH_BIOS_PATH)
+            bios_data = safe_get_json(resp, ip, debug, context="BIOS Check")
+            result['raw_bios'] = bios_data # Store raw data if needed
+            if bios_data and "Attributes" in bios_data:
+                attrs = bios_data["Attributes"]
+                # Common BIOS power profile keys
+                power_keys = ["PowerProfile", "WorkloadProfile", "SysProfile", 
+                              "HPStaticPowerRegulator", "PowerRegulator"] 
+                for key in attrs:
+                    # Check known keys or keys containing 'power' and 'profile'/'regulator'/'mode'
+                    if key in power_keys or ("power" in key.lower() and any(term in key.lower() for term in ["profile", "regulator", "mode"])):
+                        result['current_policy'] = attrs[key]
+                        result['source'] = f"BIOS:{key}"
+                        # Try to find allowed values (often in the BIOS resource itself or linked registry)
+                        allowable_key = f"{key}@Redfish.AllowableValues"
+                        if allowable_key in bios_data:
+                            result['available_policies'] = bios_data[allowable_key]
+                        # Try alternative location within Attributes definition if available
+                        elif "@Redfish.Settings" in bios_data and "SupportedValues" in bios_data["@Redfish.Settings"]:
+                             # This path is speculative, depends on vendor implementation
+                             settings_defs = bios_data["@Redfish.Settings"].get("SupportedValues", {})
+                             if key in settings_defs and isinstance(settings_defs[key], list):
+                                 result['available_policies'] = settings_defs[key]
+                                 
+                        if result['current_policy'] is not None: break # Found policy in BIOS attributes
+        except Exception as e:
+            if debug: logger.debug(f"[{ip}] Error checking BIOS for power policy: {e}")
+
+        # Try HPE OEM power settings if BIOS check failed or policy not found
+        if result['current_policy'] is None:
+            try:
+                resp = client.get(REDFISH_POWER_PATH)
+                power_data = safe_get_json(resp, ip, debug, context="OEM Power Check")
+                result['raw_power'] = power_data # Store raw data if needed
+                if power_data and "Oem" in power_data:
+                    oem = power_data["Oem"]
+                    # Check for Hpe or Hp key
+                    hpe_data = oem.get("Hpe", oem.get("Hp", {}))
+
+                    if "PowerRegulator" in hpe_data:
+                        result['current_policy'] = hpe_data["PowerRegulator"]
+                        result['source'] = "Oem.PowerRegulator"
+                        if "PowerRegulatorModes" in hpe_data:
+                            result['available_policies'] = hpe_data["PowerRegulatorModes"]
+                    elif "PowerMode" in hpe_data: # Fallback check
+                         result['current_policy'] = hpe_data["PowerMode"]
+                         result['source'] = "Oem.PowerMode"
+                         # Attempt to find available modes might be harder here
+
+            except Exception as e:
+                if debug: logger.debug(f"[{ip}] Error checking OEM power data: {e}")
+
+        # If no available policies found, use common ones as fallback
+        if not result['available_policies']:
+             result['available_policies'] = [
+                 "Static Low Power Mode", "Dynamic Power Savings Mode",
+                 "Static High Performance Mode", "OS Control Mode", "Maximum Performance" # Added another common one
+             ]
+
+    # Print results
+    if result['current_policy'] is not None:
+        logger.info(f"System at {ip}: Current power policy: {result['current_policy']} (Source: {result.get('source', 'Unknown')})")
+        # Only print available if they were explicitly found
+        if result.get('source'):
+             logger.info(f"  Available policies: {', '.join(map(str, result['available_policies']))}")
+    else:
+        logger.warning(f"System at {ip}: Unable to determine power policy.")
+
+    return result
+
+def set_power_policy(system, policy, debug=False):
+    """Set the power policy"""
+    ip = system["ip"]
+    session_manager = RedfishSession(system)
+    session_manager.debug = debug
+
+    with session_manager as client:
+        if not client:
+            logger.error(f"Cannot connect to {ip}")
+            return False
+
+        # Get current policy source to know where to PATCH
+        current = get_power_policy(system, debug) # Reuse get function
+
+        # Determine target URL and payload based on source
+        target_url = None
+        payload = None
+        requires_reboot = False
+
+        if current.get('source', '').startswith("BIOS:"):
+            setting_name = current['source'].split(':')[-1]
+            target_url = REDFISH_BIOS_SETTINGS_PATH
+            payload = {"Attributes": {setting_name: policy}}
+            requires_reboot = True # BIOS changes usually need a reboot
+            
+        elif current.get('source', '').startswith("Oem.PowerRegulator"):
+             # PATCHing the Chassis/Power endpoint with OEM data is common for HPE
+             target_url = REDFISH_POWER_PATH
+             # Payload structure might need adjustment based on specific iLO vendor (assume Hpe/Hp)
+             payload = { "Oem": { "Hpe": { "PowerRegulator": policy } } }
+             # Check if 'Hp' is needed instead of 'Hpe' based on raw data? (Future enhancement)
+             logger.info(f"Attempting to set OEM PowerRegulator via PATCH to {target_url}")
+             # Reboot requirement for OEM changes can vary, assume not required unless specified by error msg
+             requires_reboot = False 
+             
+        # Add more conditions here if other sources are identified
+
+        if not target_url or not payload:
+            # Fallback: Try common BIOS attribute name if source wasn't clear or unsupported
+            logger.info(f"Source unknown or unsupported ('{current.get('source')}'), attempting common BIOS setting 'PowerProfile'...")
+            target_url = REDFISH_BIOS_SETTINGS_PATH
+            payload = {"Attributes": {"PowerProfile": policy}} # Common fallback name
+            requires_reboot = True
+
+
+        logger.info(f"Attempting to set policy '{policy}' via PATCH to {target_url}")
+        try:
+            resp = client.patch(target_url, body=payload)
+
+            if resp.status in [200, 202, 204]:
+                logger.info(f"Successfully applied power policy '{policy}' for {ip}")
+                # Check response headers for task info or messages indicating reboot needed
+                if requires_reboot or 'reboot required' in getattr(resp, 'text', '').lower():
+                    logger.info("System reboot likely required for the change to take effect.")
+                return True
+            else:
+                # Use _safe_get_json to parse potential error response, or grab text
+                error_details = "No details in response text."
+                error_data = safe_get_json(resp, ip, debug, context="Set Policy Error") # Use helper
+                
+                if error_data and 'error' in error_data and isinstance(error_data['error'], dict):
+                     err = error_data['error']
+                     message_info = err.get('@Message.ExtendedInfo', [])
+                     if message_info and isinstance(message_info, list) and len(message_info) > 0 and message_info[0].get('Message'):
+                         error_details = message_info[0]['Message']
+                     elif err.get('message'):
+                         error_details = err['message']
+                     else: # Fallback to string representation of error dict
+                         error_details = str(err)[:200]
+                elif resp and resp.text: # Use raw text if JSON parsing failed or structure unknown
+                     error_details = getattr(resp, 'text', 'N/A')[:200]
+
+                logger.error(f"Failed to set power policy for {ip}. Status: {resp.status}, Details: {error_details}")
+                return False
+        except Exception as e:
+            logger.error(f"Error during PATCH for setting power policy for {ip}: {e}")
+            if debug: print_exc()
+            return False
+
+def get_system_metrics_detailed(system, debug=False):
+    """Get comprehensive system metrics including power, CPU, and system usage data."""
+    ip = system["ip"]
+    result = {'ip': ip, 'watts': None, 'cpu_load': None, 'system_usage': None}
+    session_manager = RedfishSession(system)
+    session_manager.debug = debug
+
+    with session_manager as client:
+        if not client:
+            logger.error(f"Cannot connect to {ip}")
+            return result
+
+        try:
+            # Get identifier
+            identifier, _ = get_system_identifier(client, debug)
+
+            # Get power
+            result['watts'] = get_power_watts(client, ip, identifier, debug)
+
+            # Get CPU and system usage data
+            # First check main system endpoint for OEM data that contains SystemUsage
+            sys_resp = client.get(REDFISH_SYSTEM_PATH)
+            sys_data = safe_get_json(sys_resp, ip, debug, context="SystemUsage Check")
+
+            if sys_data and "Oem" in sys_data:
+                 oem_data = sys_data.get("Oem", {})
+                 hpe_data = oem_data.get("Hpe", oem_data.get("Hp", {}))
+
+                 # Get SystemUsage data
+                 if hpe_data and "SystemUsage" in hpe_data:
+                     result['system_usage'] = hpe_data["SystemUsage"]
+
+                     # Extract CPU load from SystemUsage if available
+                     if "CPUUtil" in result['system_usage']:
+                         result['cpu_load'] = result['system_usage'].get("CPUUtil") # Use .get for safety
+
+                 # If CPU not found in SystemUsage, check for ProcessorUtilization directly in OEM
+                 if result['cpu_load'] is None and hpe_data and "ProcessorUtilization" in hpe_data:
+                     result['cpu_load'] = hpe_data.get("ProcessorUtilization")
+
+
+            # If CPU load not found yet, try the standard get_cpu_utilization function
+            if result['cpu_load'] is None:
+                result['cpu_load'] = get_cpu_utilization(client, ip, identifier, debug)
+
+            # Format metrics for output
+            watts_str = f"{result['watts']}W" if result['watts'] is not None else "Power unknown"
+            cpu_str = f"{result['cpu_load']:.1f}%" if result['cpu_load'] is not None else "CPU unknown"
+            usage_str = ""
+
+            # Add system usage summary if available
+            if result['system_usage'] and isinstance(result['system_usage'], dict): # Ensure it's a dict
+                # Select key metrics to display in console output
+                usage_metrics = []
+                # Use .get() for safer access
+                if "AvgCPU0Freq" in result['system_usage']:
+                    usage_metrics.append(f"CPU0: {result['system_usage'].get('AvgCPU0Freq')}MHz")
+                if "AvgCPU1Freq" in result['system_usage']:
+                    usage_metrics.append(f"CPU1: {result['system_usage'].get('AvgCPU1Freq')}MHz")
+                if "MemoryBusUtil" in result['system_usage']:
+                    usage_metrics.append(f"MemBus: {result['system_usage'].get('MemoryBusUtil')}%")
+                if "IOBusUtil" in result['system_usage']: # Add IO Bus if present
+                    usage_metrics.append(f"IOBus: {result['system_usage'].get('IOBusUtil')}%")
+                
+                if usage_metrics:
+                    usage_str = ", " + ", ".join(m for m in usage_metrics if 'None' not in m) # Filter out None values
+
+            logger.info(f"{ip}: {watts_str}, {cpu_str}{usage_str}")
+
+        except Exception as e:
+            logger.error(f"Error getting detailed metrics for {ip}: {e}")
+            if debug:
+                print_exc()
+
+    return result
@@ -0,0 +1,43 @@
+"""
+Per-host time budgets: a Deadline is created when a host visit starts and every request of the visit
+(connect, login, GETs, retries) gets the remaining budget as its timeout
+"""
+
+import time
+
+class DeadlineExceeded(Exception):
+    """The time budget of a host visit ran out before a request could be sent or completed"""
+
+class Deadline:
+    """Time budget for one host visit.
+
+    Args:
+        budget (float): Seconds the visit may take in total
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.expires = time.monotonic() + budget
+
+    def remaining(self):
+        """Seconds left (0 once expired)"""
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.expires
+
+    def timeout(self, cap=None):
+        """Timeout for the next request: the remaining budget, at most `cap` seconds.
+
+        Raises:
+            DeadlineExceeded: No budget left
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"host budget of {self.budget:g}s exhausted")
+        return remaining if cap is None else min(cap, remaining)
+
+    def allows(self, delay):
+        """True if sleeping `delay` seconds (e.g. a retry backoff) still leaves budget for a request"""
+        return delay < self.remaining()
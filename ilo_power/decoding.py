@@ -0,0 +1,91 @@
+"""
+JSON decoding of Redfish responses
+"""
+
+import json
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON decoders - orjson and ujson both accept raw bytes, so the
+# response body never has to be decoded to text before parsing
+JSON_DECODERS = {'json': json.loads}
+try:
+    import orjson
+    JSON_DECODERS['orjson'] = orjson.loads
+except ImportError:
+    pass
+try:
+    import ujson
+    JSON_DECODERS['ujson'] = ujson.loads
+except ImportError:
+    pass
+
+JSON_DECODER_PREFERENCE = ['orjson', 'ujson', 'json']
+JSON_DECODER = 'json'
+_json_loads = json.loads
+
+def set_json_decoder(name='auto'):
+    """Select the JSON decoder used for Redfish responses.
+
+    Args:
+        name (str): 'auto' (fastest installed), 'orjson', 'ujson' or 'json'
+
+    Returns:
+        str: Name of the decoder now in use
+    """
+    global JSON_DECODER, _json_loads
+    if name == 'auto':
+        name = next(n for n in JSON_DECODER_PREFERENCE if n in JSON_DECODERS)
+    elif name not in JSON_DECODERS:
+        logger.warning(f"Warning: JSON decoder '{name}' is not installed, using '{JSON_DECODER}'")
+        return JSON_DECODER
+    JSON_DECODER = name
+    _json_loads = JSON_DECODERS[name]
+    return JSON_DECODER
+
+def json_loads(body):
+    """Decode a JSON document (bytes or str) with the selected decoder"""
+    return _json_loads(body)
+
+set_json_decoder('auto')
+
+def response_body(response):
+    """Return the raw body of a response, preferring undecoded bytes over text."""
+    body = getattr(response, 'read', None)  # redfish RestResponse exposes the raw bytes here
+    if isinstance(body, (bytes, bytearray, str)):
+        return body
+    return getattr(response, 'text', None)
+
+# Helper function for safe JSON parsing
+def safe_get_json(response, ip="N/A", debug=False, context=""):
+    """Safely parse JSON from a Redfish response object."""
+    full_context = ""
+    if debug:
+        # Only look up the caller when the name is actually going to be printed
+        caller_name = sys._getframe(1).f_code.co_name
+        full_context = f"{caller_name}{f': {context}' if context else ''}"
+
+    if not response:
+        if debug: logger.debug(f"[{ip}] {full_context}: Received None response object.")
+        return None
+
+    if response.status != 200:
+        if debug: logger.debug(f"[{ip}] {full_context}: Received non-200 status: {response.status}. Text: {getattr(response, 'text', 'N/A')[:100]}...")
+        return None
+
+    body = response_body(response)
+    if not body:
+        if debug: logger.debug(f"[{ip}] {full_context}: Received empty response text.")
+        return None
+
+    try:
+        data = _json_loads(body)
+        return data if data else {} # Return empty dict if JSON is null/empty
+    except ValueError as e: # JSONDecodeError for json/orjson, ValueError for ujson
+        if debug: logger.debug(f"[{ip}] {full_context}: JSON parse error: {e}. Text: {getattr(response, 'text', 'N/A')[:100]}...")
+        return None
+    except Exception as e:
+        if debug: logger.debug(f"[{ip}] {full_context}: Unexpected error during JSON parsing: {e}")
+        return None
@@ -0,0 +1,67 @@
+"""
+Lazy loading of the heavy optional dependencies (pandas, NumPy, redfish)
+"""
+
+import importlib.util
+import warnings  # For pandas warnings suppression
+
+# Heavy dependencies (pandas, NumPy, redfish) are imported on first use through
+# load_pandas(), load_numpy() and load_redfish(), so single-host operations such as
+# --power-on -i <ip> don't pay for pandas/NumPy at startup.
+pd = None
+np = None
+redfish = None
+REDFISH_AVAILABLE = importlib.util.find_spec('redfish') is not None
+
+def load_pandas():
+    """Import pandas on first use"""
+    global pd
+    if pd is None:
+        import pandas
+        # Suppress pandas warnings which are not critical for this application
+        warnings.simplefilter(action='ignore', category=pandas.errors.DtypeWarning)
+        warnings.simplefilter(action='ignore', category=FutureWarning)
+        pd = pandas
+    return pd
+
+def load_numpy():
+    """Import NumPy on first use"""
+    global np
+    if np is None:
+        import numpy
+        # Suppress NumPy warnings if available
+        try:
+            warnings.simplefilter(action='ignore', category=numpy.VisibleDeprecationWarning)
+        except AttributeError:
+            pass  # Some NumPy versions don't have this warning category
+        np = numpy
+    return np
+
+def load_redfish():
+    """Import the redfish library on first use"""
+    global redfish
+    if redfish is None:
+        import redfish as redfish_module
+        # Disable SSL warnings (keeps code cleaner)
+        try:
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        except ImportError:
+            pass
+        redfish = redfish_module
+    return redfish
+
+def print_exc():
+    """Print the current exception's stack trace (traceback is imported on demand)"""
+    import traceback
+    traceback.print_exc()
+
+def package_version(name):
+    """Installed version of a package without importing it, or None if it is not installed"""
+    if importlib.util.find_spec(name) is None:
+        return None
+    try:
+        from importlib.metadata import version
+        return version(name)
+    except Exception:  # Python < 3.8 or no distribution metadata
+        return getattr(__import__(name), '__version__', 'unknown')
@@ -0,0 +1,183 @@
+"""
+Programmatic fleet API: run ilo_power operations over many iLO systems and get typed results
+
+Usage example:
+  from ilo_power import Fleet
+  fleet = Fleet.from_csv("servers.csv", workers=50)
+  for host in fleet.status():
+      print(host.ip, host.power_state, host.watts)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .client import RedfishSession
+from .collectors import (
+    get_cpu_utilization, get_power_policy, get_power_watts, get_system_identifier, get_system_status,
+    power_off_system, power_on_system, set_power_policy,
+)
+from .inventory import read_ilo_systems, read_ilo_systems_from_csv
+from .status import HostStatus, StatusTable
+
+@dataclass
+class PowerReading:
+    """Instantaneous power draw and CPU load of one iLO system"""
+    ip: str
+    identifier: str = "Unknown"
+    watts: Optional[float] = None
+    cpu_load: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+@dataclass
+class PowerPolicy:
+    """Power regulator policy of one iLO system"""
+    ip: str
+    identifier: str = "Unknown"
+    current_policy: Optional[str] = None
+    available_policies: List[str] = field(default_factory=list)
+    source: Optional[str] = None
+    error: Optional[str] = None
+
+@dataclass
+class ActionResult:
+    """Outcome of a power action or policy change on one iLO system"""
+    ip: str
+    action: str
+    success: bool
+    error: Optional[str] = None
+
+class Fleet:
+    """A set of iLO systems that operations run on in parallel.
+
+    Args:
+        systems (list): Dicts with 'ip', 'username' and 'password' (plus optional 'cluster'/'device'),
+            as returned by read_ilo_systems_from_csv
+        workers (int): Number of hosts processed in parallel
+        debug (bool): Log the debug messages of the collectors (ilo_power logger, DEBUG level)
+        fast_mode (bool): Skip slow CPU/power fallback methods in status()
+        ultra_fast (bool): Aggressive timeouts and no connection retries
+        host_budget (float): Seconds per host in status(), None for the mode's default, 0 for no limit
+    """
+
+    def __init__(self, systems, workers=50, debug=False, fast_mode=False, ultra_fast=False,
+                 host_budget=None):
+        self.systems = list(systems)
+        self.workers = workers
+        self.debug = debug
+        self.fast_mode = fast_mode
+        self.ultra_fast = ultra_fast
+        self.host_budget = host_budget
+
+    @classmethod
+    def from_csv(cls, csv_file_path, **kwargs):
+        """Load the systems from an inventory CSV file (see read_ilo_systems_from_csv)"""
+        return cls(read_ilo_systems_from_csv(csv_file_path), **kwargs)
+
+    @classmethod
+    def from_workbook(cls, excel_file, cache_dir=None, **kwargs):
+        """Load the all-nodes clusters straight from the master IP list workbook (see ilo_power.workbook)"""
+        return cls(read_ilo_systems(excel_file, cache_dir=cache_dir), **kwargs)
+
+    @classmethod
+    def from_ips(cls, ips, username, password, **kwargs):
+        """Build a fleet of systems sharing the same credentials"""
+        return cls([{'ip': ip, 'username': username, 'password': password} for ip in ips], **kwargs)
+
+    def __len__(self):
+        return len(self.systems)
+
+    def _map(self, func):
+        """Run func(system) for every system in parallel, preserving order"""
+        workers = max(1, min(self.workers, len(self.systems)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, self.systems))
+
+    def status(self, detailed=False):
+        """Collect the status of every system.
+
+        Args:
+            detailed (bool): Also collect CPU load (skipped with fast_mode)
+
+        Returns:
+            list: HostStatus per system, in fleet order (fields not collected within the host budget
+                are listed in HostStatus.missing)
+        """
+        def collect(system):
+            try:
+                return get_system_status(system, detailed=detailed, debug=self.debug, print_output=False,
+                                         fast_mode=self.fast_mode, ultra_fast=self.ultra_fast, budget=self.host_budget)
+            except Exception as e:
+                return HostStatus(ip=system['ip'], cluster=system.get('cluster'), device=system.get('device'),
+                                  error=f"{type(e).__name__}: {e}")
+        return self._map(collect)
+
+    def status_table(self, detailed=False):
+        """Collect the status of every system as a column-oriented StatusTable (see status())"""
+        return StatusTable.from_records(self.status(detailed))
+
+    def power_readings(self):
+        """Read power draw and CPU load of every system with one login per host.
+
+        Returns:
+            list: PowerReading per system, in fleet order
+        """
+        def collect(system):
+            try:
+                session = RedfishSession(system, ultra_fast=self.ultra_fast)
+                session.debug = self.debug
+                with session as client:
+                    identifier, _ = get_system_identifier(client, self.debug)
+                    return PowerReading(
+                        ip=system['ip'], identifier=identifier,
+                        watts=get_power_watts(client, system['ip'], identifier, self.debug),
+                        cpu_load=get_cpu_utilization(client, system['ip'], identifier, self.debug),
+                    )
+            except Exception as e:  # ConnectionError/AuthenticationError from RedfishSession included
+                return PowerReading(ip=system['ip'], error=f"{type(e).__name__}: {e}")
+        return self._map(collect)
+
+    def _action(self, action, func):
+        def run(system):
+            try:
+                success = bool(func(system))
+                return ActionResult(ip=system['ip'], action=action, success=success,
+                                    error=None if success else f"{action} failed")
+            except Exception as e:
+                return ActionResult(ip=system['ip'], action=action, success=False, error=f"{type(e).__name__}: {e}")
+        return self._map(run)
+
+    def power_on(self):
+        """Power on every system. Returns a list of ActionResult"""
+        return self._action('power_on', lambda s: power_on_system(s, debug=self.debug))
+
+    def power_off(self, force=False):
+        """Power off every system (graceful shutdown unless force). Returns a list of ActionResult"""
+        action = 'force_power_off' if force else 'power_off'
+        return self._action(action, lambda s: power_off_system(s, force=force, debug=self.debug))
+
+    def set_power_policy(self, policy):
+        """Set the power regulator policy on every system. Returns a list of ActionResult"""
+        return self._action(f'set_power_policy:{policy}', lambda s: set_power_policy(s, policy, debug=self.debug))
+
+    def power_policies(self):
+        """Read the power regulator policy of every system.
+
+        Returns:
+            list: PowerPolicy per system, in fleet order
+        """
+        def collect(system):
+            try:
+                data = get_power_policy(system, debug=self.debug)
+                return PowerPolicy(ip=system['ip'], identifier=data.get('identifier', "Unknown"),
+                                   current_policy=data.get('current_policy'),
+                                   available_policies=list(data.get('available_policies') or []),
+                                   source=data.get('source'),
+                                   error=None if data.get('current_policy') else "Policy not found")
+            except Exception as e:
+                return PowerPolicy(ip=system['ip'], error=f"{type(e).__name__}: {e}")
+        return self._map(collect)
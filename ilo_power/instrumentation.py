@@ -0,0 +1,110 @@
+"""
+Opt-in per-request timing for Redfish sessions (ilo-power --timing / --trace)
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from .deps import load_numpy
+
+class RequestRecorder:
+    """Collects per-request timings from RedfishSession and instrumented clients.
+
+    Each record is (host, method, endpoint, status, bytes, start, duration, retries, thread_id, error),
+    with start/duration in seconds relative to when the recorder was created.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.host_tags = {}  # ip -> iLO generation (e.g. "iLO 5"), learned from the Manager resource
+        self.lock = threading.Lock()
+        self.t0 = time.perf_counter()
+
+    def record(self, host, method, endpoint, status, nbytes, start, duration, retries=0, error=None):
+        rec = (host, method, endpoint, status, nbytes, start - self.t0, duration, retries,
+               threading.get_ident(), error)
+        with self.lock:
+            self.records.append(rec)
+
+    def tag_host(self, host, generation):
+        self.host_tags[host] = generation
+
+    def _aggregate(self, key_func):
+        np = load_numpy()
+        groups = {}
+        for rec in self.records:
+            groups.setdefault(key_func(rec), []).append(rec)
+        rows = []
+        for key, recs in groups.items():
+            durations = np.sort(np.array([r[6] for r in recs], dtype=np.float64))
+            rows.append({
+                'key': key,
+                'count': len(recs),
+                'errors': sum(1 for r in recs if r[9] or (r[3] is not None and r[3] >= 400)),
+                'retries': sum(r[7] for r in recs),
+                'total_s': float(durations.sum()),
+                'mean_ms': float(durations.mean()) * 1000,
+                'p95_ms': float(np.percentile(durations, 95)) * 1000,
+                'max_ms': float(durations[-1]) * 1000,
+                'kbytes': sum(r[4] or 0 for r in recs) / 1024.0,
+            })
+        rows.sort(key=lambda row: row['total_s'], reverse=True)
+        return rows
+
+    def summary(self, by='endpoint'):
+        """Aggregate records by 'endpoint', 'generation' or 'host', sorted by total time"""
+        if by == 'generation':
+            return self._aggregate(lambda r: self.host_tags.get(r[0], 'Unknown'))
+        if by == 'host':
+            return self._aggregate(lambda r: r[0])
+        return self._aggregate(lambda r: f"{r[1]} {r[2]}")
+
+    def print_summary(self, top_hosts=10):
+        """Print timing tables by endpoint, iLO generation and slowest hosts"""
+        if not self.records:
+            print("\nRequest timing: no requests recorded.")
+            return
+        wall = time.perf_counter() - self.t0
+        print(f"\nRequest timing summary: {len(self.records)} requests in {wall:.1f}s wall time")
+        for title, by, limit in (("Endpoint", 'endpoint', None), ("iLO generation", 'generation', None),
+                                 ("Host (slowest)", 'host', top_hosts)):
+            rows = self.summary(by)[:limit]
+            print(f"\n  {title:<58} {'count':>7} {'errors':>6} {'retries':>7} {'total s':>9} {'mean ms':>8} {'p95 ms':>8} {'max ms':>8} {'KiB':>9}")
+            for row in rows:
+                print(f"  {str(row['key'])[:58]:<58} {row['count']:>7} {row['errors']:>6} {row['retries']:>7} "
+                      f"{row['total_s']:>9.2f} {row['mean_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['max_ms']:>8.1f} {row['kbytes']:>9.1f}")
+
+    def export(self, path):
+        """Write records as a Chrome trace (.json) or one JSON object per line (.jsonl)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fields = ('host', 'method', 'endpoint', 'status', 'bytes', 'start', 'duration', 'retries', 'thread', 'error')
+        with self.lock:
+            records = list(self.records)
+        with open(path, 'w') as f:
+            if path.suffix == '.jsonl':
+                for rec in records:
+                    f.write(json.dumps(dict(zip(fields, rec))) + "\n")
+            else:
+                # Chrome trace event format - open in chrome://tracing or https://ui.perfetto.dev
+                events = [{
+                    'name': f"{rec[1]} {rec[2]}", 'cat': self.host_tags.get(rec[0], 'redfish'), 'ph': 'X',
+                    'ts': round(rec[5] * 1e6, 1), 'dur': round(rec[6] * 1e6, 1), 'pid': rec[0], 'tid': rec[8],
+                    'args': {'status': rec[3], 'bytes': rec[4], 'retries': rec[7], 'error': rec[9]},
+                } for rec in records]
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return str(path)
+
+_recorder = None  # Active RequestRecorder, or None when instrumentation is off
+
+def get_recorder():
+    """Return the active RequestRecorder, or None when instrumentation is off"""
+    return _recorder
+
+def enable_instrumentation():
+    """Start recording request timings for the rest of the run"""
+    global _recorder
+    _recorder = RequestRecorder()
+    return _recorder
@@ -0,0 +1,365 @@
+"""
+Reading iLO systems from inventory CSV files (or the master IP list workbook, see ilo_power.workbook) and sorting helpers
+"""
+
+import sys
+from pathlib import Path
+
+from .deps import load_numpy, load_pandas
+
+# Inventory files read as the master IP list workbook instead of as CSV
+WORKBOOK_SUFFIXES = ('.xlsx', '.xlsm')
+
+def is_workbook(file_path):
+    return Path(file_path).suffix.lower() in WORKBOOK_SUFFIXES
+
+def read_ilo_systems(file_path, debug=False, cache_dir=None):
+    """Read iLO systems from a CSV file, or straight from the master IP list workbook for .xlsx/.xlsm files.
+
+    Args:
+        file_path (str): CSV file or workbook
+        debug (bool): Whether to print debug information during parsing
+        cache_dir (str): Workbooks only: cache of parsed cluster tabs (see ilo_power.workbook.load_cluster_tabs)
+
+    Returns:
+        list: A list of dictionaries containing iLO system details
+    """
+    if is_workbook(file_path):
+        from .workbook import read_ilo_systems_from_workbook  # openpyxl only when needed
+        return read_ilo_systems_from_workbook(file_path, cache_dir=cache_dir, debug=debug)
+    return read_ilo_systems_from_csv(file_path, debug)
+
+def read_ilo_systems_from_csv(csv_file_path, debug=False):
+    """Read iLO system details from a CSV file with improved error handling and flexible format support.
+    
+    Args:
+        csv_file_path (str): Path to the CSV file containing iLO systems information
+        debug (bool): Whether to print debug information during parsing
+        
+    Returns:
+        list: A list of dictionaries containing iLO system details
+    """
+    pd = load_pandas()
+    try:
+        if debug:
+            print(f"Reading CSV file: {csv_file_path}")
+        
+        # Convert to Path object for better handling
+        csv_path = Path(csv_file_path)
+        
+        if not csv_path.exists():
+            print(f"Error: File '{csv_file_path}' not found")
+            return []
+        
+        # Try multiple approaches to read the file
+        encodings = ['utf-8', 'utf-16', 'latin-1']
+        separators = [',', ';', '\t']
+        
+        # Sample the file to determine if it's binary (helps with encoding detection)
+        is_binary = False
+        try:
+            with open(csv_path, 'rb') as f:
+                sample = f.read(4096)
+                # Look for null bytes which would indicate binary/utf-16
+                if b'\x00' in sample:
+                    is_binary = True
+                    if debug:
+                        print("File appears to be binary/UTF-16 encoded")
+        except Exception as e:
+            if debug:
+                print(f"Error sampling file: {e}")
+        
+        # Prioritize UTF-16 if file appears to be binary
+        if is_binary:
+            encodings = ['utf-16', 'utf-16-le', 'utf-8', 'latin-1']
+        
+        # Try different combinations of encoding and separator
+        df = None
+        error_messages = []
+        
+        for encoding in encodings:
+            for sep in separators:
+                try:
+                    # Use pandas with specified encoding and separator
+                    df = pd.read_csv(
+                        csv_path, 
+                        encoding=encoding, 
+                        sep=sep,
+                        engine='python',  # More flexible but slower engine
+                        on_bad_lines='warn',  # Don't fail on problematic lines
+                        dtype=str  # Treat all columns as strings to avoid type conversion issues
+                    )
+                    
+                    if debug:
+                        print(f"Successfully read CSV with encoding={encoding}, separator='{sep}'")
+                        print(f"Found columns: {df.columns.tolist()}")
+                    
+                    # If we reach here, reading was successful
+                    break
+                except Exception as e:
+                    error_messages.append(f"Failed with encoding={encoding}, sep='{sep}': {str(e)}")
+                    continue
+            
+            # Break the outer loop if we've successfully read the file
+            if df is not None:
+                break
+        
+        # If all methods failed, fall back to manual reading
+        if df is None:
+            if debug:
+                print("All pandas read attempts failed, falling back to manual reading")
+                for msg in error_messages:
+                    print(f"  {msg}")
+            return read_ilo_systems_manually(csv_file_path, debug)
+        
+        # Map column names to expected fields - NEW FORMAT for v1.1.1
+        col_mapping = {}
+        required_fields = ['ip', 'username', 'password']
+        optional_fields = ['cluster', 'device']  # Add cluster and device as optional fields
+        
+        # Find specific column matches for new format
+        for field in required_fields + optional_fields:
+            if field == 'ip':
+                # Look specifically for "Mgmt / ILO" column for IP addresses
+                if 'Mgmt / ILO' in df.columns:
+                    col_mapping[field] = 'Mgmt / ILO'
+                    continue
+                # Fallback to old matching for backward compatibility
+                elif 'ip' in df.columns:
+                    col_mapping[field] = 'ip'
+                    continue
+                # Case-insensitive match for Mgmt/ILO variations
+                for col in df.columns:
+                    if 'mgmt' in col.lower() and 'ilo' in col.lower():
+                        col_mapping[field] = col
+                        break
+                else:
+                    # Last resort - substring match for IP
+                    matches = [col for col in df.columns if 'ip' in col.lower()]
+                    if matches:
+                        col_mapping[field] = matches[0]
+            else:
+                # For username, password, cluster, and device, use existing flexible matching
+                # Exact match
+                if field in df.columns:
+                    col_mapping[field] = field
+                    continue
+                    
+                # Case-insensitive match
+                col_lower = [col.lower() for col in df.columns]
+                if field.lower() in col_lower:
+                    idx = col_lower.index(field.lower())
+                    col_mapping[field] = df.columns[idx]
+                    continue
+                    
+                # Special handling for device field - look for "Device" column
+                if field == 'device':
+                    if 'Device' in df.columns:
+                        col_mapping[field] = 'Device'
+                        continue
+                
+                # Substring match (e.g., "IP_Address" for "ip")
+                matches = [col for col in df.columns if field.lower() in col.lower()]
+                if matches:
+                    col_mapping[field] = matches[0]
+                    continue
+        
+        # If mapping is incomplete, try position-based approach for a standard 3-column CSV
+        missing_fields = [field for field in required_fields if field not in col_mapping]
+        if missing_fields and len(df.columns) >= 3:
+            if debug:
+                print(f"Could not find columns for: {missing_fields}, trying position-based mapping")
+            # Map by position, assuming standard order
+            if 'ip' not in col_mapping:
+                col_mapping['ip'] = df.columns[0]
+            if 'username' not in col_mapping and len(df.columns) > 1:
+                col_mapping['username'] = df.columns[1]
+            if 'password' not in col_mapping and len(df.columns) > 2:
+                col_mapping['password'] = df.columns[2]
+        
+        if debug:
+            print(f"Final column mapping: {col_mapping}")
+        
+        # Check if we have all required fields
+        if not all(field in col_mapping for field in required_fields):
+            missing = [field for field in required_fields if field not in col_mapping]
+            print(f"Error: Could not find columns for required fields: {missing}")
+            print(f"Available columns: {df.columns.tolist()}")
+            return []
+        
+        # Extract data using the mapping
+        ilo_systems = []
+        for _, row in df.iterrows():
+            system = {}
+            
+            # Extract each field using the mapping
+            for field, col in col_mapping.items():
+                # Convert to string, handle NaN and None values
+                value = row[col]
+                if pd.isna(value) or value is None:
+                    value = ""
+                else:
+                    value = str(value).strip()
+                
+                if value and value.lower() not in ['nan', 'none', 'null', '']:
+                    system[field] = value
+            
+            # Only include systems with all required fields
+            if all(field in system for field in required_fields):
+                ilo_systems.append(system)
+        
+        if ilo_systems:
+            print(f"Loaded {len(ilo_systems)} iLO systems from CSV file.")
+            # Print if cluster information was found
+            if 'cluster' in col_mapping:
+                print(f"Found cluster information in the CSV file.")
+            return add_sort_keys(ilo_systems)
+        else:
+            print("No valid systems found in CSV file (all fields must be present).")
+            return []
+            
+    except Exception as e:
+        print(f"Error reading CSV file: {str(e)}")
+        if debug:
+            import traceback
+            print(traceback.format_exc())
+        return []
+
+def read_ilo_systems_manually(csv_file_path, debug=False):
+    """Manual fallback method to read CSV files."""
+    ilo_systems = []
+    
+    # Try different encodings
+    for encoding in ['utf-8', 'utf-16', 'utf-16-le', 'latin-1']:
+        try:
+            if debug:
+                print(f"Trying manual read with {encoding} encoding...")
+                
+            with open(csv_file_path, 'r', encoding=encoding) as file:
+                lines = file.readlines()
+                lines = [line.strip() for line in lines if line.strip()]
+                
+                if not lines:
+                    continue
+                
+                # Determine separator
+                separator = ',' if len(lines[0].split(',')) >= 3 else ';'
+                
+                # Process headers
+                headers = lines[0].split(separator)
+                headers = [h.strip().strip('"').lower() for h in headers]
+                
+                # Find indices for required fields - NEW FORMAT for v1.1.1
+                ip_idx = username_idx = password_idx = None
+                
+                for i, header in enumerate(headers):
+                    # Look specifically for "mgmt / ilo" first for IP addresses
+                    if 'mgmt' in header and 'ilo' in header:
+                        ip_idx = i
+                    elif 'ip' in header and ip_idx is None:  # Fallback to IP column
+                        ip_idx = i
+                    elif 'user' in header or 'name' in header:
+                        username_idx = i
+                    elif 'pass' in header:
+                        password_idx = i
+                
+                # If we couldn't find all required fields, try position-based approach
+                if ip_idx is None or username_idx is None or password_idx is None:
+                    if len(headers) >= 3:
+                        ip_idx, username_idx, password_idx = 0, 1, 2
+                    else:
+                        continue
+                
+                # Process data rows
+                for i in range(1, len(lines)):
+                    fields = lines[i].split(separator)
+                    fields = [f.strip().strip('"') for f in fields]
+                    
+                    if len(fields) > max(ip_idx, username_idx, password_idx):
+                        ip = fields[ip_idx]
+                        username = fields[username_idx]
+                        password = fields[password_idx]
+                        
+                        if ip and username and password:
+                            ilo_systems.append({
+                                'ip': ip,
+                                'username': username,
+                                'password': password
+                            })
+                
+                if ilo_systems:
+                    print(f"Successfully parsed {len(ilo_systems)} systems manually.")
+                    return add_sort_keys(ilo_systems)
+                    
+        except Exception as e:
+            if debug:
+                print(f"Manual read with {encoding} failed: {str(e)}")
+            continue
+    
+    print("Failed to read systems with any method.")
+    return []
+
+def sort_ip_address_key(ip_str):
+    """Convert IP address string to a tuple of integers for proper sorting"""
+    try:
+        # Split the IP address by dots and convert each octet to an integer
+        return tuple(int(octet) for octet in ip_str.split('.'))
+    except (ValueError, AttributeError):
+        # If not a valid IP format, return a tuple of zeros
+        return (0, 0, 0, 0)
+
+def cluster_part(name):
+    """Cluster name from a cluster/device string, e.g. "Cohesity Cluster 1 - Node 1" -> "Cohesity Cluster 1" """
+    if name and "Cluster" in name and "Node" in name:
+        # Extract just the cluster part before " - Node"
+        return name.split(" - Node")[0]
+    return name
+
+def sort_cluster_then_ip_key(result):
+    """Sort by cluster name first, then by IP address (result is a HostStatus)."""
+    return (cluster_part(result.cluster or result.device or ""), sort_ip_address_key(result.ip or ""))
+
+def ip_sort_key(ip_str):
+    """Pack a dotted IPv4 address into one 32-bit integer for sorting (0 if it is not one)"""
+    try:
+        octets = [int(octet) for octet in ip_str.split('.')]
+    except (ValueError, AttributeError):
+        return 0
+    if len(octets) != 4 or not all(0 <= octet <= 255 for octet in octets):
+        return 0
+    return (octets[0] << 24) | (octets[1] << 16) | (octets[2] << 8) | octets[3]
+
+def add_sort_keys(systems):
+    """Compute the sort keys of each system once, at inventory load.
+
+    Adds 'ip_key' (packed 32-bit IP) and 'cluster_id' (interned cluster name) to every system dict.
+
+    Returns:
+        list: The same systems list
+    """
+    for system in systems:
+        system['ip_key'] = ip_sort_key(system['ip'])
+        system['cluster_id'] = sys.intern(str(cluster_part(system.get('cluster') or system.get('device') or "")))
+    return systems
+
+def sort_order(systems, by_cluster=False):
+    """Return the indices that sort systems by IP, or by cluster then IP.
+
+    Uses the keys from add_sort_keys (computed here if missing). Ties keep inventory order.
+
+    Args:
+        systems (list): System dicts
+        by_cluster (bool): Sort by cluster name first
+
+    Returns:
+        numpy.ndarray: Row order, usable with StatusTable.take or to reorder per-system results
+    """
+    np = load_numpy()
+    if any('ip_key' not in system for system in systems):
+        add_sort_keys(systems)
+    ip_keys = np.fromiter((system['ip_key'] for system in systems), dtype=np.uint32, count=len(systems))
+    if not by_cluster:
+        return np.argsort(ip_keys, kind='stable')
+    codes = {name: code for code, name in enumerate(sorted({system['cluster_id'] for system in systems}))}
+    cluster_codes = np.fromiter((codes[system['cluster_id']] for system in systems), dtype=np.int64, count=len(systems))
+    return np.lexsort((ip_keys, cluster_codes))
@@ -0,0 +1,181 @@
+"""
+Periodic power and full-metrics monitoring of a fleet of iLO systems
+"""
+
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import RedfishSession
+from .collectors import get_cpu_utilization, get_power_watts, get_system_identifier, get_system_metrics_detailed
+from .deps import load_numpy, print_exc
+from .output import host_history_path, save_full_monitor_data_to_csv, save_host_readings_to_csv, save_power_data_to_csv
+from .retry import get_retry_policy
+
+def monitor_power(ilo_systems, interval_minutes, output_csv, workers=10, iterations=None, debug=False):
+    """Monitor power and CPU periodically (basic monitoring) with NumPy for calculations"""
+    np = load_numpy()
+    print(f"Starting power and CPU monitoring every {interval_minutes} minutes")
+    print(f"Saving data to: {output_csv} (per-host readings: {host_history_path(output_csv)})")
+    
+    iteration = 0
+    try:
+        while iterations is None or iteration < iterations:
+            iteration += 1
+            get_retry_policy().reset_budget()  # Each sample gets the full retry budget
+            current_time = datetime.datetime.now()
+            timestamp = current_time.strftime("%Y-%m-%d %H:%M:%S")
+            
+            print(f"\n[{timestamp}] Checking metrics for {len(ilo_systems)} systems...")
+            
+            # Function to get metrics for a single system
+            def get_system_metrics(system):
+                ip = system["ip"]
+                result = {'ip': ip, 'watts': None, 'cpu_load': None}
+                
+                with RedfishSession(system) as client:
+                    if client:
+                        # Get identifier
+                        identifier, _ = get_system_identifier(client)
+                        
+                        # Get power
+                        result['watts'] = get_power_watts(client, ip, identifier, debug)
+                        
+                        # Get CPU
+                        result['cpu_load'] = get_cpu_utilization(client, ip, identifier, debug)
+                        
+                        # Print system results
+                        watts_str = f"{result['watts']}W" if result['watts'] is not None else "Power unknown"
+                        cpu_str = f"{result['cpu_load']:.1f}%" if result['cpu_load'] is not None else "CPU unknown"
+                        print(f"{ip}: {watts_str}, {cpu_str}")
+                
+                return result
+            
+            # Process systems in parallel
+            results = []
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(get_system_metrics, ilo_systems))
+                
+            # Extract watts and CPU load using NumPy for more efficient calculations
+            watts_values = np.array([r['watts'] for r in results if r['watts'] is not None], dtype=np.float64)
+            cpu_values = np.array([r['cpu_load'] for r in results if r['cpu_load'] is not None], dtype=np.float64)
+            
+            # Calculate totals and averages using NumPy
+            valid_power_readings = len(watts_values)
+            valid_cpu_readings = len(cpu_values)
+            
+            total_watts = np.sum(watts_values) if valid_power_readings > 0 else 0
+            avg_watts = np.mean(watts_values) if valid_power_readings > 0 else 0
+            avg_cpu = np.mean(cpu_values) if valid_cpu_readings > 0 else None
+            
+            # Print summary
+            print(f"\nMonitoring Summary:")
+            print(f"  Total power consumption: {total_watts:.2f}W")
+            print(f"  Average per server: {avg_watts:.2f}W")
+            print(f"  Power readings from {valid_power_readings} out of {len(ilo_systems)} servers")
+            
+            if avg_cpu is not None:
+                print(f"  Average CPU utilization: {avg_cpu:.2f}%")
+                print(f"  CPU readings from {valid_cpu_readings} out of {len(ilo_systems)} servers")
+            
+            # Save to CSV
+            saved_path = save_power_data_to_csv(
+                output_csv, timestamp, total_watts, avg_watts,
+                avg_cpu, valid_power_readings, len(ilo_systems)
+            )
+            
+            if saved_path:
+                print(f"  Data saved to {saved_path}")
+            # Per-host readings for --analyze (energy, demand percentiles, idle hosts)
+            save_host_readings_to_csv(host_history_path(output_csv), timestamp, ilo_systems, results)
+            
+            # Check for iteration limit
+            if iterations is not None and iteration >= iterations:
+                break
+                
+            # Wait for next interval
+            next_time = current_time + datetime.timedelta(minutes=interval_minutes)
+            print(f"Next check scheduled for: {next_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            time.sleep(interval_minutes * 60)
+            
+    except KeyboardInterrupt:
+        print("\nMonitoring stopped by user.")
+    except Exception as e:
+        print(f"\nError during monitoring: {str(e)}")
+        if debug:
+            print_exc()
+
+def monitor_full(ilo_systems, interval_minutes, output_csv, workers=10, iterations=None, debug=False):
+    """Monitor comprehensive system metrics including power, CPU and detailed SystemUsage with NumPy for calculations"""
+    np = load_numpy()
+    print(f"Starting FULL monitoring (power, CPU, and system metrics) every {interval_minutes} minutes")
+    print(f"Saving detailed data to: {output_csv}")
+    
+    iteration = 0
+    try:
+        while iterations is None or iteration < iterations:
+            iteration += 1
+            get_retry_policy().reset_budget()  # Each sample gets the full retry budget
+            current_time = datetime.datetime.now()
+            timestamp = current_time.strftime("%Y-%m-%d %H:%M:%S")
+            
+            print(f"\n[{timestamp}] Collecting detailed metrics for {len(ilo_systems)} systems...")
+            
+            # Process systems in parallel
+            results = []
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda system: get_system_metrics_detailed(system, debug), 
+                    ilo_systems
+                ))
+                
+            # Extract watts and CPU load with NumPy for more efficient calculations
+            watts_values = np.array([r['watts'] for r in results if r['watts'] is not None], dtype=np.float64)
+            cpu_values = np.array([r['cpu_load'] for r in results if r['cpu_load'] is not None], dtype=np.float64)
+            
+            # Calculate totals and averages using NumPy
+            valid_power_readings = len(watts_values)
+            valid_cpu_readings = len(cpu_values)
+            
+            total_watts = np.sum(watts_values) if valid_power_readings > 0 else 0
+            avg_watts = np.mean(watts_values) if valid_power_readings > 0 else 0
+            avg_cpu = np.mean(cpu_values) if valid_cpu_readings > 0 else None
+            
+            # Print summary
+            print(f"\nFull Monitoring Summary:")
+            print(f"  Total power consumption: {total_watts:.2f}W")
+            print(f"  Average per server: {avg_watts:.2f}W")
+            print(f"  Power readings from {valid_power_readings} out of {len(ilo_systems)} servers")
+            
+            if avg_cpu is not None:
+                print(f"  Average CPU utilization: {avg_cpu:.2f}%")
+                print(f"  CPU readings from {valid_cpu_readings} out of {len(ilo_systems)} servers")
+            
+            # Count systems with SystemUsage data
+            systems_with_usage = sum(1 for r in results if r.get('system_usage'))
+            if systems_with_usage > 0:
+                print(f"  Detailed system metrics from {systems_with_usage} out of {len(ilo_systems)} servers")
+            else:
+                print("  No detailed system metrics available from any server")
+            
+            # Save detailed data to CSV
+            saved_path = save_full_monitor_data_to_csv(output_csv, timestamp, results)
+            
+            if saved_path:
+                print(f"  Detailed data saved to {saved_path}")
+            
+            # Check for iteration limit
+            if iterations is not None and iteration >= iterations:
+                break
+                
+            # Wait for next interval
+            next_time = current_time + datetime.timedelta(minutes=interval_minutes)
+            print(f"Next check scheduled for: {next_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            time.sleep(interval_minutes * 60)
+            
+    except KeyboardInterrupt:
+        print("\nMonitoring stopped by user.")
+    except Exception as e:
+        print(f"\nError during full monitoring: {str(e)}")
+        if debug:
+            print_exc()
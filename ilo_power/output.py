@@ -0,0 +1,197 @@
+"""
+CSV output for status sweeps and monitoring data
+"""
+
+from pathlib import Path
+
+from .deps import load_pandas, print_exc
+from .status import StatusTable
+
+def save_power_data_to_csv(csv_path, timestamp, total_watts, avg_watts, avg_cpu_load, valid_readings, total_servers):
+    """Save power consumption and CPU load data to a CSV file with improved pandas handling.
+    
+    Args:
+        csv_path (str): Path to the CSV file to save data to
+        timestamp (str): Formatted timestamp for the current reading
+        total_watts (float): Total power consumption in watts
+        avg_watts (float): Average power consumption per server in watts
+        avg_cpu_load (float or None): Average CPU load percentage, or None if not available
+        valid_readings (int): Number of servers with valid power readings
+        total_servers (int): Total number of servers in the list
+        
+    Returns:
+        str: Path to the CSV file if successful, None otherwise
+    """
+    pd = load_pandas()
+    try:
+        # Create output directory if it doesn't exist
+        output_dir = Path(csv_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Format values appropriately
+        avg_cpu_str = f"{avg_cpu_load:.2f}" if avg_cpu_load is not None else "Unknown"
+        
+        # Create a DataFrame with a single row of data
+        data = {
+            'timestamp': [timestamp],
+            'total_power_watts': [f"{total_watts:.2f}"],
+            'avg_power_watts': [f"{avg_watts:.2f}"],
+            'avg_cpu_load': [avg_cpu_str],
+            'valid_readings': [valid_readings],
+            'total_servers': [total_servers]
+        }
+        df = pd.DataFrame(data)
+        
+        # Check if file exists to determine if we need to write headers
+        file_exists = Path(csv_path).exists()
+        
+        # Write to CSV file - append if exists, create if doesn't
+        if file_exists:
+            df.to_csv(csv_path, mode='a', header=False, index=False)
+        else:
+            df.to_csv(csv_path, index=False)
+        
+        return csv_path
+    except Exception as e:
+        print(f"Error saving power data to CSV: {str(e)}")
+        return None
+
+def host_history_path(csv_path):
+    """Per-host history file written next to a --monitor CSV, e.g. power_cpu_history.csv -> power_cpu_history_hosts.csv"""
+    path = Path(csv_path)
+    return str(path.with_name(f"{path.stem}_hosts{path.suffix or '.csv'}"))
+
+def save_host_readings_to_csv(csv_path, timestamp, systems, results):
+    """Append one row per system (timestamp, ip, cluster, watts, cpu_load) to a per-host history CSV.
+
+    Args:
+        csv_path (str): Path to the CSV file to append to
+        timestamp (str): Formatted timestamp for the current reading
+        systems (list): System dicts, for the cluster/device name
+        results (list): Dicts with 'ip', 'watts' and 'cpu_load' (None if unknown), in the order of systems
+
+    Returns:
+        str: Path to the CSV file if successful, None otherwise
+    """
+    pd = load_pandas()
+    try:
+        Path(csv_path).parent.mkdir(parents=True, exist_ok=True)
+        df = pd.DataFrame({
+            'timestamp': timestamp,
+            'ip': [r['ip'] for r in results],
+            'cluster': [s.get('cluster') or s.get('device') or "" for s in systems],
+            'watts': [r['watts'] for r in results],
+            'cpu_load': [r['cpu_load'] for r in results],
+        })
+        file_exists = Path(csv_path).exists()
+        df.to_csv(csv_path, mode='a' if file_exists else 'w', header=not file_exists, index=False,
+                  float_format='%.2f')
+        return csv_path
+    except Exception as e:
+        print(f"Error saving per-host readings to CSV: {str(e)}")
+        return None
+
+def save_full_monitor_data_to_csv(csv_path, timestamp, system_metrics):
+    """Save comprehensive monitoring data to a CSV file with improved pandas handling.
+    
+    Args:
+        csv_path (str): Path to the CSV file to save data to
+        timestamp (str): Formatted timestamp for the current reading
+        system_metrics (list): List of dictionaries containing system metrics
+        
+    Returns:
+        str: Path to the CSV file if successful, None otherwise
+    """
+    pd = load_pandas()
+    try:
+        # Create output directory if it doesn't exist
+        output_dir = Path(csv_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Create field names from the first system with data
+        valid_system = None
+        for s in system_metrics:
+            if s and s.get('system_usage'):
+                valid_system = s
+                break
+                
+        if not valid_system:
+            print("No valid system metrics found for CSV headers.")
+            return None
+            
+        # Prepare data rows for DataFrame
+        rows = []
+        for system in system_metrics:
+            if system:
+                # Base row with timestamp and IP
+                row = {'timestamp': timestamp, 'ip': system.get('ip')}
+                
+                # Add power and CPU data
+                row['power_watts'] = f"{system.get('watts', 0):.2f}" if system.get('watts') is not None else "Unknown"
+                row['cpu_load'] = f"{system.get('cpu_load', 0):.2f}" if system.get('cpu_load') is not None else "Unknown"
+                
+                # Add all SystemUsage metrics if available
+                if system.get('system_usage'):
+                    for key, value in system.get('system_usage', {}).items():
+                        # Create a snake_case column name
+                        col_name = key.lower()
+                        # Format numeric values 
+                        if isinstance(value, (int, float)):
+                            row[col_name] = f"{value:.2f}" if isinstance(value, float) else str(value)
+                        else:
+                            row[col_name] = str(value) if value is not None else ""
+                            
+                rows.append(row)
+        
+        # Create DataFrame from rows
+        if not rows:
+            print("No valid data rows to save.")
+            return None
+            
+        df = pd.DataFrame(rows)
+        
+        # Check if file exists
+        file_exists = Path(csv_path).exists()
+        
+        # Write to CSV file
+        if file_exists:
+            # If file exists, append without headers
+            df.to_csv(csv_path, mode='a', header=False, index=False)
+        else:
+            # If new file, write with headers
+            df.to_csv(csv_path, index=False)
+        
+        return csv_path
+    except Exception as e:
+        print(f"Error saving full monitoring data to CSV: {str(e)}")
+        print_exc()
+        return None
+
+def save_status_to_csv(csv_path, results):
+    """Save server status information to a CSV file (or Parquet if the path ends in .parquet).
+    
+    Args:
+        csv_path (str): Path to the CSV file to save data to
+        results (StatusTable or list): Status table, or a list of HostStatus records (or status dicts)
+        
+    Returns:
+        str: Path to the CSV file if successful, None otherwise
+    """
+    try:
+        # Create output directory if it doesn't exist
+        output_dir = Path(csv_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Columns are already typed (float watts/cpu_load/memory_gib) and in output order
+        table = results if isinstance(results, StatusTable) else StatusTable.from_records(results)
+        if str(csv_path).endswith('.parquet'):
+            return table.to_parquet(csv_path)
+        return table.to_csv(csv_path)
+    except ImportError as e:
+        print(f"Error saving status data to Parquet: {str(e)}")
+        print("Please install pyarrow using: pip install pyarrow")
+        return None
+    except Exception as e:
+        print(f"Error saving status data to CSV: {str(e)}")
+        print_exc()
+        return None
@@ -0,0 +1,118 @@
+"""
+Retry policy for Redfish connections and requests: exponential backoff with full jitter and a per-run retry budget
+"""
+
+import random
+import threading
+
+# Statuses of idempotent GETs worth retrying (throttled / iLO web server restarting)
+RETRY_STATUSES = (429, 502, 503, 504)
+
+class RetryPolicy:
+    """How RedfishSession retries logins and GETs.
+
+    The delay before retry n (0-based) is drawn uniformly from [0, min(max_delay, base_delay * 2**n)]
+    ("full jitter"), so workers that failed together do not retry together. All sessions sharing a
+    policy draw retries from one budget; once it is spent, failures are returned/raised right away.
+
+    Only idempotent requests are retried: connect, login and GET. POST and PATCH (power actions,
+    policy changes) always run once.
+
+    Args:
+        max_retries (int): Retries per connect/login or GET (0 disables retrying)
+        base_delay (float): Backoff scale in seconds
+        max_delay (float): Cap of a single backoff in seconds
+        budget (int): Retries allowed in total across all sessions, None for no limit
+        retry_statuses (tuple): HTTP statuses of a GET that are retried
+        rng (random.Random): Random source for the jitter (for reproducible runs)
+    """
+
+    def __init__(self, max_retries=1, base_delay=0.5, max_delay=8.0, budget=None,
+                 retry_statuses=RETRY_STATUSES, rng=None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retry_statuses = frozenset(retry_statuses)
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self.retries_used = 0
+        self.budget_denied = 0
+
+    def backoff(self, attempt, base_delay=None):
+        """Seconds to wait before retry number `attempt` (0-based)"""
+        base_delay = self.base_delay if base_delay is None else base_delay
+        ceiling = min(self.max_delay, base_delay * (2 ** attempt))
+        with self._lock:
+            return self._rng.uniform(0, ceiling)
+
+    def acquire(self, attempt, max_retries=None):
+        """Take one retry from the budget for retry number `attempt`.
+
+        Args:
+            attempt (int): Retries already made for this request
+            max_retries (int): Per-session override of the policy's max_retries
+
+        Returns:
+            bool: True if the retry may go ahead
+        """
+        if attempt >= (self.max_retries if max_retries is None else max_retries):
+            return False
+        with self._lock:
+            if self.budget is not None and self.retries_used >= self.budget:
+                self.budget_denied += 1
+                return False
+            self.retries_used += 1
+            return True
+
+    @property
+    def budget_exhausted(self):
+        return self.budget is not None and self.retries_used >= self.budget
+
+    def reset_budget(self):
+        """Start a new run (e.g. the next monitoring iteration) with the full budget"""
+        with self._lock:
+            self.retries_used = 0
+            self.budget_denied = 0
+
+    def is_retryable(self, exc):
+        """True for transient connection errors: unreachable/reset/timeout, exhausted transport retries and
+        session creation failures. Bad credentials and other errors are not retried."""
+        return isinstance(exc, transient_errors())
+
+    def is_retryable_status(self, status):
+        return status in self.retry_statuses
+
+    def describe(self):
+        budget = "unlimited" if self.budget is None else f"{self.retries_used}/{self.budget} used"
+        return (f"retries {self.max_retries}, backoff {self.base_delay:g}-{self.max_delay:g}s full jitter, "
+                f"budget {budget}")
+
+def transient_errors():
+    """Exception classes that RetryPolicy treats as transient"""
+    from .client import ConnectionError
+    from .deps import load_redfish
+    v1 = load_redfish().rest.v1
+    classes = [ConnectionError]
+    for name in ('ServerDownOrUnreachableError', 'RetriesExhaustedError', 'SessionCreationError'):
+        cls = getattr(v1, name, None)
+        if cls is not None:
+            classes.append(cls)
+    try:
+        import requests
+        classes += [requests.exceptions.ConnectionError, requests.exceptions.Timeout]
+    except ImportError:
+        pass
+    return tuple(classes)
+
+_policy = RetryPolicy()
+
+def get_retry_policy():
+    """Return the retry policy used by new RedfishSessions"""
+    return _policy
+
+def set_retry_policy(policy):
+    """Install `policy` for all new RedfishSessions and return it"""
+    global _policy
+    _policy = policy
+    return policy
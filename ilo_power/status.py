@@ -0,0 +1,200 @@
+"""
+Compact status records for fleet sweeps
+
+HostStatus is one __slots__ record per host, filled in by get_system_status.
+StatusTable holds a whole sweep column by column (NumPy float columns for
+watts, CPU load and memory, lists for text) and writes CSV or Parquet
+without building and reshaping per-host dicts.
+"""
+
+import heapq
+
+from .deps import load_numpy, load_pandas
+from .inventory import cluster_part
+
+# Column order of the status CSV/Parquet output
+STATUS_COLUMNS = ('ip', 'cluster', 'hostname', 'identifier', 'model', 'power_state', 'health',
+                  'watts', 'cpu_load', 'ilo_version', 'bios_version', 'memory_gib', 'processor_summary',
+                  'error', 'device', 'missing')
+NUMERIC_COLUMNS = ('watts', 'cpu_load', 'memory_gib')
+OPTIONAL_COLUMNS = ('cluster', 'device', 'missing')  # Left out of the output when no host has them
+
+class HostStatus:
+    """Status of one iLO system, as collected by get_system_status"""
+
+    __slots__ = STATUS_COLUMNS
+
+    def __init__(self, ip, cluster=None, hostname="", identifier="Unknown", model="Unknown",
+                 power_state="Unknown", health="Unknown", watts=None, cpu_load=None, ilo_version="Unknown",
+                 bios_version="Unknown", memory_gib=None, processor_summary="Unknown", error=None, device=None,
+                 missing=None):
+        self.ip = ip
+        self.cluster = cluster
+        self.hostname = hostname
+        self.identifier = identifier
+        self.model = model
+        self.power_state = power_state
+        self.health = health
+        self.watts = watts
+        self.cpu_load = cpu_load
+        self.ilo_version = ilo_version
+        self.bios_version = bios_version
+        self.memory_gib = memory_gib
+        self.processor_summary = processor_summary
+        self.error = error
+        self.device = device
+        self.missing = missing  # Fields not collected before the host budget ran out, e.g. "watts,cpu_load"
+
+    @property
+    def ok(self):
+        return not self.error
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a status dict (as returned by ilo_power 1.1.x)"""
+        return cls(**{key: value for key, value in data.items() if key in STATUS_COLUMNS})
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in STATUS_COLUMNS}
+
+    def __eq__(self, other):
+        if not isinstance(other, HostStatus):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in STATUS_COLUMNS)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in STATUS_COLUMNS
+                           if getattr(self, name) is not None or name not in OPTIONAL_COLUMNS)
+        return f"HostStatus({fields})"
+
+class StatusTable:
+    """Column-oriented status results of a sweep.
+
+    Args:
+        columns (dict): Column name -> list (text columns) or float64 array (NUMERIC_COLUMNS, NaN = unknown),
+            all of the same length
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    @classmethod
+    def from_records(cls, records):
+        """Build from HostStatus records (status dicts are accepted too), keeping their order"""
+        np = load_numpy()
+        records = [r if isinstance(r, HostStatus) else HostStatus.from_dict(r) for r in records]
+        columns = {}
+        for name in STATUS_COLUMNS:
+            values = [getattr(r, name) for r in records]
+            if name in NUMERIC_COLUMNS:
+                columns[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            else:
+                columns[name] = values
+        return cls(columns)
+
+    def __len__(self):
+        return len(self.columns['ip'])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def row(self, index):
+        """Return row `index` as a HostStatus record"""
+        values = {}
+        for name in STATUS_COLUMNS:
+            value = self.columns[name][index]
+            if name in NUMERIC_COLUMNS:
+                value = None if value != value else float(value)  # NaN -> None
+            values[name] = value
+        return HostStatus(**values)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def take(self, indices):
+        """Return a new table with the rows at `indices` (e.g. an argsort result), in that order"""
+        np = load_numpy()
+        indices = np.asarray(indices, dtype=np.intp)
+        columns = {}
+        for name, values in self.columns.items():
+            columns[name] = values[indices] if name in NUMERIC_COLUMNS else [values[i] for i in indices]
+        return StatusTable(columns)
+
+    def top_indices(self, n, by='watts'):
+        """Return the indices of the n rows with the highest value in a numeric column, highest first.
+
+        Uses heap selection, so only n rows are ever kept sorted; rows with an unknown value are skipped
+        and ties keep table order.
+
+        Args:
+            n (int): Number of rows
+            by (str): 'watts', 'cpu_load' or 'memory_gib'
+        """
+        np = load_numpy()
+        values = self.columns[by]
+        known = np.flatnonzero(~np.isnan(values))
+        return heapq.nlargest(n, known, key=values.__getitem__)
+
+    def top(self, n, by='watts'):
+        """Return a table of the n rows with the highest value in a numeric column (see top_indices)"""
+        return self.take(self.top_indices(n, by))
+
+    def cluster_summary(self):
+        """Aggregate the table per cluster (cluster part of the cluster/device name).
+
+        Returns:
+            list: One dict per cluster, sorted by name, with hosts, ok, total_watts, avg_watts,
+                max_watts and avg_cpu (None where no host reported a value)
+        """
+        np = load_numpy()
+        names = [cluster_part(c or d or "") for c, d in zip(self.columns['cluster'], self.columns['device'])]
+        clusters = sorted(set(names))
+        index = {name: i for i, name in enumerate(clusters)}
+        codes = np.fromiter((index[name] for name in names), dtype=np.intp, count=len(names))
+        k = len(clusters)
+
+        def grouped(values):
+            known = ~np.isnan(values)
+            count = np.bincount(codes[known], minlength=k)
+            total = np.bincount(codes[known], weights=values[known], minlength=k)
+            peak = np.full(k, -np.inf)
+            np.maximum.at(peak, codes[known], values[known])
+            return count, total, peak
+
+        watts_count, watts_total, watts_max = grouped(self.columns['watts'])
+        cpu_count, cpu_total, _ = grouped(self.columns['cpu_load'])
+        hosts = np.bincount(codes, minlength=k)
+        ok = np.bincount(codes, weights=[not e for e in self.columns['error']], minlength=k) if len(codes) else hosts
+
+        summary = []
+        for i, name in enumerate(clusters):
+            summary.append({
+                'cluster': name or "(none)",
+                'hosts': int(hosts[i]),
+                'ok': int(ok[i]),
+                'total_watts': float(watts_total[i]) if watts_count[i] else None,
+                'avg_watts': float(watts_total[i] / watts_count[i]) if watts_count[i] else None,
+                'max_watts': float(watts_max[i]) if watts_count[i] else None,
+                'avg_cpu': float(cpu_total[i] / cpu_count[i]) if cpu_count[i] else None,
+            })
+        return summary
+
+    def output_columns(self):
+        """Columns to write: all of STATUS_COLUMNS except optional ones no host has"""
+        return [name for name in STATUS_COLUMNS
+                if name not in OPTIONAL_COLUMNS or any(v is not None for v in self.columns[name])]
+
+    def to_dataframe(self):
+        pd = load_pandas()
+        names = self.output_columns()
+        return pd.DataFrame({name: self.columns[name] for name in names}, columns=names)
+
+    def to_csv(self, path):
+        self.to_dataframe().to_csv(path, index=False)
+        return path
+
+    def to_parquet(self, path):
+        """Write as Parquet (needs pyarrow or fastparquet)"""
+        self.to_dataframe().to_parquet(path, index=False)
+        return path
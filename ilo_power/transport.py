@@ -0,0 +1,122 @@
+"""
+Shared HTTPS transport for Redfish clients: pooled keep-alive connections and TLS session resumption
+
+Every redfish client normally builds its own requests.Session, so each login
+opens a new connection and pays a full TLS handshake - often longer than the
+request itself on iLO 4. RedfishSession mounts the adapter from get_adapter()
+instead, which keeps idle connections per iLO in one pool for the whole
+process (across sweeps and monitoring iterations) and offers the last TLS
+session of an iLO when a new connection has to be opened, so the iLO can
+resume it instead of doing a full handshake.
+"""
+
+import ssl
+import threading
+
+from requests.adapters import HTTPAdapter
+
+class ResumingSSLContext(ssl.SSLContext):
+    """Client SSLContext (no certificate verification, like the rest of ilo_power) that remembers the TLS
+    session of each peer and offers it on the next connection to that peer"""
+
+    def __new__(cls, protocol=ssl.PROTOCOL_TLS_CLIENT):
+        return super().__new__(cls, protocol)
+
+    def __init__(self, protocol=ssl.PROTOCOL_TLS_CLIENT):
+        self.check_hostname = False
+        self.verify_mode = ssl.CERT_NONE
+        self.sslsocket_class = _ResumableSocket
+        self.sessions = {}  # (ip, port) -> ssl.SSLSession
+        self.lock = threading.Lock()
+        self.handshakes = 0
+        self.resumed = 0
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        key = _peer(sock)
+        if key is not None and kwargs.get('session') is None:
+            with self.lock:
+                kwargs['session'] = self.sessions.get(key)
+        ssl_sock = super().wrap_socket(sock, *args, **kwargs)
+        with self.lock:
+            self.handshakes += 1
+            if ssl_sock.session_reused:
+                self.resumed += 1
+        self.remember(ssl_sock)
+        return ssl_sock
+
+    def remember(self, ssl_sock):
+        """Keep the session of ssl_sock for its peer if it can be resumed"""
+        try:
+            session = ssl_sock.session
+            key = _peer(ssl_sock)
+        except (OSError, ValueError):
+            return
+        if session is not None and key is not None and (session.has_ticket or session.id):
+            with self.lock:
+                self.sessions[key] = session
+
+class _ResumableSocket(ssl.SSLSocket):
+    def _real_close(self):
+        # TLS 1.3 tickets arrive after the handshake, so take the session again before it is gone
+        if self._sslobj is not None and isinstance(self.context, ResumingSSLContext):
+            self.context.remember(self)
+        super()._real_close()
+
+def _peer(sock):
+    try:
+        return tuple(sock.getpeername()[:2])
+    except (OSError, TypeError):
+        return None
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter shared by all redfish clients.
+
+    Args:
+        max_hosts (int): Number of iLOs whose idle connections are kept (least recently used are closed first)
+        per_host (int): Connections kept per iLO
+    """
+
+    def __init__(self, max_hosts=256, per_host=4):
+        self.ssl_context = ResumingSSLContext()
+        super().__init__(pool_connections=max_hosts, pool_maxsize=per_host, max_retries=0)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs['ssl_context'] = self.ssl_context
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    def close(self):
+        """Keep the pool when a redfish client closes its requests.Session on logout (see shutdown())"""
+
+    def shutdown(self):
+        """Close all pooled connections"""
+        super().close()
+
+    def stats(self):
+        """Return TLS handshake counters: handshakes, resumed and sessions (iLOs with a resumable session)"""
+        context = self.ssl_context
+        with context.lock:
+            return {'handshakes': context.handshakes, 'resumed': context.resumed, 'sessions': len(context.sessions)}
+
+_adapter = None
+_adapter_lock = threading.Lock()
+_enabled = True
+
+def get_adapter():
+    """Return the process-wide PooledAdapter, or None when connection reuse is disabled"""
+    global _adapter
+    if not _enabled:
+        return None
+    with _adapter_lock:
+        if _adapter is None:
+            _adapter = PooledAdapter()
+        return _adapter
+
+def configure(enabled=True, max_hosts=256, per_host=4):
+    """Enable/disable connection reuse and resize the pool (closes the current pool)"""
+    global _adapter, _enabled
+    with _adapter_lock:
+        if _adapter is not None:
+            _adapter.shutdown()
+        _adapter = PooledAdapter(max_hosts=max_hosts, per_host=per_host) if enabled else None
+        _enabled = enabled
+    return _adapter
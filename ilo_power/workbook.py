@@ -0,0 +1,418 @@
+"""
+Reading iLO systems straight from the master IP list workbook (its Cluster-NN-IP-Registry tabs)
+
+Shared by ilo_power (-f/--all-nodes with an .xlsx file) and excel/excel_to_csv.py,
+so the inventory no longer has to go through all-nodes.csv and the CSV column
+guessing of read_ilo_systems_from_csv. Each cluster tab is parsed once with
+openpyxl's read-only reader, in parallel worker processes. With a cache
+directory, parsed tabs are kept as frames keyed on a hash of the tab's cell
+values, and unchanged tabs are loaded from there instead of being parsed again.
+
+Needs openpyxl (pip install openpyxl).
+"""
+
+import hashlib
+import json
+import os
+import posixpath
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import compress, count
+from typing import Any, Optional
+from xml.etree import ElementTree
+
+from .deps import load_pandas
+from .inventory import add_sort_keys
+
+# Pattern for matching cluster tabs
+CLUSTER_SHEET_PATTERN = re.compile(r'Cluster-(\d+)-IP-Registry')
+
+# Names of the columns 1-8 below the header row
+COLUMN_NAMES = ['Device', 'Rack', 'Physical Hostname', 'ILo Hostname',
+                'Mgmt / ILO', 'Host IP', 'VIP', 'Serial Number']
+
+# iLO credentials of the cluster nodes (the workbook has none)
+DEFAULT_USERNAME = 'remote'
+DEFAULT_PASSWORD = 'hpeonly1'
+
+# Clusters that make up all-nodes.csv and the --all-nodes inventory
+ALL_NODES_MAX_CLUSTER = 13
+
+# Manifest of the per-tab cache (sheet content keys and cached frames).
+# Bump MANIFEST_VERSION when the parsing below changes, so cached frames are rebuilt.
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 2
+
+# Workbook parts that decide the cell values of a sheet besides the sheet itself
+# (text cells point into the shared strings, number formats tell dates from numbers)
+SHARED_STRINGS_PART = "xl/sharedStrings.xml"
+STYLES_PART = "xl/styles.xml"
+
+# Elements of the sheet and shared strings XML, matched on the raw bytes (much faster than parsing the XML).
+# Self-closing cells (formatted empty cells) are skipped: they have no value.
+CELL_PATTERN = re.compile(rb'<((?:\w+:)?c)\b([^>]*?)(?<!/)>(.*?)</\1>', re.S)
+SHARED_STRING_PATTERN = re.compile(rb'<(?:\w+:)?si\b[^>]*?(?:/>|>.*?</(?:\w+:)?si>)', re.S)
+CELL_REF_PATTERN = re.compile(rb'\br="([^"]*)"')
+CELL_TYPE_PATTERN = re.compile(rb'\bt="([^"]*)"')
+CELL_STYLE_PATTERN = re.compile(rb'\bs="(\d+)"')
+CELL_VALUE_PATTERN = re.compile(rb'<((?:\w+:)?v)>(\d+)</\1>')
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+PACKAGE_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+@dataclass
+class ClusterTab:
+    """One Cluster-NN-IP-Registry tab of the workbook and its device rows"""
+    sheet: str
+    number: str  # As written in the tab name, e.g. "01"
+    nodes: Optional[Any] = None  # DataFrame of COLUMN_NAMES plus username/password, None if the tab could not be read
+    message: Optional[str] = None  # Warning or error about the tab
+    cached: bool = False  # Loaded from the cache instead of parsed
+
+    @property
+    def name(self):
+        """Cluster name as used in all-nodes.csv, e.g. "Cluster-01" """
+        return f"Cluster-{self.number}"
+
+    @property
+    def in_all_nodes(self):
+        return int(self.number) <= ALL_NODES_MAX_CLUSTER
+
+# Workbook of a worker process, opened once by the pool initializer
+_workbook = None
+
+def open_workbook(excel_file):
+    """Open the workbook with openpyxl's streaming read-only reader (sheets are parsed on access)"""
+    from openpyxl import load_workbook
+    return load_workbook(excel_file, read_only=True, data_only=True)
+
+def _init_worker(excel_file):
+    global _workbook
+    _workbook = open_workbook(excel_file)
+
+def read_sheet(workbook, sheet_name):
+    """Read one sheet of an open workbook, parsing it only once.
+
+    The cluster tabs are formatted down to the last Excel row, so empty rows at the end of
+    the sheet (and empty cells at the end of a row) are dropped.
+
+    Args:
+        workbook (Workbook): Workbook from open_workbook()
+        sheet_name (str): Name of the sheet
+
+    Returns:
+        DataFrame: The cell values without a header (like pd.read_excel(..., header=None))
+    """
+    pd = load_pandas()
+    worksheet = workbook[sheet_name]
+    worksheet.reset_dimensions()  # Rows as long as their cells, not padded to the formatted range
+    rows = list(worksheet.iter_rows(values_only=True))
+
+    # Rows without cells (the gaps up to the last formatted row) come back as empty tuples; only the
+    # other rows can hold values, so just those few are looked at
+    filled = [i for i in compress(count(), map(len, rows)) if any(value is not None for value in rows[i])]
+    rows = rows[:filled[-1] + 1] if filled else []
+    for i in filled:
+        row = rows[i]
+        end = len(row)
+        while row[end - 1] is None:
+            end -= 1
+        rows[i] = row[:end]
+    return pd.DataFrame(rows)
+
+def find_header_row(df_raw):
+    """Find the header row (contains 'Device' in column 1, followed by 'Rack', etc.)
+
+    Returns:
+        int: Row index of the header, None if the sheet has none
+    """
+    if len(df_raw.columns) < 2:
+        return None
+    labels = df_raw[1].astype(str).str.strip()
+    matches = labels.index[labels == 'Device']
+    return matches[0] if len(matches) else None
+
+def extract_cluster_nodes(sheet_name, workbook=None):
+    """Parse one cluster tab into its node rows.
+
+    Args:
+        sheet_name (str): Name of the cluster tab
+        workbook (Workbook): Open workbook (default: the one of this worker process)
+
+    Returns:
+        tuple: (DataFrame of the device rows with username and password, or None; warning or error message, or None)
+    """
+    try:
+        df_raw = read_sheet(workbook or _workbook, sheet_name)
+        header_row = find_header_row(df_raw)
+        if header_row is None:
+            return None, f"Warning: Could not find header row in {sheet_name}"
+
+        # Take the rows after the header, using columns 1-7 or 1-8 depending on availability
+        end_col = min(9, len(df_raw.columns))
+        df = df_raw.iloc[header_row + 1:, 1:end_col].reset_index(drop=True).infer_objects()
+
+        # Set proper column names
+        df.columns = COLUMN_NAMES[:len(df.columns)]
+
+        # Keep only rows where Device column contains "Cohesity Cluster" (the actual device entries)
+        df_filtered = df[df['Device'].astype(str).str.contains('Cohesity Cluster', na=False)]
+
+        # Add username and password columns with default values
+        df_filtered = df_filtered.copy()  # Create a copy to avoid SettingWithCopyWarning
+        df_filtered['username'] = DEFAULT_USERNAME
+        df_filtered['password'] = DEFAULT_PASSWORD
+        return df_filtered, None
+
+    except Exception as e:
+        return None, f"Error processing {sheet_name}: {str(e)}"
+
+def _number_formats(archive, members):
+    """Number format of every cell style (cellXfs index -> format code, or the built-in format id)"""
+    if STYLES_PART not in members:
+        return []
+    styles = ElementTree.fromstring(archive.read(STYLES_PART))
+    codes = {fmt.get("numFmtId"): fmt.get("formatCode") for fmt in styles.iter(f"{MAIN_NS}numFmt")}
+    cell_xfs = styles.find(f"{MAIN_NS}cellXfs")
+    if cell_xfs is None:
+        return []
+    return [codes.get(xf.get("numFmtId", "0"), xf.get("numFmtId", "0")).encode()
+            for xf in cell_xfs.iter(f"{MAIN_NS}xf")]
+
+def _cell_values_digest(sheet_xml, shared_strings, number_formats):
+    """Hash the cells of a worksheet by their resolved values.
+
+    Shared string references are replaced by the strings and style indexes by the number formats,
+    so the digest does not depend on the numbering of the workbook-wide tables: Excel renumbers the
+    shared strings on save, which changes the XML of every sheet after an edited one.
+    """
+    digest = hashlib.sha256()
+    for match in CELL_PATTERN.finditer(sheet_xml):
+        attributes, content = match.group(2), match.group(3)
+        cell_type = CELL_TYPE_PATTERN.search(attributes)
+        if cell_type and cell_type.group(1) == b"s":
+            value = CELL_VALUE_PATTERN.search(content)
+            index = int(value.group(2)) if value else -1
+            content = shared_strings[index] if 0 <= index < len(shared_strings) else content
+        ref = CELL_REF_PATTERN.search(attributes)
+        style = CELL_STYLE_PATTERN.search(attributes)
+        index = int(style.group(1)) if style else 0
+        number_format = number_formats[index] if index < len(number_formats) else b""
+        for field in (ref.group(1) if ref else b"", cell_type.group(1) if cell_type else b"", number_format, content):
+            digest.update(len(field).to_bytes(4, "big"))
+            digest.update(field)
+    return digest.hexdigest()
+
+def sheet_content_keys(excel_file, sheet_names):
+    """Hash the cell values of sheets straight from the .xlsx archive, without parsing them with openpyxl.
+
+    The key of a sheet covers the reference, type, number format and value of each of its cells, with
+    shared strings resolved (see _cell_values_digest). It changes whenever a value read from the sheet
+    can have changed, and only then: edits in other sheets leave it alone.
+
+    Args:
+        excel_file (str): Path to the Excel file
+        sheet_names (list): Sheets to hash
+
+    Returns:
+        dict: Sheet name -> hex digest (None if the sheet's part could not be found)
+    """
+    with zipfile.ZipFile(excel_file) as archive:
+        members = set(archive.namelist())
+        workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+        rels = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(PACKAGE_REL)}
+        parts = {}
+        for sheet in workbook.iter(f"{MAIN_NS}sheet"):
+            target = targets.get(sheet.get(REL_ID))
+            if target:
+                parts[sheet.get("name")] = target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+
+        shared_strings = []
+        if SHARED_STRINGS_PART in members:
+            shared_strings = SHARED_STRING_PATTERN.findall(archive.read(SHARED_STRINGS_PART))
+        number_formats = _number_formats(archive, members)
+
+        keys = {}
+        for sheet_name in sheet_names:
+            part = parts.get(sheet_name)
+            if part not in members:
+                keys[sheet_name] = None
+                continue
+            keys[sheet_name] = _cell_values_digest(archive.read(part), shared_strings, number_formats)
+    return keys
+
+def load_manifest(cache_dir):
+    """Return the cache manifest of cache_dir (empty if missing, unreadable or from another version)"""
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "sheets": {}}
+    if manifest.get("version") != MANIFEST_VERSION or not isinstance(manifest.get("sheets"), dict):
+        return {"version": MANIFEST_VERSION, "sheets": {}}
+    return manifest
+
+def save_manifest(cache_dir, manifest):
+    write_if_changed(os.path.join(cache_dir, MANIFEST_FILE), json.dumps(manifest, indent=2, sort_keys=True).encode())
+
+def save_frame(df, path_base):
+    """Cache a frame as Parquet, or as a pickle if no Parquet engine is installed or the columns have mixed types.
+
+    Returns:
+        str: File name of the cached frame (relative to its directory)
+    """
+    try:
+        df.to_parquet(f"{path_base}.parquet", index=False)
+        return os.path.basename(f"{path_base}.parquet")
+    except (ImportError, ValueError, TypeError):
+        df.to_pickle(f"{path_base}.pkl")
+        return os.path.basename(f"{path_base}.pkl")
+
+def load_frame(path):
+    """Load a frame cached by save_frame, None if it is missing or unreadable"""
+    pd = load_pandas()
+    try:
+        return pd.read_parquet(path) if path.endswith(".parquet") else pd.read_pickle(path)
+    except Exception:
+        return None
+
+def write_if_changed(path, data):
+    """Write bytes to path unless the file already has exactly this content.
+
+    The file is replaced atomically, so readers never see a partial file.
+
+    Returns:
+        bool: True if the file was written
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+    return True
+
+def load_cluster_tabs(excel_file, cache_dir=None, workers=None):
+    """Read every Cluster-NN-IP-Registry tab of the workbook, in tab order.
+
+    Tabs whose content hash matches the manifest in cache_dir are loaded from the cached frames;
+    the others are parsed once each, in parallel worker processes, and cached.
+
+    Args:
+        excel_file (str): Path to the Excel file
+        cache_dir (str): Directory of the manifest and cached frames, None to parse every tab without caching
+        workers (int): Number of worker processes (default: one per CPU, 1 = parse in this process)
+
+    Returns:
+        list: ClusterTab per cluster tab
+    """
+    manifest = {"version": MANIFEST_VERSION, "sheets": {}}
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        manifest = load_manifest(cache_dir)
+
+    workbook = open_workbook(excel_file)
+    try:
+        # Cluster tabs and their numbers (the read-only reader does not parse the sheets for this)
+        tabs = []
+        for sheet_name in workbook.sheetnames:
+            match = CLUSTER_SHEET_PATTERN.match(sheet_name)
+            if match:
+                tabs.append(ClusterTab(sheet_name, match.group(1)))
+
+        # Take unchanged tabs from the cache
+        keys = sheet_content_keys(excel_file, [tab.sheet for tab in tabs]) if cache_dir else {}
+        for tab in tabs:
+            entry = manifest["sheets"].get(tab.sheet, {})
+            if keys.get(tab.sheet) is not None and entry.get("key") == keys[tab.sheet]:
+                tab.nodes = load_frame(os.path.join(cache_dir, entry.get("frame", "")))
+                tab.cached = tab.nodes is not None
+
+        # Parse the changed tabs in parallel, each worker process opening the workbook once
+        changed = [tab for tab in tabs if not tab.cached]
+        names = [tab.sheet for tab in changed]
+        workers = min(len(names), workers or os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(excel_file,)) as executor:
+                results = list(executor.map(extract_cluster_nodes, names))
+        else:
+            results = [extract_cluster_nodes(sheet_name, workbook) for sheet_name in names]
+    finally:
+        workbook.close()
+    for tab, (nodes, message) in zip(changed, results):
+        tab.nodes, tab.message = nodes, message
+
+    if cache_dir:
+        sheets = {}
+        for tab in tabs:
+            if tab.cached:
+                sheets[tab.sheet] = manifest["sheets"][tab.sheet]
+            elif tab.nodes is not None and keys.get(tab.sheet) is not None:
+                frame = save_frame(tab.nodes, os.path.join(cache_dir, f"cluster-{tab.number.zfill(2)}"))
+                sheets[tab.sheet] = {"key": keys[tab.sheet], "frame": frame}
+        manifest["sheets"] = sheets
+        save_manifest(cache_dir, manifest)
+    return tabs
+
+def systems_from_tabs(tabs):
+    """Build ilo_power system dicts (ip, username, password, cluster, device) from the all-nodes cluster tabs.
+
+    Gives the same systems as reading all-nodes.csv with read_ilo_systems_from_csv.
+    """
+    systems = []
+    for tab in tabs:
+        if tab.nodes is None or not tab.in_all_nodes or 'Mgmt / ILO' not in tab.nodes.columns:
+            continue
+        nodes = tab.nodes
+        for ip, username, password, device in zip(nodes['Mgmt / ILO'], nodes['username'], nodes['password'],
+                                                  nodes['Device']):
+            system = {'ip': _text(ip), 'username': _text(username), 'password': _text(password),
+                      'cluster': tab.name, 'device': _text(device)}
+            if system['ip'] and system['username'] and system['password']:
+                systems.append({field: value for field, value in system.items() if value})
+    return add_sort_keys(systems)
+
+def _text(value):
+    """Cell value as stripped text, "" for empty cells"""
+    if value is None or value != value:  # None or NaN
+        return ""
+    return str(value).strip()
+
+def read_ilo_systems_from_workbook(excel_file, cache_dir=None, workers=None, debug=False):
+    """Read the iLO systems of the all-nodes clusters straight from the master IP list workbook.
+
+    Args:
+        excel_file (str): Path to the .xlsx workbook
+        cache_dir (str): Cache of parsed tabs (see load_cluster_tabs), None to parse every tab
+        workers (int): Worker processes for parsing changed tabs
+        debug (bool): Print per-tab information
+
+    Returns:
+        list: System dicts like read_ilo_systems_from_csv returns for all-nodes.csv
+    """
+    try:
+        tabs = load_cluster_tabs(excel_file, cache_dir, workers)
+    except Exception as e:
+        print(f"Error reading workbook: {e}")
+        return []
+    for tab in tabs:
+        if tab.message:
+            print(tab.message)
+        if debug:
+            rows = len(tab.nodes) if tab.nodes is not None else 0
+            print(f"DEBUG: {tab.sheet}: {rows} nodes ({'cache' if tab.cached else 'parsed'})")
+    systems = systems_from_tabs(tabs)
+    if systems:
+        parsed = sum(1 for tab in tabs if not tab.cached)
+        print(f"Loaded {len(systems)} iLO systems from workbook ({parsed} of {len(tabs)} cluster tabs parsed).")
+    else:
+        print("No valid systems found in the workbook.")
+    return systems
@@ -9,14 +9,22 @@ setup(
     author="Cohesity Admin",
     author_email="admin@example.com",
     py_modules=["cohesity_manager"],
+    packages=find_packages(include=["ilo_power", "ilo_power.*"]),
     install_requires=[
         "cohesity_sdk>=1.3.0",
         "pandas>=1.0.0",
         "numpy>=1.20.0",
+        "redfish>=3.0.0,<4",  # ilo_power.collectors shares a logged-in client between threads (see get_collection_members)
+        'dataclasses; python_version < "3.7"',
     ],
+    extras_require={
+        'fast': ["orjson>=3.6.0"],
+        'excel': ["openpyxl>=3.0.0"],
+    },
     entry_points={
         'console_scripts': [
             'cohesity-manager=cohesity_manager:main',
+            'ilo-power=ilo_power.cli:main',
         ],
     },
     classifiers=[